@@ -9,41 +9,121 @@ This script provides a graphical interface for the tool, allowing users to:
 5. Shortlist properties and add notes
 """
 
+import io
 import re
+import bisect
+import functools
 import os
 import json
 import logging
+import uuid
+import numpy as np
 import streamlit as st
 import pandas as pd
 
 from src.real_estate_deal_finder import config
 from src.real_estate_deal_finder import logging_config
-from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator
 from src.real_estate_deal_finder.calculations import (
-    calculate_monthly_mortgage,
-    calculate_cash_flow,
-    calculate_coc_return
+    calculate_monthly_mortgage_vec,
+    calculate_cash_flow_vec,
+    calculate_coc_return_vec
 )
 
 # Constants
 SHORTLIST_FILE = "data/shortlist.json"
 
+# Prefix of the identifiers given to shortlist items saved without a link
+LOCAL_LINK_PREFIX = "local-"
+
+# A ZIP code is a comma/newline-separated token of exactly five digits,
+# optionally padded with whitespace. Comment tokens ('#...') never match.
+ZIP_CODE_PATTERN = re.compile(r'(?:^|[,\n])\s*(\d{5})\s*(?=[,\n]|$)')
+
+# Results grid: orchestrator column names -> display names
+COLUMN_MAPPING = {
+    'address': 'Address',
+    'price': 'Price',
+    'bedrooms': 'Beds',
+    'bathrooms': 'Baths',
+    'sqft': 'Sq Ft',
+    'year_built': 'Year Built',
+    'property_type': 'Type',
+    'estimated_rent': 'Est. Rent',
+    'estimated_mortgage': 'Est. Mortgage',
+    'monthly_expenses': 'Monthly Expenses',
+    'estimated_monthly_cash_flow': 'Monthly Cash Flow',
+    'estimated_annual_cash_flow': 'Annual Cash Flow',
+    'estimated_coc_return': 'CoC Return %',
+    'zip_code': 'ZIP Code',
+    'zillow_url': 'Zillow Link'
+}
+
+# Results grid: display columns and their order
+DISPLAY_COLUMNS = [
+    'Select', 'Address', 'ZIP Code', 'Price', 'Beds', 'Baths', 'Sq Ft',
+    'Est. Rent', 'Est. Mortgage', 'Monthly Expenses', 'Monthly Cash Flow',
+    'CoC Return %', 'Type', 'Year Built', 'Zillow Link'
+]
+
+CURRENCY_COLUMNS = frozenset({
+    'Price', 'Est. Rent', 'Est. Mortgage', 'Monthly Expenses',
+    'Monthly Cash Flow', 'Annual Cash Flow'
+})
+PERCENT_COLUMNS = frozenset({'CoC Return %'})
+
+# Shortlists at least this long are shown as one table rather than one
+# expander (and its widgets) per property
+SHORTLIST_TABLE_THRESHOLD = 20
+
+# Shortlist table: display name -> raw orchestrator key, for items saved
+# under either naming
+SHORTLIST_TABLE_COLUMNS = {
+    'Address': 'address',
+    'Price': 'price',
+    'Beds': 'bedrooms',
+    'Baths': 'bathrooms',
+    'Est. Rent': 'estimated_rent',
+    'Est. Mortgage': 'estimated_mortgage',
+    'Monthly Cash Flow': 'estimated_monthly_cash_flow',
+    'CoC Return %': 'estimated_coc_return',
+    'Zillow Link': 'zillow_url'
+}
+
+# Shortlist table: compact dtypes for its numeric and address columns.
+# Bedroom counts are integers (the orchestrator validates them); baths can be
+# fractional. float32 keeps cents exact below ~$100k and whole dollars up to
+# ~$16M, which covers listing prices and all monthly figures.
+SHORTLIST_TABLE_DTYPES = {
+    'Address': 'string[pyarrow]',
+    'Price': 'Float32',
+    'Beds': 'Int8',
+    'Baths': 'Float32',
+    'Est. Rent': 'Float32',
+    'Est. Mortgage': 'Float32',
+    'Monthly Cash Flow': 'Float32',
+    'CoC Return %': 'Float32'
+}
+
 # Shortlist functions
+@st.cache_data(show_spinner=False)
 def load_shortlist():
     """
     Load the shortlist from the JSON file.
     
+    The parsed file is cached across sessions and reruns; each caller gets
+    its own copy. save_shortlist() invalidates the cache after every write.
+    
     Returns:
         List of dictionaries containing shortlisted properties
     """
     try:
         if os.path.exists(SHORTLIST_FILE):
-            with open(SHORTLIST_FILE, "r") as f:
-                return json.load(f)
+            with open(SHORTLIST_FILE, "rb") as f:
+                return json.loads(f.read())
         return []
     except FileNotFoundError:
         return []
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         st.error(f"Error loading shortlist: {e}")
         return []
 
@@ -51,20 +131,412 @@ def save_shortlist(shortlist_data):
     """
     Save the shortlist to the JSON file.
     
+    Keys starting with '_' are render caches kept on the items in memory
+    and are not written; they are rebuilt when the items are displayed.
+    
     Args:
         shortlist_data: List of dictionaries containing shortlisted properties
     """
+    temp_file = f"{SHORTLIST_FILE}.tmp"
     try:
         os.makedirs(os.path.dirname(SHORTLIST_FILE), exist_ok=True)
-        with open(SHORTLIST_FILE, "w") as f:
-            json.dump(shortlist_data, f, indent=4)
-    except IOError as e:
+        # Serialize in one shot without indentation so the C encoder is used,
+        # then write the bytes to a temporary file and swap it in, so a crash
+        # mid-write never leaves a truncated shortlist behind
+        saved_items = [
+            {key: value for key, value in item.items() if not key.startswith("_")}
+            for item in shortlist_data
+        ]
+        payload = json.dumps(saved_items).encode("utf-8")
+        with open(temp_file, "wb") as f:
+            f.write(payload)
+        os.replace(temp_file, SHORTLIST_FILE)
+        load_shortlist.clear()
+    except (IOError, TypeError, ValueError) as e:
         st.error(f"Error saving shortlist: {e}")
 
+def address_search_key(item: dict) -> str:
+    """
+    Get the lowercased address used to search a shortlist item.
+    
+    The value is cached on the item under '_address_lc' the first time it is
+    needed, so each address is lowercased once rather than on every rerun.
+    
+    Args:
+        item: Shortlisted property dictionary
+        
+    Returns:
+        Lowercased address string
+    """
+    search_key = item.get('_address_lc')
+    if search_key is None:
+        search_key = str(item.get('Address', item.get('address', ''))).lower()
+        item['_address_lc'] = search_key
+    return search_key
+
+def ensure_shortlist_link(item: dict) -> str:
+    """
+    Get the link identifying a shortlist item, synthesizing one if it is missing.
+    
+    The link keys the item's widgets, so it must not depend on the item's
+    position in the rendered list; items saved without one get a random
+    local identifier that is stored on the item and persisted with it.
+    
+    Args:
+        item: Shortlisted property dictionary
+        
+    Returns:
+        The item's link
+    """
+    link = item.get('link')
+    if not link:
+        link = f"{LOCAL_LINK_PREFIX}{uuid.uuid4().hex}"
+        item['link'] = link
+    return link
+
+def mark_shortlist_changed() -> None:
+    """
+    Flag the shortlist to be saved at the end of the run.
+    
+    Also bumps the shortlist version so views derived from the shortlist
+    (see shortlist_frame) are rebuilt on their next use.
+    """
+    st.session_state.shortlist_dirty = True
+    st.session_state.shortlist_version = st.session_state.get('shortlist_version', 0) + 1
+
+def shortlist_frame() -> pd.DataFrame:
+    """
+    Get a columnar view of the shortlist for sorting.
+    
+    Row i describes st.session_state.shortlist[i]. The frame is cached in
+    session state and rebuilt only after mark_shortlist_changed().
+    
+    Returns:
+        DataFrame with float32 price, cash flow and CoC return columns
+        (NaN where missing or non-numeric)
+    """
+    shortlist = st.session_state.shortlist
+    # The length guards against the list being replaced without a version bump
+    version = (st.session_state.get('shortlist_version', 0), len(shortlist))
+    if st.session_state.get('shortlist_frame_version') != version:
+        
+        def numeric_column(display_key, raw_key):
+            values = [item.get(display_key, item.get(raw_key)) for item in shortlist]
+            return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype(np.float32)
+        
+        st.session_state.shortlist_frame = pd.DataFrame({
+            'price': numeric_column('Price', 'price'),
+            'estimated_monthly_cash_flow': numeric_column('Monthly Cash Flow', 'estimated_monthly_cash_flow'),
+            'estimated_coc_return': numeric_column('CoC Return %', 'estimated_coc_return')
+        })
+        st.session_state.shortlist_frame_version = version
+    return st.session_state.shortlist_frame
+
+def shortlist_search_mask(search_lc: str) -> np.ndarray:
+    """
+    Find the shortlist items whose address contains a search term.
+    
+    All lowercased addresses are joined into one NUL-separated string, cached
+    per shortlist version, so a search is a few str.find calls over one
+    buffer rather than a containment test per item.
+    
+    Args:
+        search_lc: Lowercased, non-empty search term
+        
+    Returns:
+        Boolean array with one entry per shortlist item
+    """
+    shortlist = st.session_state.shortlist
+    version = (st.session_state.get('shortlist_version', 0), len(shortlist))
+    if st.session_state.get('shortlist_buffer_version') != version:
+        starts = []
+        offset = 0
+        addresses = []
+        for item in shortlist:
+            address = address_search_key(item)
+            starts.append(offset)
+            addresses.append(address)
+            offset += len(address) + 1
+        st.session_state.shortlist_buffer = ("\x00".join(addresses), starts)
+        st.session_state.shortlist_buffer_version = version
+    
+    buffer, starts = st.session_state.shortlist_buffer
+    mask = np.zeros(len(starts), dtype=bool)
+    pos = buffer.find(search_lc)
+    while pos != -1:
+        item_index = bisect.bisect_right(starts, pos) - 1
+        mask[item_index] = True
+        # One match per item is enough; resume the scan at the next item
+        if item_index + 1 == len(starts):
+            break
+        pos = buffer.find(search_lc, starts[item_index + 1])
+    return mask
+
+def shortlist_order(search_lc: str, column: str) -> np.ndarray:
+    """
+    Get the positions of shortlist items matching a search, highest value first.
+    
+    The full sorted order for each column is cached in session state until
+    the shortlist changes. An empty search returns that cached order as is;
+    a search only masks it, which keeps the order without sorting again.
+    
+    Args:
+        search_lc: Lowercased search term; empty matches every item
+        column: Numeric shortlist_frame column to sort by
+        
+    Returns:
+        Array of indices into st.session_state.shortlist
+    """
+    frame = shortlist_frame()
+    version = st.session_state.shortlist_frame_version
+    if st.session_state.get('shortlist_orders_version') != version:
+        st.session_state.shortlist_orders = {}
+        st.session_state.shortlist_search_mask = (None, None)
+        st.session_state.shortlist_orders_version = version
+    
+    orders = st.session_state.shortlist_orders
+    if column not in orders:
+        # Stable argsort of the negated column keeps ties in shortlist order
+        # and puts missing (NaN) values last
+        orders[column] = np.argsort(-frame[column].to_numpy(), kind='stable')
+    order = orders[column]
+    
+    if not search_lc:
+        return order
+    
+    # Only the current search's match mask is kept
+    cached_search, mask = st.session_state.shortlist_search_mask
+    if cached_search != search_lc:
+        mask = shortlist_search_mask(search_lc)
+        st.session_state.shortlist_search_mask = (search_lc, mask)
+    return order[mask[order]]
+
+def shortlist_index() -> dict:
+    """
+    Get a mapping from each shortlisted link to its position in the shortlist.
+    
+    Like shortlist_frame, the mapping is cached in session state and rebuilt
+    only after mark_shortlist_changed().
+    
+    Returns:
+        Dictionary of link -> index into st.session_state.shortlist
+    """
+    shortlist = st.session_state.shortlist
+    version = (st.session_state.get('shortlist_version', 0), len(shortlist))
+    if st.session_state.get('shortlist_index_version') != version:
+        st.session_state.shortlist_index = {item.get('link'): i for i, item in enumerate(shortlist)}
+        st.session_state.shortlist_index_version = version
+    return st.session_state.shortlist_index
+
+def remove_from_shortlist(link) -> None:
+    """
+    Remove the shortlisted property with the given link, if present.
+    
+    Args:
+        link: Zillow link identifying the property
+    """
+    index = shortlist_index().get(link)
+    if index is not None:
+        st.session_state.shortlist.pop(index)
+        st.session_state.shortlist_links.discard(link)
+        mark_shortlist_changed()
+
+def update_shortlist_note(link, note: str) -> None:
+    """
+    Update the notes of the shortlisted property with the given link.
+    
+    Args:
+        link: Zillow link identifying the property
+        note: New notes text
+    """
+    index = shortlist_index().get(link)
+    if index is not None:
+        st.session_state.shortlist[index]['notes'] = note
+        # Notes do not affect sorting or search, so rather than bumping the
+        # version, patch the one cached view that shows them. A table built
+        # for an older shortlist is left for cached_shortlist_table() to rebuild.
+        version = (st.session_state.get('shortlist_version', 0), len(st.session_state.shortlist))
+        if st.session_state.get('shortlist_table_version') == version:
+            table = st.session_state.shortlist_table_df
+            table.iat[index, table.columns.get_loc('Notes')] = note
+        st.session_state.shortlist_dirty = True
+
+def on_note_change(link, note_key: str) -> None:
+    """
+    Widget callback that stores an edited notes text area on its property.
+    
+    Args:
+        link: Zillow link identifying the property
+        note_key: Session state key of the notes text area
+    """
+    update_shortlist_note(link, st.session_state[note_key])
+
+def shortlist_display_fields(item: dict) -> dict:
+    """
+    Get the formatted values shown on a shortlisted property's card.
+    
+    Shortlisted items are snapshots that never change after they are added,
+    so the strings are computed once and cached on the item under '_fmt'.
+    
+    Args:
+        item: Shortlisted property dictionary
+        
+    Returns:
+        Dictionary of display strings keyed by field
+    """
+    fmt = item.get('_fmt')
+    if fmt is None:
+        # Get raw values for bedrooms and bathrooms
+        beds = item.get('Beds', item.get('bedrooms', 'N/A'))
+        baths = item.get('Baths', item.get('bathrooms', 'N/A'))
+        
+        # Get and format financial values
+        fmt = {
+            'beds': beds,
+            'baths': baths,
+            'price': format_card_currency(item.get('Price', item.get('price', 'Unknown'))),
+            'rent': format_card_currency(item.get('Est. Rent', item.get('estimated_rent', 'N/A'))),
+            'mortgage': format_card_currency(item.get('Est. Mortgage', item.get('estimated_mortgage', 'N/A'))),
+            'cash_flow': format_card_currency(item.get('Monthly Cash Flow', item.get('estimated_monthly_cash_flow', 'N/A'))),
+            'coc': format_card_percentage(item.get('CoC Return %', item.get('estimated_coc_return', 'N/A')))
+        }
+        item['_fmt'] = fmt
+    return fmt
+
+def shortlist_table(items: list) -> pd.DataFrame:
+    """
+    Build the table view of shortlisted properties.
+    
+    Money and percentage columns stay numeric so the table widget formats
+    them client-side, and all columns use the compact SHORTLIST_TABLE_DTYPES.
+    
+    Args:
+        items: Shortlisted property dictionaries, in display order
+        
+    Returns:
+        DataFrame with one row per item and SHORTLIST_TABLE_COLUMNS plus notes
+    """
+    table = pd.DataFrame({
+        display_key: [item.get(display_key, item.get(raw_key)) for item in items]
+        for display_key, raw_key in SHORTLIST_TABLE_COLUMNS.items()
+    })
+    for col, dtype in SHORTLIST_TABLE_DTYPES.items():
+        if dtype == 'string[pyarrow]':
+            table[col] = table[col].astype(dtype)
+        else:
+            table[col] = pd.to_numeric(table[col], errors='coerce').astype(dtype)
+    table['Zillow Link'] = table['Zillow Link'].fillna(pd.Series([
+        item.get('link') if not str(item.get('link', '')).startswith(LOCAL_LINK_PREFIX) else None
+        for item in items
+    ]))
+    table['Notes'] = [item.get('notes', '') for item in items]
+    return table
+
+def cached_shortlist_table() -> pd.DataFrame:
+    """
+    Get the table view of the whole shortlist, in shortlist order.
+    
+    The table is cached in session state and rebuilt only after
+    mark_shortlist_changed(), so reruns caused by unrelated widgets reuse it;
+    a sorted or filtered view is a row selection on the cached table.
+    
+    Returns:
+        DataFrame as built by shortlist_table, row i describing
+        st.session_state.shortlist[i]
+    """
+    shortlist = st.session_state.shortlist
+    version = (st.session_state.get('shortlist_version', 0), len(shortlist))
+    if st.session_state.get('shortlist_table_version') != version:
+        st.session_state.shortlist_table_df = shortlist_table(shortlist)
+        st.session_state.shortlist_table_version = version
+    return st.session_state.shortlist_table_df
+
+def render_property_card(item: dict, index: int, expanded: bool = False) -> None:
+    """
+    Render one shortlisted property as an expander with details, a remove
+    button and a notes box.
+    
+    Args:
+        item: Shortlisted property dictionary
+        index: Position of the item in the rendered list, used for the
+            fallback title when the item has no address
+        expanded: Whether the expander starts open
+    """
+    # Formatted values are computed once per item and cached on it
+    fmt = shortlist_display_fields(item)
+    
+    # Widget keys use the item's link so widget state survives re-sorting
+    link = ensure_shortlist_link(item)
+    
+    # Create a detailed title for the expander
+    address = item.get('Address', item.get('address', f'Property {index+1}'))
+    expander_title = f"{address} - {fmt['price']}"
+    
+    with st.expander(expander_title, expanded=expanded):
+        # Create two columns for layout
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            # Display key property details
+            st.markdown("**Property Details:**")
+            
+            # Display the details
+            st.markdown(f"**Beds/Baths:** {fmt['beds']}/{fmt['baths']}")
+            st.markdown(f"**Monthly Rent:** {fmt['rent']}")
+            st.markdown(f"**Monthly Mortgage:** {fmt['mortgage']}")
+            st.markdown(f"**Monthly Cash Flow:** {fmt['cash_flow']}")
+            st.markdown(f"**Cash-on-Cash Return:** {fmt['coc']}")
+        
+        with col2:
+            # Display Zillow link
+            zillow_link = item.get('Zillow Link', item.get('zillow_url', item.get('link', '#')))
+            if zillow_link and zillow_link != '#' and not zillow_link.startswith(LOCAL_LINK_PREFIX):
+                st.markdown(f"[View on Zillow]({zillow_link})")
+            
+            # Create a unique key for each property's remove button
+            remove_key = f"remove_{link}"
+            
+            # Add remove button; the callback runs before the rerun it triggers,
+            # so the removed card is never drawn and no second rerun is needed
+            st.button(
+                "Remove from Shortlist",
+                key=remove_key,
+                on_click=remove_from_shortlist,
+                args=(link,)
+            )
+        
+        # Notes section (full width)
+        st.markdown("**Notes:**")
+        
+        # Create a unique key for each property's notes
+        note_key = f"note_{link}"
+        
+        # Get current notes
+        current_note = item.get('notes', '')
+        
+        # Create the notes text area; edits are saved by its callback
+        st.text_area(
+            "Add your notes here:",
+            value=current_note,
+            key=note_key,
+            height=100,
+            label_visibility="collapsed",
+            on_change=on_note_change,
+            args=(link, note_key)
+        )
+
 # Initialize shortlist in session state
 if 'shortlist' not in st.session_state:
     st.session_state.shortlist = load_shortlist()
 
+# Links of shortlisted properties, for constant-time duplicate checks;
+# items saved without a link get a stable one here
+if 'shortlist_links' not in st.session_state:
+    missing_links = [item for item in st.session_state.shortlist if not item.get('link')]
+    st.session_state.shortlist_links = {ensure_shortlist_link(item) for item in st.session_state.shortlist}
+    if missing_links:
+        st.session_state.shortlist_dirty = True
+
 
 # Set up logging
 logging_config.setup_logging()
@@ -82,24 +554,26 @@ def parse_zip_codes(zip_input: str) -> list:
     Returns:
         List of valid 5-digit ZIP codes
     """
-    # Split by both commas and newlines
-    raw_zips = re.split(r'[,\n]', zip_input)
-    
-    # Clean and validate ZIP codes
-    valid_zips = []
-    zip_pattern = re.compile(r'^\d{5}$')
-    
-    for zip_code in raw_zips:
-        # Remove whitespace and skip empty strings
-        zip_code = zip_code.strip()
-        if not zip_code or zip_code.startswith('#'):
-            continue
-            
-        # Validate format (5 digits)
-        if zip_pattern.match(zip_code):
-            valid_zips.append(zip_code)
-            
-    return valid_zips
+    return ZIP_CODE_PATTERN.findall(zip_input)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_candidate_properties(zip_codes: tuple) -> list:
+    """
+    Fetch listings and rent estimates for a set of ZIP codes, cached for an hour.
+    
+    Only the network-bound step is cached; financial assumptions and filter
+    criteria are applied afterwards, so changing them never refetches data.
+    
+    Args:
+        zip_codes: Tuple of ZIP codes (hashable cache key)
+        
+    Returns:
+        List of candidate property dictionaries with rent estimates
+    """
+    from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator
+    
+    return RealEstateOrchestrator().fetch_candidate_properties(list(zip_codes))
 
 
 @st.cache_data
@@ -111,9 +585,12 @@ def convert_df_to_csv(df):
         df: Pandas DataFrame to convert
         
     Returns:
-        CSV string encoded as UTF-8
+        CSV bytes encoded as UTF-8
     """
-    return df.to_csv(index=False).encode('utf-8')
+    # Write straight into a bytes buffer to avoid building an intermediate str
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
 
 
 def format_currency(value):
@@ -130,6 +607,82 @@ def format_percentage(value):
     return f"{value:.2f}%"
 
 
+@functools.lru_cache(maxsize=4096)
+def format_card_currency(value):
+    """Format a shortlist card value as currency, passing strings and empty values through."""
+    return f"${value:,.2f}" if value and not isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=4096)
+def format_card_percentage(value):
+    """Format a shortlist card value as percentage, passing strings and empty values through."""
+    return f"{value:.2f}%" if value and not isinstance(value, str) else value
+
+
+def results_to_df(results: list) -> pd.DataFrame:
+    """
+    Build a DataFrame from orchestrator results with compact column dtypes.
+    
+    Low-cardinality text columns are stored as categoricals and the year
+    built as a nullable small integer, which keeps the frames held in
+    session state small.
+    
+    Args:
+        results: Property records from the orchestrator
+        
+    Returns:
+        DataFrame of the results
+    """
+    df = pd.DataFrame(results)
+    for col in ('property_type', 'zip_code'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'year_built' in df.columns:
+        df['year_built'] = pd.to_numeric(df['year_built'], errors='coerce').astype('Int16')
+    return df
+
+
+def prepare_display_df(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the results-grid DataFrame from raw orchestrator results.
+    
+    Adds the 'Select' checkbox column, keeps the Zillow URL in a 'link'
+    column for shortlist identity, and renames columns to display names.
+    
+    Args:
+        results_df: DataFrame of property results with orchestrator column names
+        
+    Returns:
+        New DataFrame ready for display in the data editor
+    """
+    # rename() returns a new frame and ignores columns that are not present
+    display_df = results_df.rename(columns=COLUMN_MAPPING)
+    display_df.insert(0, "Select", False)
+    
+    # Keep the original zillow_url for shortlist functionality
+    display_df['link'] = results_df['zillow_url'] if 'zillow_url' in results_df.columns else None
+    
+    return display_df
+
+
+def style_display_df(df: pd.DataFrame):
+    """
+    Apply currency and percentage display formatting to a results DataFrame.
+    
+    The underlying columns stay numeric, so sorting in the grid and reading
+    selected rows keep working on the raw values.
+    
+    Args:
+        df: DataFrame with display column names
+        
+    Returns:
+        pandas Styler with the display formats applied
+    """
+    formatters = {col: "${:,.2f}" for col in CURRENCY_COLUMNS if col in df.columns}
+    formatters.update({col: "{:.2f}%" for col in PERCENT_COLUMNS if col in df.columns})
+    return df.style.format(formatters, na_rep="N/A")
+
+
 def recalculate_metrics(df: pd.DataFrame, config_overrides: dict) -> pd.DataFrame:
     """
     Recalculate financial metrics based on updated config values.
@@ -141,9 +694,6 @@ def recalculate_metrics(df: pd.DataFrame, config_overrides: dict) -> pd.DataFram
     Returns:
         DataFrame with recalculated metrics
     """
-    # Create a copy to avoid modifying the original
-    recalc_df = df.copy()
-    
     # Extract configuration values
     interest_rate = config_overrides.get('interest_rate_decimal', 0.075)
     down_payment_percent = config_overrides.get('down_payment_percent', 0.20)
@@ -151,57 +701,28 @@ def recalculate_metrics(df: pd.DataFrame, config_overrides: dict) -> pd.DataFram
     monthly_expenses = config_overrides.get('monthly_expenses', 0.0)
     rent_adjustment_percent = config_overrides.get('rent_adjustment_percent', 0.0)
     
-    # Function to recalculate mortgage for each row
-    def recalc_mortgage(row):
-        if pd.isna(row.get('price')):
-            return None
-        return calculate_monthly_mortgage(
-            row['price'], 
-            down_payment_percent, 
-            interest_rate, 
-            loan_term_years
-        )
+    price = df['price'].to_numpy(dtype=float)
+    rent = df['estimated_rent'].to_numpy(dtype=float)
     
-    # Recalculate mortgage payments
-    recalc_df['estimated_mortgage'] = recalc_df.apply(recalc_mortgage, axis=1)
+    mortgage = calculate_monthly_mortgage_vec(price, down_payment_percent, interest_rate, loan_term_years)
     
-    # Adjust rent if needed
-    if rent_adjustment_percent != 0:
-        recalc_df['adjusted_rent'] = recalc_df['estimated_rent'] * (1 + rent_adjustment_percent / 100)
+    # Adjust rent; with no adjustment (the common case) use the column as is
+    if rent_adjustment_percent:
+        adjusted_rent = rent * (1 + rent_adjustment_percent / 100)
     else:
-        recalc_df['adjusted_rent'] = recalc_df['estimated_rent']
-    
-    # Function to recalculate cash flow
-    def recalc_cash_flow(row):
-        return calculate_cash_flow(
-            row['adjusted_rent'],
-            row['estimated_mortgage'],
-            monthly_expenses
-        )
-    
-    # Recalculate monthly cash flow
-    recalc_df['estimated_monthly_cash_flow'] = recalc_df.apply(recalc_cash_flow, axis=1)
+        adjusted_rent = rent
     
-    # Recalculate annual cash flow
-    recalc_df['estimated_annual_cash_flow'] = recalc_df['estimated_monthly_cash_flow'] * 12
+    monthly_cash_flow = calculate_cash_flow_vec(adjusted_rent, mortgage, monthly_expenses)
+    annual_cash_flow = monthly_cash_flow * 12
+    coc_return = calculate_coc_return_vec(price, down_payment_percent, annual_cash_flow)
     
-    # Function to recalculate CoC return
-    def recalc_coc_return(row):
-        if pd.isna(row.get('price')) or pd.isna(row.get('estimated_annual_cash_flow')):
-            return None
-        return calculate_coc_return(
-            row['price'],
-            down_payment_percent,
-            row['estimated_annual_cash_flow']
-        )
-    
-    # Recalculate CoC return
-    recalc_df['estimated_coc_return'] = recalc_df.apply(recalc_coc_return, axis=1)
-    
-    # Clean up
-    recalc_df.drop('adjusted_rent', axis=1, inplace=True, errors='ignore')
-    
-    return recalc_df
+    # assign() returns a new frame that shares the untouched columns with df
+    return df.assign(
+        estimated_mortgage=mortgage,
+        estimated_monthly_cash_flow=monthly_cash_flow,
+        estimated_annual_cash_flow=annual_cash_flow,
+        estimated_coc_return=coc_return
+    )
 
 
 # Configure Streamlit page
@@ -325,6 +846,306 @@ with st.sidebar:
         step=50
     )
 
+# Results section
+def sensitivity_block() -> None:
+    """
+    Render the sensitivity analysis controls and recalculate metrics on demand.
+    
+    Recalculated results are kept in session state, where the results grid
+    and the metrics comparison pick them up.
+    """
+    with st.expander("📊 Sensitivity Analysis / Scenario Modeling"):
+        st.markdown("""
+        Adjust the financial parameters below to see how changes would affect your metrics
+        without re-running the search.
+        """)
+        
+        # Initialize sensitivity values in session state if they don't exist
+        if 'sensitivity_rate_perc' not in st.session_state:
+            st.session_state.sensitivity_rate_perc = float(st.session_state.run_config.get('interest_rate_decimal', 0.075) * 100)
+        
+        if 'sensitivity_expenses' not in st.session_state:
+            st.session_state.sensitivity_expenses = float(st.session_state.run_config.get('monthly_expenses', 0.0))
+        
+        if 'sensitivity_rent_adj_perc' not in st.session_state:
+            st.session_state.sensitivity_rent_adj_perc = 0.0
+        
+        # Create widget columns
+        col1, col2, col3 = st.columns(3)
+        
+        # Column 1: Interest Rate
+        with col1:
+            sensitivity_rate = st.slider(
+                "Interest Rate %",
+                min_value=1.0,
+                max_value=20.0,
+                value=float(st.session_state.sensitivity_rate_perc),
+                step=0.1,
+                key="sensitivity_rate_widget"
+            )
+            st.session_state.sensitivity_rate_perc = sensitivity_rate
+        
+        # Column 2: Monthly Expenses
+        with col2:
+            sensitivity_expenses = st.number_input(
+                "Monthly Expenses ($)",
+                min_value=0.0,
+                value=float(st.session_state.sensitivity_expenses),
+                step=25.0,
+                format="%.2f",
+                key="sensitivity_expenses_widget"
+            )
+            st.session_state.sensitivity_expenses = sensitivity_expenses
+        
+        # Column 3: Rent Adjustment
+        with col3:
+            sensitivity_rent_adj = st.slider(
+                "Rent Adjustment %",
+                min_value=-20.0,
+                max_value=20.0,
+                value=float(st.session_state.sensitivity_rent_adj_perc),
+                step=1.0,
+                key="sensitivity_rent_adj_widget"
+            )
+            st.session_state.sensitivity_rent_adj_perc = sensitivity_rent_adj
+        
+        # Create button columns
+        btn_col1, btn_col2 = st.columns(2)
+        
+        with btn_col1:
+            # Create recalculation button
+            recalc_button = st.button("Recalculate Metrics", type="primary")
+        
+        with btn_col2:
+            # Create reset button
+            reset_button = st.button("Reset to Original Values", type="secondary")
+        
+        # Handle reset button
+        if reset_button:
+            # Reset sensitivity values to original
+            st.session_state.sensitivity_rate_perc = float(st.session_state.run_config.get('interest_rate_decimal', 0.075) * 100)
+            st.session_state.sensitivity_expenses = float(st.session_state.run_config.get('monthly_expenses', 0.0))
+            st.session_state.sensitivity_rent_adj_perc = 0.0
+            
+            # Clear recalculated results
+            for key in ('recalculated_df', 'recalculated_display_df', 'params_hash'):
+                if key in st.session_state:
+                    del st.session_state[key]
+            
+            # Rerun the app to update the UI
+            st.rerun()
+        
+        # Handle recalculation button
+        if recalc_button:
+            # Create config overrides dictionary
+            config_overrides = {
+                'interest_rate_decimal': st.session_state.sensitivity_rate_perc / 100.0,
+                'down_payment_percent': st.session_state.run_config.get('down_payment_percent', 0.20),
+                'loan_term_years': st.session_state.run_config.get('loan_term_years', 30),
+                'monthly_expenses': st.session_state.sensitivity_expenses,
+                'rent_adjustment_percent': st.session_state.sensitivity_rent_adj_perc
+            }
+            
+            # Only recalculate when the scenario parameters actually changed
+            params_hash = hash((
+                st.session_state.sensitivity_rate_perc,
+                st.session_state.sensitivity_expenses,
+                st.session_state.sensitivity_rent_adj_perc
+            ))
+            
+            if st.session_state.get('params_hash') != params_hash:
+                # Recalculate metrics based on new parameters
+                recalculated_df = recalculate_metrics(st.session_state.original_df, config_overrides)
+                
+                # Store the recalculated results and their display frame in session state
+                st.session_state.recalculated_df = recalculated_df
+                st.session_state.recalculated_display_df = prepare_display_df(recalculated_df)
+                st.session_state.params_hash = params_hash
+            
+            # Display a notification to show recalculation is complete
+            st.success("Metrics recalculated with new parameters!")
+
+
+@st.fragment
+def results_block() -> None:
+    """
+    Render the results of the last analysis run from session state.
+    
+    Runs as a fragment, so interacting with the sensitivity controls or
+    selecting rows in the grid reruns only this block rather than the
+    whole page.
+    """
+    results_df = st.session_state.results_df
+    
+    if results_df.empty:
+        st.warning("No properties found matching the specified criteria.")
+        st.info("""
+        Try adjusting your filter criteria in the sidebar:
+        - Lower the minimum cash-on-cash return
+        - Lower the minimum monthly cash flow
+        - Check different ZIP codes
+        """)
+        return
+    
+    # Confirmation left by the previous run's shortlist update
+    if 'shortlist_added_message' in st.session_state:
+        st.success(st.session_state.pop('shortlist_added_message'))
+    
+    # Display information about selection
+    st.info("Select properties below and click 'Add Selected to Shortlist'.")
+    
+    # Add sensitivity analysis feature if original results exist
+    if 'original_df' in st.session_state:
+        sensitivity_block()
+    
+    # Use the recalculated results instead of original when they exist
+    df = st.session_state.get('recalculated_display_df', st.session_state.results_display_df)
+    
+    # Display dataframe as an editable data editor. Only the display frames
+    # cached in session state are used here, so a checkbox click costs no
+    # rename/format work beyond the Styler.
+    st.data_editor(
+        style_display_df(df),
+        column_config={
+            "Select": st.column_config.CheckboxColumn(required=True),
+            "Zillow Link": st.column_config.LinkColumn("Zillow Link", display_text="View")
+        },
+        column_order=[col for col in DISPLAY_COLUMNS if col in df.columns],
+        disabled=df.columns.difference(["Select"]),  # Make only 'Select' editable
+        hide_index=True,
+        use_container_width=True,
+        key="results_editor"
+    )
+    
+    # Add selected properties to shortlist
+    if st.button("Add Selected to Shortlist"):
+        added_count = 0
+        
+        # Checkbox edits are kept in the editor's widget state, keyed by row
+        # position, so read the selection there instead of copying the grid
+        edited_rows = st.session_state["results_editor"]["edited_rows"]
+        selected_positions = [pos for pos, changes in edited_rows.items() if changes.get("Select")]
+        
+        for pos in selected_positions:
+            # df keeps numeric dtypes (formatting lives in the Styler)
+            original_row = df.iloc[pos]
+            
+            # Use Zillow link as a unique identifier
+            property_link = original_row.get('link')
+            
+            # Skip properties without a link or already in the shortlist
+            if property_link is not None and property_link not in st.session_state.shortlist_links:
+                # Convert row to dictionary and add notes field
+                new_item = original_row.to_dict()
+                new_item['notes'] = ""
+                address_search_key(new_item)
+                shortlist_display_fields(new_item)
+                
+                # Add to shortlist
+                st.session_state.shortlist.append(new_item)
+                st.session_state.shortlist_links.add(property_link)
+                added_count += 1
+        
+        # Flag the shortlist for saving and show success/warning message
+        if added_count > 0:
+            mark_shortlist_changed()
+            # The shortlist section lives outside this fragment, so rerun the whole page
+            st.session_state.shortlist_added_message = f"Added {added_count} properties to shortlist."
+            st.rerun()
+        else:
+            st.warning("Selected properties are already in the shortlist or none selected.")
+    
+    # Add download button
+    csv_data = convert_df_to_csv(df)
+    st.download_button(
+        label="📥 Download Results as CSV",
+        data=csv_data,
+        file_name="real_estate_deals_filtered.csv",
+        mime="text/csv"
+    )
+    
+    # Display metrics comparison if recalculated results exist
+    if 'recalculated_df' in st.session_state and 'original_df' in st.session_state:
+        with st.expander("📈 Metrics Comparison (Original vs Recalculated)"):
+            original_df = st.session_state.original_df
+            recalc_df = st.session_state.recalculated_df
+            
+            # Create comparison metrics
+            if not original_df.empty and not recalc_df.empty:
+                # Average each metric column in one NumPy pass per side
+                metrics = ['estimated_mortgage', 'estimated_monthly_cash_flow',
+                           'estimated_annual_cash_flow', 'estimated_coc_return']
+                orig_means = np.nanmean(original_df[metrics].to_numpy(dtype=np.float64), axis=0)
+                recalc_means = np.nanmean(recalc_df[metrics].to_numpy(dtype=np.float64), axis=0)
+                comparison_data = {
+                    "Metric": [
+                        "Avg. Monthly Mortgage",
+                        "Avg. Monthly Cash Flow",
+                        "Avg. Annual Cash Flow",
+                        "Avg. Cash-on-Cash Return"
+                    ],
+                    "Original": orig_means,
+                    "Recalculated": recalc_means
+                }
+                
+                # Create a comparison DataFrame
+                comparison_df = pd.DataFrame(comparison_data)
+                
+                # Add a difference column
+                comparison_df["Difference"] = comparison_df["Recalculated"] - comparison_df["Original"]
+                comparison_df["Change %"] = (comparison_df["Difference"] / comparison_df["Original"]) * 100
+                
+                # Format the values for display
+                for col in ["Original", "Recalculated", "Difference"]:
+                    comparison_df[col] = comparison_df.apply(
+                        lambda row: format_currency(row[col]) if row["Metric"] in [
+                            "Avg. Monthly Mortgage",
+                            "Avg. Monthly Cash Flow",
+                            "Avg. Annual Cash Flow"
+                        ] else format_percentage(row[col]),
+                        axis=1
+                    )
+                
+                # Format the change percentage
+                comparison_df["Change %"] = comparison_df["Change %"].apply(
+                    lambda x: f"{x:+.2f}%" if not pd.isna(x) else "N/A"
+                )
+                
+                # Display the comparison table
+                st.table(comparison_df)
+                
+                # Display parameter changes
+                st.subheader("Parameter Changes")
+                
+                # Get original and new parameters
+                orig_params = st.session_state.run_config
+                
+                # Display changes
+                params_data = {
+                    "Parameter": [
+                        "Interest Rate",
+                        "Monthly Expenses",
+                        "Rent Adjustment"
+                    ],
+                    "Original": [
+                        f"{orig_params.get('interest_rate_decimal', 0.075) * 100:.1f}%",
+                        f"${orig_params.get('monthly_expenses', 0)}",
+                        "0.0%"
+                    ],
+                    "New": [
+                        f"{st.session_state.sensitivity_rate_perc:.1f}%",
+                        f"${st.session_state.sensitivity_expenses:.2f}",
+                        f"{st.session_state.sensitivity_rent_adj_perc:+.1f}%"
+                    ]
+                }
+                
+                # Create and display parameter comparison
+                params_df = pd.DataFrame(params_data)
+                st.table(params_df)
+    
+    st.success(f"Found {len(results_df)} properties meeting your criteria!")
+
+
 # Main area input
 st.header("📍 Input ZIP Codes")
 zip_input_str = st.text_area(
@@ -364,6 +1185,9 @@ if run_button_clicked:
     # For debugging
     logger.debug(f"Running analysis with parameters: {updated_config}")
     
+    # Deferred so that page loads that never run an analysis skip the API client stack
+    from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator
+    
     try:
         # Run the analysis
         with st.spinner("Fetching property data and calculating metrics... This may take a while."):
@@ -377,12 +1201,19 @@ if run_button_clicked:
             orchestrator.interest_rate_decimal = interest_rate_ui / 100.0  # Convert to decimal
             orchestrator.loan_term_years = loan_term_ui
             
-            # Process ZIP codes
-            filtered_results = orchestrator.process_zip_codes(zip_codes_list)
+            # Fetch (or reuse cached) listings and rents, then score with the current settings
+            candidate_properties = fetch_candidate_properties(tuple(zip_codes_list))
+            filtered_results = orchestrator.evaluate_properties(candidate_properties)
+            
+            # Keep this run's results in session state; the results block renders from there
+            st.session_state.results_df = results_to_df(filtered_results)
+            st.session_state.results_display_df = prepare_display_df(st.session_state.results_df)
+            for key in ('recalculated_df', 'recalculated_display_df', 'params_hash'):
+                st.session_state.pop(key, None)
             
             # Store original results and config in session state
-            if 'original_results' not in st.session_state or st.session_state.get('last_run_zip_codes') != zip_codes_list:
-                st.session_state.original_results = filtered_results.copy()
+            if 'original_df' not in st.session_state or st.session_state.get('last_run_zip_codes') != zip_codes_list:
+                st.session_state.original_df = st.session_state.results_df
                 st.session_state.last_run_zip_codes = zip_codes_list.copy()  # Track which ZIPs these results are for
                 st.session_state.run_config = {
                     'interest_rate_decimal': interest_rate_ui / 100.0,
@@ -396,373 +1227,11 @@ if run_button_clicked:
         st.exception(e)
         logger.error(f"Error during analysis: {e}", exc_info=True)
         st.stop()
-    
-    # Display results
+
+# Display results
+if 'results_df' in st.session_state:
     st.header("📊 Results")
-    
-    if filtered_results:
-        # Convert to DataFrame
-        df = pd.DataFrame(filtered_results)
-        
-        # Rename and select columns for display
-        if len(df.columns) > 0:
-            # Add selection column (must be added before renaming)
-            df.insert(0, "Select", False)
-            
-            # Keep the original zillow_url before renaming for shortlist functionality
-            df['link'] = df['zillow_url'] if 'zillow_url' in df.columns else None
-            
-            # Define column mapping
-            column_mapping = {
-                'address': 'Address',
-                'price': 'Price',
-                'bedrooms': 'Beds',
-                'bathrooms': 'Baths',
-                'sqft': 'Sq Ft',
-                'year_built': 'Year Built',
-                'property_type': 'Type',
-                'estimated_rent': 'Est. Rent',
-                'estimated_mortgage': 'Est. Mortgage',
-                'monthly_expenses': 'Monthly Expenses',
-                'estimated_monthly_cash_flow': 'Monthly Cash Flow',
-                'estimated_annual_cash_flow': 'Annual Cash Flow',
-                'estimated_coc_return': 'CoC Return %',
-                'zip_code': 'ZIP Code',
-                'zillow_url': 'Zillow Link'
-            }
-            
-            # Rename columns that exist in the DataFrame
-            existing_columns = [col for col in column_mapping.keys() if col in df.columns]
-            df = df.rename(columns={col: column_mapping[col] for col in existing_columns})
-            
-            # Define display columns and order
-            display_columns = [
-                'Select', 'Address', 'ZIP Code', 'Price', 'Beds', 'Baths', 'Sq Ft',
-                'Est. Rent', 'Est. Mortgage', 'Monthly Expenses', 'Monthly Cash Flow',
-                'CoC Return %', 'Type', 'Year Built', 'Zillow Link'
-            ]
-            
-            # Filter to only display columns that exist in the DataFrame
-            display_columns = [col for col in display_columns if col in df.columns]
-            
-            # Store the unformatted DataFrame for adding to shortlist
-            unformatted_df = df.copy()
-            
-            # Format currency and percentage columns
-            for col in df.columns:
-                if col in ['Price', 'Est. Rent', 'Est. Mortgage', 'Monthly Expenses', 
-                           'Monthly Cash Flow', 'Annual Cash Flow']:
-                    df[col] = df[col].apply(format_currency)
-                elif col in ['CoC Return %']:
-                    df[col] = df[col].apply(format_percentage)
-            
-            # Display information about selection
-            st.info("Select properties below and click 'Add Selected to Shortlist'.")
-            
-            # Add sensitivity analysis feature if original results exist
-            if 'original_results' in st.session_state:
-                with st.expander("📊 Sensitivity Analysis / Scenario Modeling"):
-                    st.markdown("""
-                    Adjust the financial parameters below to see how changes would affect your metrics 
-                    without re-running the search.
-                    """)
-                    
-                    # Initialize sensitivity values in session state if they don't exist
-                    if 'sensitivity_rate_perc' not in st.session_state:
-                        st.session_state.sensitivity_rate_perc = float(st.session_state.run_config.get('interest_rate_decimal', 0.075) * 100)
-                    
-                    if 'sensitivity_expenses' not in st.session_state:
-                        sample_price = 300000  # Use a sample price for default expenses
-                        st.session_state.sensitivity_expenses = float(orchestrator.calculate_monthly_expenses(sample_price))
-                    
-                    if 'sensitivity_rent_adj_perc' not in st.session_state:
-                        st.session_state.sensitivity_rent_adj_perc = 0.0
-                        
-                    # Create widget columns
-                    col1, col2, col3 = st.columns(3)
-                    
-                    # Column 1: Interest Rate
-                    with col1:
-                        sensitivity_rate = st.slider(
-                            "Interest Rate %",
-                            min_value=1.0,
-                            max_value=20.0,
-                            value=float(st.session_state.sensitivity_rate_perc),
-                            step=0.1,
-                            key="sensitivity_rate_widget"
-                        )
-                        st.session_state.sensitivity_rate_perc = sensitivity_rate
-                    
-                    # Column 2: Monthly Expenses
-                    with col2:
-                        sensitivity_expenses = st.number_input(
-                            "Monthly Expenses ($)",
-                            min_value=0.0,
-                            value=float(st.session_state.sensitivity_expenses),
-                            step=25.0,
-                            format="%.2f",
-                            key="sensitivity_expenses_widget"
-                        )
-                        st.session_state.sensitivity_expenses = sensitivity_expenses
-                    
-                    # Column 3: Rent Adjustment
-                    with col3:
-                        sensitivity_rent_adj = st.slider(
-                            "Rent Adjustment %",
-                            min_value=-20.0,
-                            max_value=20.0,
-                            value=float(st.session_state.sensitivity_rent_adj_perc),
-                            step=1.0,
-                            key="sensitivity_rent_adj_widget"
-                        )
-                        st.session_state.sensitivity_rent_adj_perc = sensitivity_rent_adj
-                    
-                    # Create button columns
-                    btn_col1, btn_col2 = st.columns(2)
-                    
-                    with btn_col1:
-                        # Create recalculation button
-                        recalc_button = st.button("Recalculate Metrics", type="primary")
-                    
-                    with btn_col2:
-                        # Create reset button
-                        reset_button = st.button("Reset to Original Values", type="secondary")
-                    
-                    # Handle reset button
-                    if reset_button:
-                        # Reset sensitivity values to original
-                        st.session_state.sensitivity_rate_perc = float(st.session_state.run_config.get('interest_rate_decimal', 0.075) * 100)
-                        sample_price = 300000
-                        st.session_state.sensitivity_expenses = float(orchestrator.calculate_monthly_expenses(sample_price))
-                        st.session_state.sensitivity_rent_adj_perc = 0.0
-                        
-                        # Clear recalculated results
-                        if 'recalculated_results' in st.session_state:
-                            del st.session_state.recalculated_results
-                        
-                        # Rerun the app to update the UI
-                        st.rerun()
-                    
-                    # Handle recalculation button
-                    if recalc_button:
-                        # Create config overrides dictionary
-                        config_overrides = {
-                            'interest_rate_decimal': st.session_state.sensitivity_rate_perc / 100.0,
-                            'down_payment_percent': st.session_state.run_config.get('down_payment_percent', 0.20),
-                            'loan_term_years': st.session_state.run_config.get('loan_term_years', 30),
-                            'monthly_expenses': st.session_state.sensitivity_expenses,
-                            'rent_adjustment_percent': st.session_state.sensitivity_rent_adj_perc
-                        }
-                        
-                        # Convert original results to DataFrame
-                        original_df = pd.DataFrame(st.session_state.original_results)
-                        
-                        # Recalculate metrics based on new parameters
-                        recalculated_df = recalculate_metrics(original_df, config_overrides)
-                        
-                        # Store the recalculated results in session state
-                        st.session_state.recalculated_results = recalculated_df.to_dict('records')
-                        
-                        # Use the recalculated results instead of original
-                        df = pd.DataFrame(st.session_state.recalculated_results)
-                        
-                        # Add selection column
-                        df.insert(0, "Select", False)
-                        
-                        # Keep the original zillow_url
-                        df['link'] = df['zillow_url'] if 'zillow_url' in df.columns else None
-                        
-                        # Apply same column mappings as before
-                        column_mapping = {
-                            'address': 'Address',
-                            'price': 'Price',
-                            'bedrooms': 'Beds',
-                            'bathrooms': 'Baths',
-                            'sqft': 'Sq Ft',
-                            'year_built': 'Year Built',
-                            'property_type': 'Type',
-                            'estimated_rent': 'Est. Rent',
-                            'estimated_mortgage': 'Est. Mortgage',
-                            'monthly_expenses': 'Monthly Expenses',
-                            'estimated_monthly_cash_flow': 'Monthly Cash Flow',
-                            'estimated_annual_cash_flow': 'Annual Cash Flow',
-                            'estimated_coc_return': 'CoC Return %',
-                            'zip_code': 'ZIP Code',
-                            'zillow_url': 'Zillow Link'
-                        }
-                        
-                        # Rename columns that exist in the DataFrame
-                        existing_columns = [col for col in column_mapping.keys() if col in df.columns]
-                        df = df.rename(columns={col: column_mapping[col] for col in existing_columns})
-                        
-                        # Store the unformatted DataFrame for adding to shortlist
-                        unformatted_df = df.copy()
-                        
-                        # Format currency and percentage columns
-                        for col in df.columns:
-                            if col in ['Price', 'Est. Rent', 'Est. Mortgage', 'Monthly Expenses', 
-                                       'Monthly Cash Flow', 'Annual Cash Flow']:
-                                df[col] = df[col].apply(format_currency)
-                            elif col in ['CoC Return %']:
-                                df[col] = df[col].apply(format_percentage)
-                        
-                        # Display a notification to show recalculation is complete
-                        st.success("Metrics recalculated with new parameters!")
-            
-            # Display dataframe as an editable data editor
-            edited_df = st.data_editor(
-                df,
-                column_config={
-                    "Select": st.column_config.CheckboxColumn(required=True),
-                    "Zillow Link": st.column_config.LinkColumn("Zillow Link", display_text="View")
-                },
-                disabled=df.columns.difference(["Select"]),  # Make only 'Select' editable
-                hide_index=True,
-                use_container_width=True,
-                key="results_editor"
-            )
-            
-            # Add selected properties to shortlist
-            selected_rows = edited_df[edited_df.Select]
-            
-            if st.button("Add Selected to Shortlist"):
-                added_count = 0
-                
-                for index, row in selected_rows.iterrows():
-                    # Use original data for the shortlist (not formatted)
-                    original_row = unformatted_df.loc[index]
-                    
-                    # Use Zillow link as a unique identifier
-                    property_link = original_row.get('link')
-                    
-                    # Check if property is already in shortlist
-                    is_already_shortlisted = any(
-                        item.get('link') == property_link 
-                        for item in st.session_state.shortlist
-                    )
-                    
-                    if not is_already_shortlisted and property_link is not None:
-                        # Convert row to dictionary and add notes field
-                        new_item = original_row.to_dict()
-                        new_item['notes'] = ""
-                        
-                        # Add to shortlist
-                        st.session_state.shortlist.append(new_item)
-                        added_count += 1
-                
-                # Save shortlist and show success/warning message
-                if added_count > 0:
-                    save_shortlist(st.session_state.shortlist)
-                    st.success(f"Added {added_count} properties to shortlist.")
-                else:
-                    st.warning("Selected properties are already in the shortlist or none selected.")
-            
-            # Add download button
-            csv_data = convert_df_to_csv(df)
-            st.download_button(
-                label="📥 Download Results as CSV",
-                data=csv_data,
-                file_name="real_estate_deals_filtered.csv",
-                mime="text/csv"
-            )
-            
-            # Display metrics comparison if recalculated results exist
-            if 'recalculated_results' in st.session_state and 'original_results' in st.session_state:
-                with st.expander("📈 Metrics Comparison (Original vs Recalculated)"):
-                    # Create DataFrames for comparison
-                    original_df = pd.DataFrame(st.session_state.original_results)
-                    recalc_df = pd.DataFrame(st.session_state.recalculated_results)
-                    
-                    # Create comparison metrics
-                    if not original_df.empty and not recalc_df.empty:
-                        # Calculate averages for key metrics
-                        comparison_data = {
-                            "Metric": [
-                                "Avg. Monthly Mortgage", 
-                                "Avg. Monthly Cash Flow", 
-                                "Avg. Annual Cash Flow",
-                                "Avg. Cash-on-Cash Return"
-                            ],
-                            "Original": [
-                                original_df['estimated_mortgage'].mean(),
-                                original_df['estimated_monthly_cash_flow'].mean(),
-                                original_df['estimated_annual_cash_flow'].mean(),
-                                original_df['estimated_coc_return'].mean()
-                            ],
-                            "Recalculated": [
-                                recalc_df['estimated_mortgage'].mean(),
-                                recalc_df['estimated_monthly_cash_flow'].mean(),
-                                recalc_df['estimated_annual_cash_flow'].mean(),
-                                recalc_df['estimated_coc_return'].mean()
-                            ]
-                        }
-                        
-                        # Create a comparison DataFrame
-                        comparison_df = pd.DataFrame(comparison_data)
-                        
-                        # Add a difference column
-                        comparison_df["Difference"] = comparison_df["Recalculated"] - comparison_df["Original"]
-                        comparison_df["Change %"] = (comparison_df["Difference"] / comparison_df["Original"]) * 100
-                        
-                        # Format the values for display
-                        for col in ["Original", "Recalculated", "Difference"]:
-                            comparison_df[col] = comparison_df.apply(
-                                lambda row: format_currency(row[col]) if row["Metric"] in [
-                                    "Avg. Monthly Mortgage", 
-                                    "Avg. Monthly Cash Flow", 
-                                    "Avg. Annual Cash Flow"
-                                ] else format_percentage(row[col]), 
-                                axis=1
-                            )
-                        
-                        # Format the change percentage
-                        comparison_df["Change %"] = comparison_df["Change %"].apply(
-                            lambda x: f"{x:+.2f}%" if not pd.isna(x) else "N/A"
-                        )
-                        
-                        # Display the comparison table
-                        st.table(comparison_df)
-                        
-                        # Display parameter changes
-                        st.subheader("Parameter Changes")
-                        
-                        # Get original and new parameters
-                        orig_params = st.session_state.run_config
-                        
-                        # Display changes
-                        params_data = {
-                            "Parameter": [
-                                "Interest Rate",
-                                "Monthly Expenses",
-                                "Rent Adjustment"
-                            ],
-                            "Original": [
-                                f"{orig_params.get('interest_rate_decimal', 0.075) * 100:.1f}%",
-                                f"${orig_params.get('monthly_expenses', 0)}",
-                                "0.0%"
-                            ],
-                            "New": [
-                                f"{st.session_state.sensitivity_rate_perc:.1f}%",
-                                f"${st.session_state.sensitivity_expenses:.2f}",
-                                f"{st.session_state.sensitivity_rent_adj_perc:+.1f}%"
-                            ]
-                        }
-                        
-                        # Create and display parameter comparison
-                        params_df = pd.DataFrame(params_data)
-                        st.table(params_df)
-            
-            st.success(f"Found {len(filtered_results)} properties meeting your criteria!")
-        else:
-            st.warning("No data returned from analysis.")
-    else:
-        st.warning("No properties found matching the specified criteria.")
-        st.info("""
-        Try adjusting your filter criteria in the sidebar:
-        - Lower the minimum cash-on-cash return
-        - Lower the minimum monthly cash flow
-        - Check different ZIP codes
-        """)
+    results_block()
 
 # Shortlist Section
 st.header("⭐ My Shortlist")
@@ -775,368 +1244,76 @@ else:
     # Add search functionality
     search_term = st.text_input("🔍 Search shortlist by address:", placeholder="Enter address keywords...")
     
+    # Lowercase the search term once; item addresses are cached lowercased
+    search_lc = search_term.lower()
+    
     # Show counts when filtering
     if search_term:
-        # Count properties that match the search term
-        matching_count = sum(1 for item in st.session_state.shortlist 
-                           if search_term.lower() in str(item.get('Address', item.get('address', ''))).lower())
+        matching_count = len(shortlist_order(search_lc, 'price'))
         st.caption(f"Showing {matching_count} of {len(st.session_state.shortlist)} properties matching '{search_term}'.")
     
-    # Create tabs for sorting options
-    shortlist_tab1, shortlist_tab2, shortlist_tab3 = st.tabs(["Sort by Price", "Sort by Cash Flow", "Sort by CoC Return"])
-    
-    with shortlist_tab1:
-        # Filter the shortlist by search term
-        filtered_shortlist = st.session_state.shortlist
-        if search_term:
-            filtered_shortlist = [
-                item for item in st.session_state.shortlist
-                if search_term.lower() in str(item.get('Address', item.get('address', ''))).lower()
-            ]
-        
-        # Sort the filtered shortlist by price
-        sorted_shortlist = sorted(filtered_shortlist, key=lambda x: x.get('price', 0), reverse=True)
-        
-        # Add clear all button
-        if st.button("Clear All Shortlisted Properties", type="secondary"):
-            if st.session_state.shortlist:
-                # Ask for confirmation
-                if st.warning("Are you sure you want to remove all properties from your shortlist?"):
-                    # Clear the shortlist
-                    st.session_state.shortlist = []
-                    save_shortlist([])
-                    st.success("Shortlist cleared!")
-                    st.rerun()
-        
-        # Display each property in an expander
-        for index, item in enumerate(sorted_shortlist):
-            # Create a detailed title for the expander
-            address = item.get('Address', item.get('address', f'Property {index+1}'))
-            price = item.get('Price', item.get('price', 'Unknown'))
-            if isinstance(price, str) and price.startswith('$'):
-                price_display = price
-            else:
-                price_display = f"${price:,.2f}" if price and not isinstance(price, str) else price
-            
-            expander_title = f"{address} - {price_display}"
-            
-            with st.expander(expander_title):
-                # Create two columns for layout
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    # Display key property details
-                    st.markdown("**Property Details:**")
-                    
-                    # Get raw values for bedrooms and bathrooms
-                    beds = item.get('Beds', item.get('bedrooms', 'N/A'))
-                    baths = item.get('Baths', item.get('bathrooms', 'N/A'))
-                    
-                    # Get and format financial values
-                    rent = item.get('Est. Rent', item.get('estimated_rent', 'N/A'))
-                    rent_display = f"${rent:,.2f}" if rent and not isinstance(rent, str) else rent
-                    
-                    mortgage = item.get('Est. Mortgage', item.get('estimated_mortgage', 'N/A'))
-                    mortgage_display = f"${mortgage:,.2f}" if mortgage and not isinstance(mortgage, str) else mortgage
-                    
-                    cash_flow = item.get('Monthly Cash Flow', item.get('estimated_monthly_cash_flow', 'N/A'))
-                    cash_flow_display = f"${cash_flow:,.2f}" if cash_flow and not isinstance(cash_flow, str) else cash_flow
-                    
-                    coc_return = item.get('CoC Return %', item.get('estimated_coc_return', 'N/A'))
-                    coc_display = f"{coc_return:.2f}%" if coc_return and not isinstance(coc_return, str) else coc_return
-                    
-                    # Display the details
-                    st.markdown(f"**Beds/Baths:** {beds}/{baths}")
-                    st.markdown(f"**Monthly Rent:** {rent_display}")
-                    st.markdown(f"**Monthly Mortgage:** {mortgage_display}")
-                    st.markdown(f"**Monthly Cash Flow:** {cash_flow_display}")
-                    st.markdown(f"**Cash-on-Cash Return:** {coc_display}")
-                
-                with col2:
-                    # Display Zillow link
-                    zillow_link = item.get('Zillow Link', item.get('zillow_url', item.get('link', '#')))
-                    if zillow_link and zillow_link != '#':
-                        st.markdown(f"[View on Zillow]({zillow_link})")
-                    
-                    # Create a unique key for each property's remove button
-                    remove_key = f"remove_{item.get('link', index)}"
-                    
-                    # Add remove button
-                    if st.button("Remove from Shortlist", key=remove_key):
-                        # Find the item in the actual session state list
-                        for i, shortlist_item in enumerate(st.session_state.shortlist):
-                            if shortlist_item.get('link') == item.get('link'):
-                                # Remove the item
-                                st.session_state.shortlist.pop(i)
-                                # Save the updated shortlist
-                                save_shortlist(st.session_state.shortlist)
-                                # Rerun the app to update the display
-                                st.rerun()
-                                break
-                
-                # Notes section (full width)
-                st.markdown("**Notes:**")
-                
-                # Create a unique key for each property's notes
-                note_key = f"note_{item.get('link', index)}"
-                
-                # Get current notes
-                current_note = item.get('notes', '')
-                
-                # Create the notes text area
-                new_note = st.text_area(
-                    "Add your notes here:",
-                    value=current_note,
-                    key=note_key,
-                    height=100,
-                    label_visibility="collapsed"
-                )
-                
-                # If notes have changed, update them
-                if new_note != current_note:
-                    # Find the item in the actual session state list
-                    for i, shortlist_item in enumerate(st.session_state.shortlist):
-                        if shortlist_item.get('link') == item.get('link'):
-                            # Update the notes
-                            st.session_state.shortlist[i]['notes'] = new_note
-                            # Save the updated shortlist
-                            save_shortlist(st.session_state.shortlist)
-                            # No need to rerun here as text areas update without rerunning
-                            break
-    
-    with shortlist_tab2:
-        # Filter the shortlist by search term
-        filtered_shortlist = st.session_state.shortlist
-        if search_term:
-            filtered_shortlist = [
-                item for item in st.session_state.shortlist
-                if search_term.lower() in str(item.get('Address', item.get('address', ''))).lower()
-            ]
-        
-        # Sort the filtered shortlist by monthly cash flow (descending)
-        sorted_shortlist = sorted(
-            filtered_shortlist, 
-            key=lambda x: x.get('estimated_monthly_cash_flow', 0) 
-                if isinstance(x.get('estimated_monthly_cash_flow'), (int, float)) else -9999, 
-            reverse=True
-        )
-        
-        # Display message if empty
-        if not sorted_shortlist:
-            st.info("No properties in your shortlist.")
-        else:
-            # Display each property in an expander
-            for index, item in enumerate(sorted_shortlist):
-                # Create a detailed title for the expander
-                address = item.get('Address', item.get('address', f'Property {index+1}'))
-                price = item.get('Price', item.get('price', 'Unknown'))
-                if isinstance(price, str) and price.startswith('$'):
-                    price_display = price
-                else:
-                    price_display = f"${price:,.2f}" if price and not isinstance(price, str) else price
-                
-                expander_title = f"{address} - {price_display}"
-                
-                with st.expander(expander_title):
-                    # Create two columns for layout
-                    col1, col2 = st.columns([2, 1])
-                    
-                    with col1:
-                        # Display key property details
-                        st.markdown("**Property Details:**")
-                        
-                        # Get raw values for bedrooms and bathrooms
-                        beds = item.get('Beds', item.get('bedrooms', 'N/A'))
-                        baths = item.get('Baths', item.get('bathrooms', 'N/A'))
-                        
-                        # Get and format financial values
-                        rent = item.get('Est. Rent', item.get('estimated_rent', 'N/A'))
-                        rent_display = f"${rent:,.2f}" if rent and not isinstance(rent, str) else rent
-                        
-                        mortgage = item.get('Est. Mortgage', item.get('estimated_mortgage', 'N/A'))
-                        mortgage_display = f"${mortgage:,.2f}" if mortgage and not isinstance(mortgage, str) else mortgage
-                        
-                        cash_flow = item.get('Monthly Cash Flow', item.get('estimated_monthly_cash_flow', 'N/A'))
-                        cash_flow_display = f"${cash_flow:,.2f}" if cash_flow and not isinstance(cash_flow, str) else cash_flow
-                        
-                        coc_return = item.get('CoC Return %', item.get('estimated_coc_return', 'N/A'))
-                        coc_display = f"{coc_return:.2f}%" if coc_return and not isinstance(coc_return, str) else coc_return
-                        
-                        # Display the details
-                        st.markdown(f"**Beds/Baths:** {beds}/{baths}")
-                        st.markdown(f"**Monthly Rent:** {rent_display}")
-                        st.markdown(f"**Monthly Mortgage:** {mortgage_display}")
-                        st.markdown(f"**Monthly Cash Flow:** {cash_flow_display}")
-                        st.markdown(f"**Cash-on-Cash Return:** {coc_display}")
-                    
-                    with col2:
-                        # Display Zillow link
-                        zillow_link = item.get('Zillow Link', item.get('zillow_url', item.get('link', '#')))
-                        if zillow_link and zillow_link != '#':
-                            st.markdown(f"[View on Zillow]({zillow_link})")
-                        
-                        # Create a unique key for each property's remove button
-                        remove_key = f"remove_{item.get('link', index)}_cf"
-                        
-                        # Add remove button
-                        if st.button("Remove from Shortlist", key=remove_key):
-                            # Find the item in the actual session state list
-                            for i, shortlist_item in enumerate(st.session_state.shortlist):
-                                if shortlist_item.get('link') == item.get('link'):
-                                    # Remove the item
-                                    st.session_state.shortlist.pop(i)
-                                    # Save the updated shortlist
-                                    save_shortlist(st.session_state.shortlist)
-                                    # Rerun the app to update the display
-                                    st.rerun()
-                                    break
-                    
-                    # Notes section (full width)
-                    st.markdown("**Notes:**")
-                    
-                    # Create a unique key for each property's notes
-                    note_key = f"note_{item.get('link', index)}_cf"
-                    
-                    # Get current notes
-                    current_note = item.get('notes', '')
-                    
-                    # Create the notes text area
-                    new_note = st.text_area(
-                        "Add your notes here:",
-                        value=current_note,
-                        key=note_key,
-                        height=100,
-                        label_visibility="collapsed"
-                    )
-                    
-                    # If notes have changed, update them
-                    if new_note != current_note:
-                        # Find the item in the actual session state list
-                        for i, shortlist_item in enumerate(st.session_state.shortlist):
-                            if shortlist_item.get('link') == item.get('link'):
-                                # Update the notes
-                                st.session_state.shortlist[i]['notes'] = new_note
-                                # Save the updated shortlist
-                                save_shortlist(st.session_state.shortlist)
-                                # No need to rerun here as text areas update without rerunning
-                                break
-    
-    with shortlist_tab3:
-        # Filter the shortlist by search term
-        filtered_shortlist = st.session_state.shortlist
-        if search_term:
-            filtered_shortlist = [
-                item for item in st.session_state.shortlist
-                if search_term.lower() in str(item.get('Address', item.get('address', ''))).lower()
-            ]
-        
-        # Sort the filtered shortlist by CoC return (descending)
-        sorted_shortlist = sorted(
-            filtered_shortlist, 
-            key=lambda x: x.get('estimated_coc_return', 0) 
-                if isinstance(x.get('estimated_coc_return'), (int, float)) else -9999, 
-            reverse=True
+    # Render only the selected ordering; tabs would execute every list
+    sort_choice = st.radio(
+        "Sort by",
+        ["Price", "Cash Flow", "CoC Return"],
+        horizontal=True,
+        key="shortlist_sort"
+    )
+    sort_column = {
+        "Price": 'price',
+        "Cash Flow": 'estimated_monthly_cash_flow',
+        "CoC Return": 'estimated_coc_return'
+    }[sort_choice]
+    
+    # Add clear all button
+    if st.button("Clear All Shortlisted Properties", type="secondary"):
+        if st.session_state.shortlist:
+            # Ask for confirmation
+            if st.warning("Are you sure you want to remove all properties from your shortlist?"):
+                # Clear the shortlist
+                st.session_state.shortlist = []
+                st.session_state.shortlist_links = set()
+                mark_shortlist_changed()
+                st.success("Shortlist cleared!")
+                st.rerun()
+    
+    # Sort the filtered shortlist (descending)
+    shortlist_positions = shortlist_order(search_lc, sort_column)
+    sorted_shortlist = [st.session_state.shortlist[i] for i in shortlist_positions]
+    
+    # Display message if empty
+    if not sorted_shortlist:
+        st.info("No properties in your shortlist.")
+    elif len(sorted_shortlist) >= SHORTLIST_TABLE_THRESHOLD:
+        # Long shortlists: one table, with the card for the selected row below it
+        table_event = st.dataframe(
+            cached_shortlist_table().iloc[shortlist_positions],
+            column_config={
+                **{col: st.column_config.NumberColumn(format="$%.2f") for col in CURRENCY_COLUMNS},
+                "CoC Return %": st.column_config.NumberColumn(format="%.2f%%"),
+                "Zillow Link": st.column_config.LinkColumn("Zillow Link", display_text="View")
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="shortlist_table"
         )
-        
-        # Display message if empty
-        if not sorted_shortlist:
-            st.info("No properties in your shortlist.")
+        selected_rows = table_event.selection.rows
+        if selected_rows and selected_rows[0] < len(sorted_shortlist):
+            render_property_card(sorted_shortlist[selected_rows[0]], selected_rows[0], expanded=True)
         else:
-            # Display each property in an expander
-            for index, item in enumerate(sorted_shortlist):
-                # Create a detailed title for the expander
-                address = item.get('Address', item.get('address', f'Property {index+1}'))
-                price = item.get('Price', item.get('price', 'Unknown'))
-                if isinstance(price, str) and price.startswith('$'):
-                    price_display = price
-                else:
-                    price_display = f"${price:,.2f}" if price and not isinstance(price, str) else price
-                
-                expander_title = f"{address} - {price_display}"
-                
-                with st.expander(expander_title):
-                    # Create two columns for layout
-                    col1, col2 = st.columns([2, 1])
-                    
-                    with col1:
-                        # Display key property details
-                        st.markdown("**Property Details:**")
-                        
-                        # Get raw values for bedrooms and bathrooms
-                        beds = item.get('Beds', item.get('bedrooms', 'N/A'))
-                        baths = item.get('Baths', item.get('bathrooms', 'N/A'))
-                        
-                        # Get and format financial values
-                        rent = item.get('Est. Rent', item.get('estimated_rent', 'N/A'))
-                        rent_display = f"${rent:,.2f}" if rent and not isinstance(rent, str) else rent
-                        
-                        mortgage = item.get('Est. Mortgage', item.get('estimated_mortgage', 'N/A'))
-                        mortgage_display = f"${mortgage:,.2f}" if mortgage and not isinstance(mortgage, str) else mortgage
-                        
-                        cash_flow = item.get('Monthly Cash Flow', item.get('estimated_monthly_cash_flow', 'N/A'))
-                        cash_flow_display = f"${cash_flow:,.2f}" if cash_flow and not isinstance(cash_flow, str) else cash_flow
-                        
-                        coc_return = item.get('CoC Return %', item.get('estimated_coc_return', 'N/A'))
-                        coc_display = f"{coc_return:.2f}%" if coc_return and not isinstance(coc_return, str) else coc_return
-                        
-                        # Display the details
-                        st.markdown(f"**Beds/Baths:** {beds}/{baths}")
-                        st.markdown(f"**Monthly Rent:** {rent_display}")
-                        st.markdown(f"**Monthly Mortgage:** {mortgage_display}")
-                        st.markdown(f"**Monthly Cash Flow:** {cash_flow_display}")
-                        st.markdown(f"**Cash-on-Cash Return:** {coc_display}")
-                    
-                    with col2:
-                        # Display Zillow link
-                        zillow_link = item.get('Zillow Link', item.get('zillow_url', item.get('link', '#')))
-                        if zillow_link and zillow_link != '#':
-                            st.markdown(f"[View on Zillow]({zillow_link})")
-                        
-                        # Create a unique key for each property's remove button
-                        remove_key = f"remove_{item.get('link', index)}_coc"
-                        
-                        # Add remove button
-                        if st.button("Remove from Shortlist", key=remove_key):
-                            # Find the item in the actual session state list
-                            for i, shortlist_item in enumerate(st.session_state.shortlist):
-                                if shortlist_item.get('link') == item.get('link'):
-                                    # Remove the item
-                                    st.session_state.shortlist.pop(i)
-                                    # Save the updated shortlist
-                                    save_shortlist(st.session_state.shortlist)
-                                    # Rerun the app to update the display
-                                    st.rerun()
-                                    break
-                    
-                    # Notes section (full width)
-                    st.markdown("**Notes:**")
-                    
-                    # Create a unique key for each property's notes
-                    note_key = f"note_{item.get('link', index)}_coc"
-                    
-                    # Get current notes
-                    current_note = item.get('notes', '')
-                    
-                    # Create the notes text area
-                    new_note = st.text_area(
-                        "Add your notes here:",
-                        value=current_note,
-                        key=note_key,
-                        height=100,
-                        label_visibility="collapsed"
-                    )
-                    
-                    # If notes have changed, update them
-                    if new_note != current_note:
-                        # Find the item in the actual session state list
-                        for i, shortlist_item in enumerate(st.session_state.shortlist):
-                            if shortlist_item.get('link') == item.get('link'):
-                                # Update the notes
-                                st.session_state.shortlist[i]['notes'] = new_note
-                                # Save the updated shortlist
-                                save_shortlist(st.session_state.shortlist)
-                                # No need to rerun here as text areas update without rerunning
-                                break
+            st.caption("Select a row to see details, edit notes or remove the property.")
+    else:
+        # Display each property in an expander
+        for index, item in enumerate(sorted_shortlist):
+            render_property_card(item, index)
+
+# Persist shortlist changes once per run, however many edits the run made.
+# Handlers that call st.rerun() leave the flag set for the next run to flush.
+if st.session_state.get('shortlist_dirty'):
+    save_shortlist(st.session_state.shortlist)
+    st.session_state.shortlist_dirty = False
 
 # Footer
 st.markdown("---")
@@ -4,15 +4,21 @@ API client implementations for the Real Estate Deal Finder application.
 This module contains classes for interacting with external APIs such as Zillow and RentCast.
 """
 
+import atexit
 import json
 import logging
 import os
-import datetime
-from typing import Dict, List, Optional, Any, Union, Tuple
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.real_estate_deal_finder import config
+from src.real_estate_deal_finder.models import Listing
 
 
 class APIError(Exception):
@@ -20,6 +26,90 @@ class APIError(Exception):
     pass
 
 
+# Connections kept open per host by each client session; concurrent
+# requests beyond this would open connections that are then discarded
+HTTP_POOL_MAXSIZE = 20
+
+
+# RentCast clients whose unsaved cache entries are flushed at interpreter exit
+_open_rentcast_clients: "weakref.WeakSet[RentCastApiClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_rentcast_caches() -> None:
+    """
+    Save the unsaved cache entries of every live RentCast client.
+    """
+    for client in list(_open_rentcast_clients):
+        client.flush_cache()
+
+
+# Zillow listing fields read by get_listings_by_zip
+ZILLOW_LISTING_FIELDS = (
+    "address", "price", "bedrooms", "bathrooms", "livingArea",
+    "homeType", "yearBuilt", "detailUrl", "zpid", "imgSrc"
+)
+
+
+def _trim_listing(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON object hook that keeps only the used fields of Zillow listings.
+    
+    Listings are recognised by their 'zpid' key; other objects are returned
+    unchanged. Nested objects inside a listing (photos, sub-listings, etc.)
+    are released as soon as the listing itself is decoded.
+    
+    Args:
+        obj: Decoded JSON object
+        
+    Returns:
+        The trimmed listing, or obj if it is not a listing
+    """
+    if "zpid" not in obj:
+        return obj
+    return {key: obj[key] for key in ZILLOW_LISTING_FIELDS if key in obj}
+
+
+def _body_preview(body: bytes, limit: int = 500) -> str:
+    """
+    Decode the start of a response body for error messages and logs.
+    
+    Only the first bytes are decoded, so large error pages or binary bodies
+    are never decoded in full.
+    
+    Args:
+        body: Raw response body
+        limit: Maximum number of body bytes to decode
+        
+    Returns:
+        The decoded preview, with undecodable bytes replaced
+    """
+    return body[:limit].decode('utf-8', errors='replace')
+
+
+def _create_session(headers: Dict[str, str]) -> requests.Session:
+    """
+    Create an HTTP session with connection pooling.
+    
+    Reusing one session per client keeps connections (and their TLS
+    handshakes) alive across requests.
+    
+    Args:
+        headers: Headers to send with every request made through the session
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    return session
+
+
 class ZillowApiClient:
     """
     Client for interacting with the Zillow API via RapidAPI.
@@ -28,16 +118,30 @@ class ZillowApiClient:
     and response parsing for the Zillow API endpoints.
     """
     
+    # How long fetched listings for a ZIP code are reused within a session
+    LISTINGS_CACHE_TTL_SECONDS = 600
+    
+    # One logger shared by all instances
+    logger = logging.getLogger(__name__)
+    
     def __init__(self) -> None:
         """
         Initialize the Zillow API client.
         
-        Retrieves API key and host from configuration and sets up logger.
+        Retrieves API key and host from configuration and sets up the HTTP session.
         """
         self.api_key = config.ZILLOW_API_KEY
         self.rapidapi_host = config.ZILLOW_RAPIDAPI_HOST
         self.base_url = f"https://{self.rapidapi_host}"
-        self.logger = logging.getLogger(__name__)
+        
+        # Pooled session carrying the authentication headers
+        self.session = _create_session({
+            "X-RapidAPI-Key": self.api_key,
+            "X-RapidAPI-Host": self.rapidapi_host
+        })
+        
+        # Processed listings by (zip_code, home_type, sort): (fetch time, listings)
+        self._listings_cache: Dict[Tuple[str, str, str], Tuple[float, List[Listing]]] = {}
         
         if not self.api_key:
             self.logger.error("Zillow API key is not set in configuration")
@@ -45,12 +149,19 @@ class ZillowApiClient:
         if not self.rapidapi_host:
             self.logger.error("Zillow RapidAPI host is not set in configuration")
     
+    def close(self) -> None:
+        """
+        Close the client's HTTP session and its pooled connections.
+        """
+        self.session.close()
+    
     def _make_request(
         self, 
         method: str, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None, 
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the Zillow API.
@@ -60,6 +171,8 @@ class ZillowApiClient:
             endpoint: API endpoint path
             params: Query parameters for the request
             headers: Additional headers to include
+            object_hook: Optional json object_hook applied to each decoded
+                JSON object, innermost first
             
         Returns:
             Dict containing the parsed JSON response
@@ -69,41 +182,38 @@ class ZillowApiClient:
         """
         url = f"{self.base_url}/{endpoint}"
         
-        # Prepare default headers
-        default_headers = {
-            "X-RapidAPI-Key": self.api_key,
-            "X-RapidAPI-Host": self.rapidapi_host
-        }
-        
-        # Merge with any custom headers
-        if headers:
-            default_headers.update(headers)
-        
-        self.logger.debug(f"Making {method} request to {url}")
+        self.logger.debug("Making %s request to %s", method, url)
         
         try:
-            response = requests.request(
+            # Authentication headers live on the session; custom headers are merged in
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=default_headers,
+                headers=headers,
                 params=params,
                 timeout=15  # 15 seconds timeout
             )
             
+            # The body is read once and only ever handled as bytes; it is
+            # decoded to text just for error messages
+            status_code = response.status_code
+            body = response.content
+            
             # Check for HTTP errors
-            if response.status_code >= 400:
-                error_message = f"API request failed with status {response.status_code}: {response.text}"
+            if status_code >= 400:
+                error_message = f"API request failed with status {status_code}: {_body_preview(body)}"
                 self.logger.error(error_message)
                 raise APIError(error_message)
             
-            # Parse JSON response
+            # Parse the raw body bytes; json detects the UTF encoding itself,
+            # so no decoded copy of the body is built first
             try:
-                response_data = response.json()
+                response_data = json.loads(body, object_hook=object_hook)
                 return response_data
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 error_message = f"Failed to parse API response as JSON: {e}"
                 self.logger.error(error_message)
-                self.logger.debug(f"Response content: {response.text[:500]}...")
+                self.logger.debug("Response content: %s...", _body_preview(body))
                 raise APIError(error_message)
                 
         except requests.exceptions.RequestException as e:
@@ -111,18 +221,19 @@ class ZillowApiClient:
             self.logger.error(error_message)
             raise APIError(error_message)
     
-    def get_listings_by_zip(self, zip_code: str) -> List[Dict[str, Any]]:
+    def get_listings_by_zip(self, zip_code: str) -> List[Listing]:
         """
         Fetch property listings for a specific ZIP code.
         
+        Listings fetched successfully are reused for repeat lookups of the same
+        ZIP code for LISTINGS_CACHE_TTL_SECONDS; failed lookups are not cached.
+        
         Args:
             zip_code: The ZIP code to search for listings
             
         Returns:
-            List of dictionaries containing property listing details
+            List of Listing records with the property listing details
         """
-        self.logger.info(f"Fetching Zillow listings for ZIP code: {zip_code}")
-        
         # Define the endpoint for listings by ZIP code
         # Note: This is a placeholder and may need adjustment based on the actual RapidAPI endpoint
         endpoint = "propertyExtendedSearch"
@@ -134,9 +245,20 @@ class ZillowApiClient:
             "sort": "price_high_to_low"  # Sort from highest to lowest price
         }
         
+        # Reuse listings fetched recently for the same search
+        cache_key = (zip_code, params["home_type"], params["sort"])
+        cached = self._listings_cache.get(cache_key)
+        if cached is not None and time.time() - cached[0] < self.LISTINGS_CACHE_TTL_SECONDS:
+            self.logger.info("Using cached Zillow listings for ZIP code: %s", zip_code)
+            return list(cached[1])
+        
+        self.logger.info("Fetching Zillow listings for ZIP code: %s", zip_code)
+        
         try:
-            # Make the API request
-            response_data = self._make_request("GET", endpoint, params=params)
+            # Make the API request; listings are trimmed to the fields used
+            # below as they are decoded, so the full listing objects are
+            # never all held in memory at once
+            response_data = self._make_request("GET", endpoint, params=params, object_hook=_trim_listing)
             
             # Parse the listings from the response
             # Note: The actual response structure may differ; this is an educated guess
@@ -146,42 +268,47 @@ class ZillowApiClient:
                 raw_listings = response_data.get("results", [])
                 
                 if not raw_listings:
-                    self.logger.warning(f"No listings found for ZIP code {zip_code}")
+                    self.logger.warning("No listings found for ZIP code %s", zip_code)
+                    self._listings_cache[cache_key] = (time.time(), [])
                     return []
                 
                 # Process the listings to extract relevant fields
-                processed_listings = []
+                processed_listings: List[Listing] = []
                 for listing in raw_listings:
-                    # Extract the fields we're interested in
-                    processed_listing = {
-                        "address": listing.get("address"),
-                        "price": listing.get("price"),
-                        "bedrooms": listing.get("bedrooms"),
-                        "bathrooms": listing.get("bathrooms"),
-                        "sqft": listing.get("livingArea"),
-                        "home_type": listing.get("homeType", "Unknown"),
-                        "year_built": listing.get("yearBuilt"),
-                        "zillow_url": listing.get("detailUrl"),
-                        "zpid": listing.get("zpid"),  # Zillow Property ID
-                        "images": listing.get("imgSrc")
-                    }
-                    
                     # Filter out listings that don't have essential data
-                    if all(processed_listing.get(key) is not None for key in ["address", "price", "bedrooms"]):
-                        processed_listings.append(processed_listing)
-                    else:
-                        self.logger.debug(f"Skipping listing due to missing essential data: {listing.get('zpid')}")
+                    # before building anything for them
+                    address = listing.get("address")
+                    price = listing.get("price")
+                    bedrooms = listing.get("bedrooms")
+                    if address is None or price is None or bedrooms is None:
+                        self.logger.debug("Skipping listing due to missing essential data: %s", listing.get('zpid'))
+                        continue
+                    
+                    # Extract the fields we're interested in
+                    processed_listings.append(Listing(
+                        address=address,
+                        price=price,
+                        bedrooms=bedrooms,
+                        bathrooms=listing.get("bathrooms"),
+                        sqft=listing.get("livingArea"),
+                        home_type=listing.get("homeType", "Unknown"),
+                        year_built=listing.get("yearBuilt"),
+                        zillow_url=listing.get("detailUrl"),
+                        zpid=listing.get("zpid"),  # Zillow Property ID
+                        images=listing.get("imgSrc")
+                    ))
                 
-                self.logger.info(f"Successfully parsed {len(processed_listings)} listings for ZIP code {zip_code}")
-                return processed_listings
+                self.logger.info("Successfully parsed %s listings for ZIP code %s", len(processed_listings), zip_code)
+                self._listings_cache[cache_key] = (time.time(), processed_listings)
+                return list(processed_listings)
                 
             except (KeyError, TypeError) as e:
-                self.logger.error(f"Failed to parse listings from response: {e}")
-                self.logger.debug(f"Response structure: {list(response_data.keys())}")
+                self.logger.error("Failed to parse listings from response: %s", e)
+                self.logger.debug("Response structure: %s", list(response_data.keys()))
                 return []
                 
         except APIError as e:
-            self.logger.error(f"Error fetching listings for ZIP code {zip_code}: {e}")
+            self.logger.error("Error fetching listings for ZIP code %s: %s", zip_code, e)
             return []
 
 
@@ -191,32 +318,73 @@ class RentCastApiClient:
     
     This class handles authentication, request building, error handling,
     response parsing, and caching for the RentCast API endpoints.
+    
+    Each new cache entry is appended to a JSON Lines journal next to the
+    cache file, which costs the same however large the cache is. The journal
+    is folded into the cache file (one full rewrite) after
+    CACHE_FLUSH_THRESHOLD new entries, on close(), and at interpreter exit;
+    entries still in the journal are replayed when the cache is loaded.
     """
     
+    # Number of journaled cache entries that triggers a rewrite of the cache file
+    CACHE_FLUSH_THRESHOLD = 25
+    
+    # One logger shared by all instances
+    logger = logging.getLogger(__name__)
+    
     def __init__(self) -> None:
         """
         Initialize the RentCast API client.
         
-        Retrieves API key and cache settings from configuration and sets up logging and cache.
+        Retrieves API key and cache settings from configuration and sets up the HTTP session and cache.
         """
         self.api_key = config.RENTCAST_API_KEY
         self.cache_file_path = config.RENTCAST_CACHE_FILE_PATH
+        self.journal_file_path = f"{self.cache_file_path}.log"
         self.cache_duration_seconds = config.RENTCAST_CACHE_DURATION_SECONDS
         self.base_url = "https://api.rentcast.io/v1"
-        self.logger = logging.getLogger(__name__)
+        
+        # Pooled session carrying the authentication headers
+        self.session = _create_session({
+            "X-Api-Key": self.api_key,
+            "Content-Type": "application/json"
+        })
         
         # Initialize cache storage
         self.cache_data: Dict[str, Any] = {}
+        self._dirty = False
+        self._pending_writes = 0
         
-        # Make sure the cache directory exists
+        # Serializes cache writes when estimates are fetched from several threads
+        self._cache_lock = threading.RLock()
+        
+        # Make sure the cache directory exists; saves rely on it from here on
         os.makedirs(os.path.dirname(self.cache_file_path), exist_ok=True)
         
         # Load the cache
         self._load_cache()
         
+        # Flush unsaved cache entries at interpreter exit
+        _open_rentcast_clients.add(self)
+        
         if not self.api_key:
             self.logger.error("RentCast API key is not set in configuration")
     
+    def close(self) -> None:
+        """
+        Save any unsaved cache entries and close the client's HTTP session.
+        """
+        self.flush_cache()
+        self.session.close()
+    
+    def flush_cache(self) -> None:
+        """
+        Save the cache file if it has entries that were not written yet.
+        """
+        with self._cache_lock:
+            if self._dirty:
+                self._save_cache()
+    
     def _load_cache(self) -> None:
         """
         Load cached data from the cache file.
@@ -225,73 +393,173 @@ class RentCastApiClient:
         """
         try:
             if os.path.exists(self.cache_file_path):
-                with open(self.cache_file_path, 'r') as f:
-                    self.cache_data = json.load(f)
-                self.logger.debug(f"Loaded cache from {self.cache_file_path} with {len(self.cache_data)} entries")
+                # Parse the raw bytes in one call rather than through a text stream
+                with open(self.cache_file_path, 'rb') as f:
+                    self.cache_data = json.loads(f.read())
+                self.logger.debug("Loaded cache from %s with %s entries", self.cache_file_path, len(self.cache_data))
             else:
-                self.logger.info(f"Cache file {self.cache_file_path} does not exist. Starting with empty cache.")
+                self.logger.info("Cache file %s does not exist. Starting with empty cache.", self.cache_file_path)
         except FileNotFoundError:
-            self.logger.info(f"Cache file {self.cache_file_path} not found. Starting with empty cache.")
-        except json.JSONDecodeError as e:
+            self.logger.info("Cache file %s not found. Starting with empty cache.", self.cache_file_path)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             # If the cache file is corrupted, back it up and start with an empty cache
-            backup_path = f"{self.cache_file_path}.bak.{int(datetime.datetime.now().timestamp())}"
+            backup_path = f"{self.cache_file_path}.bak.{int(time.time())}"
             try:
                 os.rename(self.cache_file_path, backup_path)
-                self.logger.error(f"Cache file had invalid JSON: {e}. Backed up to {backup_path} and starting with empty cache.")
+                self.logger.error("Cache file had invalid JSON: %s. Backed up to %s and starting with empty cache.", e, backup_path)
             except OSError:
-                self.logger.error(f"Cache file had invalid JSON: {e}. Could not create backup. Starting with empty cache.")
+                self.logger.error("Cache file had invalid JSON: %s. Could not create backup. Starting with empty cache.", e)
             self.cache_data = {}
         except Exception as e:
-            self.logger.error(f"Error loading cache: {e}. Starting with empty cache.")
+            self.logger.error("Error loading cache: %s. Starting with empty cache.", e)
             self.cache_data = {}
+        
+        self._replay_journal()
     
-    def _save_cache(self) -> None:
+    def _replay_journal(self) -> None:
         """
-        Save the current cache data to the cache file.
+        Apply cache entries from the journal that were not yet saved to the cache file.
         
-        Creates the cache directory if it doesn't exist.
+        A malformed line (e.g. one cut short by a crash) is skipped. Replayed
+        entries are saved to the cache file on the next flush.
         """
         try:
-            # Ensure the directory exists
+            with open(self.journal_file_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.error("Error reading cache journal %s: %s", self.journal_file_path, e)
+            return
+        
+        replayed = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+                self.cache_data[record['key']] = {'timestamp': record['timestamp'], 'data': record['data']}
+                replayed += 1
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                self.logger.warning("Skipping malformed cache journal line in %s", self.journal_file_path)
+        
+        if replayed:
+            self._dirty = True
+            self._pending_writes = replayed
+            self.logger.debug("Replayed %s entries from cache journal %s", replayed, self.journal_file_path)
+    
+    def _journal_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Append new cache entries to the journal in a single write.
+        
+        Args:
+            entries: Cache key -> cache entry ('timestamp' and 'data')
+        """
+        payload = "".join(
+            json.dumps({'key': key, **entry}, separators=(',', ':')) + "\n"
+            for key, entry in entries.items()
+        ).encode('utf-8')
+        try:
+            self._write_cache_path(self.journal_file_path, payload, 'ab')
+        except OSError as e:
+            # The entries stay in memory and are saved with the next full write
+            self.logger.error("Error appending to cache journal %s: %s", self.journal_file_path, e)
+    
+    def _add_cache_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Add new entries to the cache and record them on disk.
+        
+        The entries are journaled; the cache file itself is rewritten once
+        CACHE_FLUSH_THRESHOLD entries have accumulated.
+        
+        Args:
+            entries: Cache key -> cache entry ('timestamp' and 'data')
+        """
+        with self._cache_lock:
+            self.cache_data.update(entries)
+            self._journal_entries(entries)
+            self._dirty = True
+            self._pending_writes += len(entries)
+            if self._pending_writes >= self.CACHE_FLUSH_THRESHOLD:
+                self._save_cache()
+    
+    def _write_cache_path(self, path: str, payload: bytes, mode: str) -> None:
+        """
+        Write bytes to a file in the cache directory.
+        
+        The directory is created in __init__ and not checked on every write;
+        if it has since been removed, it is created again and the write retried.
+        
+        Args:
+            path: File to write
+            payload: Bytes to write
+            mode: File mode ('wb' or 'ab')
+        """
+        try:
+            with open(path, mode) as f:
+                f.write(payload)
+        except FileNotFoundError:
+            self.logger.warning("Cache directory for %s is missing, recreating it", path)
             os.makedirs(os.path.dirname(self.cache_file_path), exist_ok=True)
-            
-            # Write the cache data to the file
-            with open(self.cache_file_path, 'w') as f:
-                json.dump(self.cache_data, f, indent=4)
-            
-            self.logger.debug(f"Saved {len(self.cache_data)} entries to cache file {self.cache_file_path}")
-        except IOError as e:
-            self.logger.error(f"Error saving cache to {self.cache_file_path}: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error saving cache: {e}")
+            with open(path, mode) as f:
+                f.write(payload)
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
+    def _save_cache(self) -> None:
+        """
+        Save the current cache data to the cache file and clear the journal.
+        
+        The data is written to a temporary file that then replaces the cache
+        file, so an interrupted write never leaves a truncated cache behind.
+        """
+        with self._cache_lock:
+            try:
+                # Write the cache data to a temporary file and swap it in
+                # Compact separators keep the file (and the bytes written) small
+                tmp_path = f"{self.cache_file_path}.tmp"
+                payload = json.dumps(self.cache_data, separators=(',', ':')).encode('utf-8')
+                self._write_cache_path(tmp_path, payload, 'wb')
+                os.replace(tmp_path, self.cache_file_path)
+                
+                # Everything in the journal is now in the cache file
+                try:
+                    os.remove(self.journal_file_path)
+                except FileNotFoundError:
+                    pass
+                
+                self._dirty = False
+                self._pending_writes = 0
+                self.logger.debug("Saved %s entries to cache file %s", len(self.cache_data), self.cache_file_path)
+            except IOError as e:
+                self.logger.error("Error saving cache to %s: %s", self.cache_file_path, e)
+            except Exception as e:
+                self.logger.error("Unexpected error saving cache: %s", e)
+    
+    def _is_cache_valid(self, cache_key: str, now: Optional[float] = None) -> bool:
         """
         Check if a cache entry is valid (exists and not expired).
         
         Args:
             cache_key: The key to check in the cache
+            now: Current Unix time; callers checking many keys pass one
+                snapshot instead of reading the clock per key
             
         Returns:
             True if the entry exists and is not expired, False otherwise
         """
-        if cache_key not in self.cache_data:
+        cache_entry = self.cache_data.get(cache_key)
+        if cache_entry is None:
             return False
         
-        cache_entry = self.cache_data[cache_key]
-        
         # Check if the entry has the expected structure
         if not isinstance(cache_entry, dict) or 'timestamp' not in cache_entry or 'data' not in cache_entry:
-            self.logger.warning(f"Cache entry for {cache_key} has invalid structure")
+            self.logger.warning("Cache entry for %s has invalid structure", cache_key)
             return False
         
         # Check if the entry has expired
         timestamp = cache_entry['timestamp']
-        current_time = datetime.datetime.now().timestamp()
+        current_time = time.time() if now is None else now
         age = current_time - timestamp
         
         if age >= self.cache_duration_seconds:
-            self.logger.debug(f"Cache entry for {cache_key} has expired (age: {age:.1f}s, max: {self.cache_duration_seconds}s)")
+            self.logger.debug("Cache entry for %s has expired (age: %.1fs, max: %ss)", cache_key, age, self.cache_duration_seconds)
             return False
         
         return True
@@ -318,37 +586,37 @@ class RentCastApiClient:
         """
         url = f"{self.base_url}/{endpoint}"
         
-        # Prepare headers
-        headers = {
-            "X-Api-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-        
-        self.logger.debug(f"Making {method} request to {url}")
+        self.logger.debug("Making %s request to %s", method, url)
         
         try:
-            response = requests.request(
+            # Authentication headers live on the session
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=headers,
                 params=params,
                 timeout=15  # 15 seconds timeout
             )
             
+            # The body is read once and only ever handled as bytes; it is
+            # decoded to text just for error messages
+            status_code = response.status_code
+            body = response.content
+            
             # Check for HTTP errors
-            if response.status_code >= 400:
-                error_message = f"RentCast API request failed with status {response.status_code}: {response.text}"
+            if status_code >= 400:
+                error_message = f"RentCast API request failed with status {status_code}: {_body_preview(body)}"
                 self.logger.error(error_message)
                 raise APIError(error_message)
             
-            # Parse JSON response
+            # Parse the raw body bytes; json detects the UTF encoding itself,
+            # so no decoded copy of the body is built first
             try:
-                response_data = response.json()
+                response_data = json.loads(body)
                 return response_data
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 error_message = f"Failed to parse RentCast API response as JSON: {e}"
                 self.logger.error(error_message)
-                self.logger.debug(f"Response content: {response.text[:500]}...")
+                self.logger.debug("Response content: %s...", _body_preview(body))
                 raise APIError(error_message)
                 
         except requests.exceptions.RequestException as e:
@@ -356,9 +624,12 @@ class RentCastApiClient:
             self.logger.error(error_message)
             raise APIError(error_message)
     
-    def get_rent_estimate(self, zip_code: str, bedrooms: int) -> Optional[float]:
+    def _fetch_rent_estimate(self, zip_code: str, bedrooms: int) -> Optional[float]:
         """
-        Get the average rent estimate for a property in a specific ZIP code with the given number of bedrooms.
+        Fetch a rent estimate from the RentCast API, bypassing the cache.
+        
+        Does not read or write self.cache_data, so it is safe to call from
+        worker threads.
         
         Args:
             zip_code: The ZIP code to get the rent estimate for
@@ -367,18 +638,6 @@ class RentCastApiClient:
         Returns:
             The average rent estimate as a float, or None if the estimate couldn't be retrieved
         """
-        self.logger.info(f"Getting rent estimate for ZIP code {zip_code} with {bedrooms} bedrooms")
-        
-        # Create a unique cache key
-        cache_key = f"{zip_code}_{bedrooms}"
-        
-        # Check if we have a valid cached value
-        if self._is_cache_valid(cache_key):
-            cached_estimate = self.cache_data[cache_key]['data']
-            self.logger.info(f"Using cached rent estimate for {zip_code} with {bedrooms} bedrooms: ${cached_estimate:.2f}")
-            return cached_estimate
-        
-        # If not in cache or expired, fetch from API
         try:
             # Define the RentCast endpoint for rent estimates by ZIP code
             endpoint = "avm/rent/zipcode"
@@ -400,27 +659,113 @@ class RentCastApiClient:
                 rent_estimate = response_data.get('rent')
                 
                 if rent_estimate is None:
-                    self.logger.warning(f"No rent estimate found in response for ZIP {zip_code} with {bedrooms} bedrooms")
+                    self.logger.warning("No rent estimate found in response for ZIP %s with %s bedrooms", zip_code, bedrooms)
                     return None
                 
                 # Convert to float (may already be a number in the JSON)
-                rent_estimate_float = float(rent_estimate)
-                
-                # Cache the result
-                self.cache_data[cache_key] = {
-                    'timestamp': datetime.datetime.now().timestamp(),
-                    'data': rent_estimate_float
-                }
-                self._save_cache()
-                
-                self.logger.info(f"Fetched and cached rent estimate for {zip_code} with {bedrooms} bedrooms: ${rent_estimate_float:.2f}")
-                return rent_estimate_float
+                return float(rent_estimate)
                 
             except (KeyError, TypeError, ValueError) as e:
-                self.logger.error(f"Failed to parse rent estimate from response: {e}")
-                self.logger.debug(f"Response keys: {list(response_data.keys())}")
+                self.logger.error("Failed to parse rent estimate from response: %s", e)
+                self.logger.debug("Response keys: %s", list(response_data.keys()))
                 return None
                 
         except APIError as e:
-            self.logger.error(f"Error fetching rent estimate for ZIP {zip_code} with {bedrooms} bedrooms: {e}")
-            return None
\ No newline at end of file
+            self.logger.error("Error fetching rent estimate for ZIP %s with %s bedrooms: %s", zip_code, bedrooms, e)
+            return None
+    
+    def get_rent_estimate(self, zip_code: str, bedrooms: int) -> Optional[float]:
+        """
+        Get the average rent estimate for a property in a specific ZIP code with the given number of bedrooms.
+        
+        Args:
+            zip_code: The ZIP code to get the rent estimate for
+            bedrooms: The number of bedrooms in the property
+            
+        Returns:
+            The average rent estimate as a float, or None if the estimate couldn't be retrieved
+        """
+        self.logger.info("Getting rent estimate for ZIP code %s with %s bedrooms", zip_code, bedrooms)
+        
+        # Create a unique cache key
+        cache_key = f"{zip_code}_{bedrooms}"
+        
+        # Check if we have a valid cached value
+        if self._is_cache_valid(cache_key):
+            cached_estimate = self.cache_data[cache_key]['data']
+            self.logger.info("Using cached rent estimate for %s with %s bedrooms: $%.2f", zip_code, bedrooms, cached_estimate)
+            return cached_estimate
+        
+        # If not in cache or expired, fetch from API
+        rent_estimate = self._fetch_rent_estimate(zip_code, bedrooms)
+        if rent_estimate is None:
+            return None
+        
+        # Cache the result
+        self._add_cache_entries({
+            cache_key: {
+                'timestamp': time.time(),
+                'data': rent_estimate
+            }
+        })
+        
+        self.logger.info("Fetched and cached rent estimate for %s with %s bedrooms: $%.2f", zip_code, bedrooms, rent_estimate)
+        return rent_estimate
+    
+    def get_rent_estimates_bulk(
+        self,
+        pairs: List[Tuple[str, int]],
+        max_workers: int = 8
+    ) -> Dict[Tuple[str, int], Optional[float]]:
+        """
+        Get rent estimates for many (ZIP code, bedrooms) pairs at once.
+        
+        Cached estimates are returned directly; the remaining pairs are fetched
+        concurrently on a bounded thread pool. New estimates are added to the
+        cache once all fetches finish, with a single journal write.
+        
+        Args:
+            pairs: (zip_code, bedrooms) pairs to look up; duplicates are fetched once
+            max_workers: Maximum number of concurrent API requests, capped at
+                HTTP_POOL_MAXSIZE so every request reuses a pooled connection
+            
+        Returns:
+            Dictionary mapping each pair to its rent estimate, or None if the
+            estimate couldn't be retrieved
+        """
+        estimates: Dict[Tuple[str, int], Optional[float]] = {}
+        misses: List[Tuple[str, int]] = []
+        
+        # Resolve cache hits synchronously against one clock reading
+        now = time.time()
+        for pair in dict.fromkeys(pairs):
+            cache_key = f"{pair[0]}_{pair[1]}"
+            if self._is_cache_valid(cache_key, now):
+                estimates[pair] = self.cache_data[cache_key]['data']
+            else:
+                misses.append(pair)
+        
+        self.logger.info("Rent estimates: %s cached, %s to fetch", len(estimates), len(misses))
+        
+        if not misses:
+            return estimates
+        
+        # Fetch the misses concurrently; results are collected on this thread
+        with ThreadPoolExecutor(max_workers=min(max_workers, HTTP_POOL_MAXSIZE)) as executor:
+            fetched = list(executor.map(lambda pair: self._fetch_rent_estimate(*pair), misses))
+        
+        # Cache the new estimates in one pass and record them with one write
+        timestamp = time.time()
+        new_entries: Dict[str, Dict[str, Any]] = {}
+        for pair, rent_estimate in zip(misses, fetched):
+            estimates[pair] = rent_estimate
+            if rent_estimate is not None:
+                new_entries[f"{pair[0]}_{pair[1]}"] = {
+                    'timestamp': timestamp,
+                    'data': rent_estimate
+                }
+        
+        if new_entries:
+            self._add_cache_entries(new_entries)
+        
+        return estimates
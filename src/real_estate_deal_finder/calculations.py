@@ -5,8 +5,42 @@ This module contains pure functions for calculating mortgage payments,
 cash flow, and cash-on-cash return for rental property investments.
 """
 
+import functools
 import math
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=256)
+def _amortization_factor(interest_rate_decimal: float, loan_term_years: int) -> float:
+    """
+    Calculate the monthly payment per unit of loan, r(1+r)^n / [(1+r)^n - 1].
+    
+    The factor depends only on the rate and term, which are the same for every
+    property in a run, so it is cached rather than recomputed per property.
+    
+    Args:
+        interest_rate_decimal: The annual interest rate as a decimal (non-zero)
+        loan_term_years: The loan term in years (positive)
+        
+    Returns:
+        The amortization factor as a float
+        
+    Raises:
+        OverflowError, ValueError, ZeroDivisionError: If the factor cannot be computed
+    """
+    monthly_interest_rate = interest_rate_decimal / 12.0
+    number_of_payments = loan_term_years * 12
+    
+    # (1+r)^n - 1 is computed as expm1(n * log1p(r)), which avoids the
+    # rounding of 1+r and the cancellation in subtracting 1 at low rates
+    growth_minus_one = math.expm1(number_of_payments * math.log1p(monthly_interest_rate))
+    growth = growth_minus_one + 1.0
+    
+    numerator = monthly_interest_rate * growth
+    denominator = growth_minus_one
+    return numerator / denominator
 
 
 def calculate_monthly_mortgage(
@@ -59,13 +93,8 @@ def calculate_monthly_mortgage(
     
     # Standard mortgage calculation
     try:
-        monthly_interest_rate = interest_rate_decimal / 12.0
-        number_of_payments = loan_term_years * 12
-        
-        # Calculate monthly payment using the mortgage formula
-        numerator = monthly_interest_rate * math.pow(1 + monthly_interest_rate, number_of_payments)
-        denominator = math.pow(1 + monthly_interest_rate, number_of_payments) - 1
-        monthly_payment = loan_amount * (numerator / denominator)
+        # Calculate monthly payment using the (cached) mortgage formula factor
+        monthly_payment = loan_amount * _amortization_factor(interest_rate_decimal, loan_term_years)
         
         return monthly_payment
     except (OverflowError, ValueError, ZeroDivisionError):
@@ -141,4 +170,97 @@ def calculate_coc_return(
     # Convert to percentage
     coc_return_percent = coc_return_decimal * 100.0
     
-    return coc_return_percent
\ No newline at end of file
+    return coc_return_percent
+
+
+def calculate_monthly_mortgage_vec(
+    total_prices: np.ndarray,
+    down_payment_percent: float,
+    interest_rate_decimal: float,
+    loan_term_years: int
+) -> np.ndarray:
+    """
+    Calculate monthly mortgage payments for many properties at once.
+    
+    Vectorized counterpart of calculate_monthly_mortgage with the same edge
+    cases; None results become NaN.
+    
+    Args:
+        total_prices: Purchase prices of the properties (NaN where unknown)
+        down_payment_percent: The down payment as a decimal (e.g., 0.2 for 20%)
+        interest_rate_decimal: The annual interest rate as a decimal (e.g., 0.045 for 4.5%)
+        loan_term_years: The loan term in years
+        
+    Returns:
+        Array of monthly mortgage payments
+    """
+    loan_amounts = np.asarray(total_prices, dtype=np.float64) * (1.0 - down_payment_percent)
+    
+    # The payment per dollar borrowed is the same for every property
+    if loan_term_years <= 0:
+        monthly_payments = np.full(loan_amounts.shape, np.nan)
+    elif interest_rate_decimal == 0:
+        monthly_payments = loan_amounts / (loan_term_years * 12)
+    else:
+        try:
+            payment_factor = _amortization_factor(interest_rate_decimal, loan_term_years)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            payment_factor = np.nan
+        monthly_payments = loan_amounts * payment_factor
+    
+    # No loan means no payment; NaN loan amounts compare False and stay NaN
+    monthly_payments[loan_amounts <= 0] = 0.0
+    
+    return monthly_payments
+
+
+def calculate_cash_flow_vec(
+    monthly_rents: np.ndarray,
+    monthly_mortgages: np.ndarray,
+    monthly_expenses: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Calculate monthly cash flows for many properties at once.
+    
+    Vectorized counterpart of calculate_cash_flow; missing rents or mortgages
+    (NaN) give NaN cash flows.
+    
+    Args:
+        monthly_rents: The monthly rental incomes
+        monthly_mortgages: The monthly mortgage payments
+        monthly_expenses: The total monthly expenses, per property or shared
+        
+    Returns:
+        Array of monthly cash flows
+    """
+    cash_flows = np.subtract(monthly_rents, monthly_mortgages, dtype=np.float64)
+    cash_flows -= monthly_expenses
+    return cash_flows
+
+
+def calculate_coc_return_vec(
+    total_prices: np.ndarray,
+    down_payment_percent: float,
+    annual_cash_flows: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate cash-on-cash return percentages for many properties at once.
+    
+    Vectorized counterpart of calculate_coc_return; properties without a
+    positive cash investment get NaN.
+    
+    Args:
+        total_prices: Purchase prices of the properties
+        down_payment_percent: The down payment as a decimal (e.g., 0.2 for 20%)
+        annual_cash_flows: The annual cash flows (monthly cash flow * 12)
+        
+    Returns:
+        Array of cash-on-cash returns as percentages
+    """
+    cash_invested = np.asarray(total_prices, dtype=np.float64) * down_payment_percent
+    
+    coc_returns = np.full(cash_invested.shape, np.nan)
+    np.divide(annual_cash_flows, cash_invested, out=coc_returns, where=cash_invested > 0)
+    coc_returns *= 100.0
+    
+    return coc_returns
@@ -5,63 +5,137 @@ This module loads environment variables from a .env file and provides
 configuration settings for the application.
 """
 
+import dataclasses
 import os
-from typing import Optional, Dict, Any, cast
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Mapping, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# API Keys
-ZILLOW_API_KEY: str = os.getenv("ZILLOW_API_KEY", "")
-ZILLOW_RAPIDAPI_HOST: str = os.getenv("ZILLOW_RAPIDAPI_HOST", "zillow-com1.p.rapidapi.com")
-RENTCAST_API_KEY: str = os.getenv("RENTCAST_API_KEY", "")
+# Environment variable name, type and default (as it would appear in the
+# environment) for every setting
+_SCHEMA: Tuple[Tuple[str, Callable[[str], Any], str], ...] = (
+    # API Keys
+    ("ZILLOW_API_KEY", str, ""),
+    ("ZILLOW_RAPIDAPI_HOST", str, "zillow-com1.p.rapidapi.com"),
+    ("RENTCAST_API_KEY", str, ""),
+    
+    # Application Settings
+    ("LOG_LEVEL", str, "INFO"),
+    ("MAX_WORKERS", int, "4"),  # ZIP codes processed concurrently
+    
+    # Default Financial Parameters
+    ("DEFAULT_DOWN_PAYMENT_PERCENT", float, "20"),
+    ("DEFAULT_INTEREST_RATE", float, "7.5"),
+    ("DEFAULT_LOAN_TERM_YEARS", int, "30"),
+    ("DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT", float, "1.2"),
+    ("DEFAULT_ANNUAL_INSURANCE_PERCENT", float, "0.5"),
+    ("DEFAULT_MONTHLY_HOA", float, "0"),
+    ("DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT", float, "10"),
+    ("DEFAULT_MONTHLY_MAINTENANCE_PERCENT", float, "5"),
+    ("DEFAULT_MONTHLY_VACANCY_PERCENT", float, "5"),
+    ("DEFAULT_CLOSING_COST_PERCENT", float, "3"),
+    
+    # Filter Thresholds
+    ("MIN_CASH_FLOW", float, "100"),
+    ("MIN_CASH_ON_CASH_RETURN", float, "8"),
+    
+    # Caching
+    ("RENTCAST_CACHE_DAYS", int, "30"),
+    ("RENTCAST_CACHE_FILE_PATH", str, "data/rentcast_cache.json"),
+    ("RENTCAST_CACHE_DURATION_SECONDS", int, "2592000"),  # 30 days in seconds
+    
+    # Output
+    ("OUTPUT_DIRECTORY", str, "output"),
+    ("OUTPUT_FILENAME_PREFIX", str, "real_estate_deals"),
+)
 
-# Application Settings
-LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
-# Default Financial Parameters
-DEFAULT_DOWN_PAYMENT_PERCENT: float = float(os.getenv("DEFAULT_DOWN_PAYMENT_PERCENT", "20"))
-DEFAULT_INTEREST_RATE: float = float(os.getenv("DEFAULT_INTEREST_RATE", "7.5"))
-DEFAULT_LOAN_TERM_YEARS: int = int(os.getenv("DEFAULT_LOAN_TERM_YEARS", "30"))
-DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT: float = float(os.getenv("DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT", "1.2"))
-DEFAULT_ANNUAL_INSURANCE_PERCENT: float = float(os.getenv("DEFAULT_ANNUAL_INSURANCE_PERCENT", "0.5"))
-DEFAULT_MONTHLY_HOA: float = float(os.getenv("DEFAULT_MONTHLY_HOA", "0"))
-DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT: float = float(os.getenv("DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT", "10"))
-DEFAULT_MONTHLY_MAINTENANCE_PERCENT: float = float(os.getenv("DEFAULT_MONTHLY_MAINTENANCE_PERCENT", "5"))
-DEFAULT_MONTHLY_VACANCY_PERCENT: float = float(os.getenv("DEFAULT_MONTHLY_VACANCY_PERCENT", "5"))
-DEFAULT_CLOSING_COST_PERCENT: float = float(os.getenv("DEFAULT_CLOSING_COST_PERCENT", "3"))
+@dataclass(frozen=True)
+class Config:
+    """
+    Typed application settings.
+    
+    Field names match the environment variables they are read from.
+    """
+    
+    ZILLOW_API_KEY: str
+    ZILLOW_RAPIDAPI_HOST: str
+    RENTCAST_API_KEY: str
+    LOG_LEVEL: str
+    MAX_WORKERS: int
+    DEFAULT_DOWN_PAYMENT_PERCENT: float
+    DEFAULT_INTEREST_RATE: float
+    DEFAULT_LOAN_TERM_YEARS: int
+    DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT: float
+    DEFAULT_ANNUAL_INSURANCE_PERCENT: float
+    DEFAULT_MONTHLY_HOA: float
+    DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT: float
+    DEFAULT_MONTHLY_MAINTENANCE_PERCENT: float
+    DEFAULT_MONTHLY_VACANCY_PERCENT: float
+    DEFAULT_CLOSING_COST_PERCENT: float
+    MIN_CASH_FLOW: float
+    MIN_CASH_ON_CASH_RETURN: float
+    RENTCAST_CACHE_DAYS: int
+    RENTCAST_CACHE_FILE_PATH: str
+    RENTCAST_CACHE_DURATION_SECONDS: int
+    OUTPUT_DIRECTORY: str
+    OUTPUT_FILENAME_PREFIX: str
+    
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Config":
+        """
+        Read and convert every setting in one pass over the schema.
+        
+        Args:
+            environ: Environment mapping to read; defaults to os.environ
+            
+        Returns:
+            Config instance
+        """
+        if environ is None:
+            environ = os.environ
+        return cls(**{name: convert(environ.get(name, default)) for name, convert, default in _SCHEMA})
+    
+    def validate(self) -> Dict[str, str]:
+        """
+        Validate that all required configuration variables are set.
+        
+        Returns:
+            Dict[str, str]: Dictionary of missing or invalid configuration variables
+        """
+        issues: Dict[str, str] = {}
+        
+        if not self.ZILLOW_API_KEY:
+            issues["ZILLOW_API_KEY"] = "Missing Zillow API Key"
+        
+        if not self.ZILLOW_RAPIDAPI_HOST:
+            issues["ZILLOW_RAPIDAPI_HOST"] = "Missing Zillow RapidAPI Host"
+        
+        if not self.RENTCAST_API_KEY:
+            issues["RENTCAST_API_KEY"] = "Missing RentCast API Key"
+        
+        return issues
 
-# Filter Thresholds
-MIN_CASH_FLOW: float = float(os.getenv("MIN_CASH_FLOW", "100"))
-MIN_CASH_ON_CASH_RETURN: float = float(os.getenv("MIN_CASH_ON_CASH_RETURN", "8"))
 
-# Caching
-RENTCAST_CACHE_DAYS: int = int(os.getenv("RENTCAST_CACHE_DAYS", "30"))
-RENTCAST_CACHE_FILE_PATH: str = os.getenv("RENTCAST_CACHE_FILE_PATH", "data/rentcast_cache.json")
-RENTCAST_CACHE_DURATION_SECONDS: int = int(os.getenv("RENTCAST_CACHE_DURATION_SECONDS", "2592000"))  # 30 days in seconds
+CONFIG: Config = Config.from_env()
 
-# Output
-OUTPUT_DIRECTORY: str = os.getenv("OUTPUT_DIRECTORY", "output")
-OUTPUT_FILENAME_PREFIX: str = os.getenv("OUTPUT_FILENAME_PREFIX", "real_estate_deals")
+# Expose every setting as a module constant (config.MIN_CASH_FLOW, ...)
+# with the same name and value as its Config field
+globals().update(dataclasses.asdict(CONFIG))
 
 # Validate required configuration
 def validate_config() -> Dict[str, str]:
     """
     Validate that all required configuration variables are set.
     
+    Reads the CONFIG snapshot taken at import, not the module constants, so
+    patching e.g. config.ZILLOW_API_KEY does not change the result; patch
+    config.CONFIG (with dataclasses.replace) instead.
+    
     Returns:
         Dict[str, str]: Dictionary of missing or invalid configuration variables
     """
-    issues: Dict[str, str] = {}
-    
-    if not ZILLOW_API_KEY:
-        issues["ZILLOW_API_KEY"] = "Missing Zillow API Key"
-    
-    if not ZILLOW_RAPIDAPI_HOST:
-        issues["ZILLOW_RAPIDAPI_HOST"] = "Missing Zillow RapidAPI Host"
-    
-    if not RENTCAST_API_KEY:
-        issues["RENTCAST_API_KEY"] = "Missing RentCast API Key"
-    
-    return issues
\ No newline at end of file
+    return CONFIG.validate()
@@ -9,7 +9,6 @@ import argparse
 import logging
 import sys
 import os
-import re
 from typing import List, Dict, Any, Optional
 
 from src.real_estate_deal_finder import config
@@ -17,6 +16,8 @@ from src.real_estate_deal_finder import logging_config
 from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator
 from src.real_estate_deal_finder.output import save_results_to_csv
 
+logger = logging.getLogger(__name__)
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -45,43 +46,42 @@ def load_zip_codes(args: argparse.Namespace) -> List[str]:
     Returns:
         List of valid 5-digit ZIP codes
     """
-    logger = logging.getLogger(__name__)
     zip_codes_list: List[str] = []
     
     # Process ZIP codes from file
     if args.zipfile:
         try:
             with open(args.zipfile, 'r') as f:
-                # Read lines, strip whitespace, and filter out empty lines
-                raw_zip_codes = [line.strip() for line in f if line.strip()]
-                logger.info(f"Read {len(raw_zip_codes)} ZIP codes from file: {args.zipfile}")
+                # Read the whole file, strip each line once, and filter out empty lines
+                raw_zip_codes = [zip_code for zip_code in map(str.strip, f.read().splitlines()) if zip_code]
+                logger.info("Read %s ZIP codes from file: %s", len(raw_zip_codes), args.zipfile)
                 zip_codes_list.extend(raw_zip_codes)
         except FileNotFoundError:
-            logger.error(f"ZIP code file not found: {args.zipfile}")
+            logger.error("ZIP code file not found: %s", args.zipfile)
             return []
         except Exception as e:
-            logger.error(f"Error reading ZIP code file: {e}")
+            logger.error("Error reading ZIP code file: %s", e)
             return []
     
     # Process ZIP codes from command line
     elif args.zipcodes:
         # Split by comma and strip whitespace
-        raw_zip_codes = [z.strip() for z in args.zipcodes.split(',') if z.strip()]
-        logger.info(f"Received {len(raw_zip_codes)} ZIP codes from command line")
+        raw_zip_codes = [z for z in map(str.strip, args.zipcodes.split(',')) if z]
+        logger.info("Received %s ZIP codes from command line", len(raw_zip_codes))
         zip_codes_list.extend(raw_zip_codes)
     
     # Validate ZIP codes (must be 5 digits)
     valid_zip_codes = []
-    zip_pattern = re.compile(r'^\d{5}$')
     
     for zip_code in zip_codes_list:
-        if zip_pattern.match(zip_code):
+        # Exactly five ASCII digits (isdigit alone also accepts e.g. superscripts)
+        if len(zip_code) == 5 and zip_code.isascii() and zip_code.isdigit():
             valid_zip_codes.append(zip_code)
         else:
-            logger.warning(f"Invalid ZIP code format (must be 5 digits): {zip_code}")
+            logger.warning("Invalid ZIP code format (must be 5 digits): %s", zip_code)
     
     if len(valid_zip_codes) < len(zip_codes_list):
-        logger.warning(f"Filtered out {len(zip_codes_list) - len(valid_zip_codes)} invalid ZIP codes")
+        logger.warning("Filtered out %s invalid ZIP codes", len(zip_codes_list) - len(valid_zip_codes))
     
     return valid_zip_codes
 
@@ -93,8 +93,6 @@ def main() -> int:
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
-    # Initialize logger
-    logger = logging.getLogger(__name__)
     logger.info("Real Estate Deal Finder starting...")
     
     # Check for configuration issues
@@ -116,7 +114,7 @@ def main() -> int:
             logger.error("No valid ZIP codes provided or found. Exiting.")
             return 1
         
-        logger.info(f"Loaded {len(zip_codes)} valid ZIP codes to process.")
+        logger.info("Loaded %s valid ZIP codes to process.", len(zip_codes))
         
         # Create and run the orchestrator
         orchestrator = RealEstateOrchestrator()
@@ -127,12 +125,12 @@ def main() -> int:
         output_file_path = save_results_to_csv(filtered_results)
         
         if output_file_path:
-            logger.info(f"Successfully completed analysis. Results saved to: {output_file_path}")
+            logger.info("Successfully completed analysis. Results saved to: %s", output_file_path)
         else:
             logger.info("Analysis completed, but no properties met the criteria or an error occurred during saving.")
         
     except Exception as e:
-        logger.error(f"An error occurred during execution: {e}", exc_info=True)
+        logger.error("An error occurred during execution: %s", e, exc_info=True)
         return 1
     
     logger.info("Real Estate Deal Finder completed successfully")
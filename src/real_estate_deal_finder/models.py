@@ -0,0 +1,103 @@
+"""
+Data records shared across the Real Estate Deal Finder application.
+
+This module contains lightweight record types passed between the API
+clients, the orchestrator and the output code.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Listing:
+    """
+    A Zillow property listing with the fields used by the application.
+    
+    Listings are frozen because fetched listings are cached and shared
+    between lookups. As with PropertyRecord, __slots__ is written out (no
+    field has a default) so listings carry no per-instance dict.
+    
+    Attributes:
+        address: Full street address
+        price: Listing price
+        bedrooms: Number of bedrooms
+        bathrooms: Number of bathrooms, if known
+        sqft: Living area in square feet, if known
+        home_type: Zillow home type (e.g. "SINGLE_FAMILY")
+        year_built: Year the property was built, if known
+        zillow_url: Link to the listing on Zillow, if known
+        zpid: Zillow Property ID
+        images: Listing image URL, if known
+    """
+    __slots__ = (
+        'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 'home_type',
+        'year_built', 'zillow_url', 'zpid', 'images'
+    )
+    
+    address: str
+    price: float
+    bedrooms: int
+    bathrooms: Optional[float]
+    sqft: Optional[float]
+    home_type: str
+    year_built: Optional[int]
+    zillow_url: Optional[str]
+    zpid: Optional[str]
+    images: Optional[str]
+    
+    def __reduce__(self):
+        # Frozen instances without a __dict__ cannot be restored attribute by
+        # attribute, so copy and pickle rebuild them through __init__
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+
+@dataclass
+class PropertyRecord:
+    """
+    A property that met the investment criteria, with its financial metrics.
+    
+    Fields are in the order of the result columns, so a list of records
+    converts directly to a DataFrame with the same columns as before.
+    __slots__ is written out (no field has a default) so records carry no
+    per-instance dict; dataclass(slots=True) would need Python 3.10.
+    
+    Attributes:
+        address: Full street address
+        price: Listing price
+        bedrooms: Number of bedrooms
+        bathrooms: Number of bathrooms, if known
+        sqft: Living area in square feet, if known
+        year_built: Year the property was built, if known
+        property_type: Display name of the home type (e.g. "Single Family")
+        zillow_url: Link to the listing on Zillow, if known
+        estimated_rent: Estimated monthly rent
+        estimated_mortgage: Monthly mortgage payment
+        monthly_expenses: Monthly operating expenses
+        estimated_monthly_cash_flow: Monthly cash flow
+        estimated_annual_cash_flow: Annual cash flow
+        estimated_coc_return: Cash-on-cash return as a percentage
+        zip_code: ZIP code the property was found in
+    """
+    __slots__ = (
+        'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 'year_built',
+        'property_type', 'zillow_url', 'estimated_rent', 'estimated_mortgage',
+        'monthly_expenses', 'estimated_monthly_cash_flow',
+        'estimated_annual_cash_flow', 'estimated_coc_return', 'zip_code'
+    )
+    
+    address: str
+    price: float
+    bedrooms: int
+    bathrooms: Optional[float]
+    sqft: Optional[float]
+    year_built: Optional[int]
+    property_type: str
+    zillow_url: Optional[str]
+    estimated_rent: float
+    estimated_mortgage: float
+    monthly_expenses: float
+    estimated_monthly_cash_flow: float
+    estimated_annual_cash_flow: float
+    estimated_coc_return: float
+    zip_code: str
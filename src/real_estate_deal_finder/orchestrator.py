@@ -7,16 +7,66 @@ to find suitable rental properties based on specified criteria.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from src.real_estate_deal_finder import config
 from src.real_estate_deal_finder.api_clients import ZillowApiClient, RentCastApiClient
+from src.real_estate_deal_finder.models import Listing, PropertyRecord
 from src.real_estate_deal_finder.calculations import (
-    calculate_monthly_mortgage,
-    calculate_cash_flow,
-    calculate_coc_return
+    calculate_monthly_mortgage_vec,
+    calculate_cash_flow_vec,
+    calculate_coc_return_vec
 )
 
+# Listing fields validated for every listing, read in one call
+_LISTING_GATE = attrgetter('home_type', 'price', 'bedrooms')
+
+# Supported Zillow home types and their display names. The spellings Zillow
+# uses are matched directly; any other casing is matched after lowercasing.
+_HOME_TYPE_MAP = {
+    "SINGLE_FAMILY": "Single Family",
+    "SingleFamily": "Single Family",
+    "singlefamily": "Single Family",
+    "single_family": "Single Family",
+    "MULTI_FAMILY": "Multifamily",
+    "MultiFamily": "Multifamily",
+    "multifamily": "Multifamily",
+    "multi_family": "Multifamily",
+}
+
+
+def _parse_listing(listing: Listing) -> Optional[Tuple[float, int, str]]:
+    """
+    Check that a listing can be evaluated and convert its numeric fields.
+    
+    Args:
+        listing: Listing to check
+        
+    Returns:
+        (price, bedrooms, property type) tuple, or None if the home type is
+        unsupported or the price or bedrooms are missing, invalid or not positive
+    """
+    home_type, price, bedrooms = _LISTING_GATE(listing)
+    
+    property_type = _HOME_TYPE_MAP.get(home_type) or _HOME_TYPE_MAP.get(str(home_type).lower())
+    if property_type is None:
+        return None
+    
+    try:
+        price = float(price)
+        bedrooms = int(bedrooms)
+    except (ValueError, TypeError):
+        return None
+    
+    if price <= 0 or bedrooms <= 0:
+        return None
+    
+    return price, bedrooms, property_type
+
 
 class RealEstateOrchestrator:
     """
@@ -30,6 +80,9 @@ class RealEstateOrchestrator:
     4. Filtering properties based on investment criteria
     """
     
+    # One logger shared by all instances
+    logger = logging.getLogger(__name__)
+    
     def __init__(self) -> None:
         """
         Initialize the Real Estate Orchestrator.
@@ -49,211 +102,247 @@ class RealEstateOrchestrator:
         self.interest_rate_decimal = config.DEFAULT_INTEREST_RATE / 100.0  # Convert to decimal
         self.loan_term_years = config.DEFAULT_LOAN_TERM_YEARS
         
+        # Number of ZIP codes fetched concurrently
+        self.max_workers = config.MAX_WORKERS
+        
         # Calculate monthly expenses based on configuration
         # This is a simplification - a real implementation would calculate this per property
         self.monthly_expenses = 0.0  # Placeholder for property-specific calculation
         
-        # Initialize logger
-        self.logger = logging.getLogger(__name__)
+        # Every expense except the fixed HOA fee is a percentage of the price
+        # (rent-based costs use a placeholder rent of 0.8% of the price), so
+        # monthly expenses are price * _expense_rate + _monthly_hoa
+        monthly_tax_rate = config.DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT / 100.0 / 12.0
+        monthly_insurance_rate = config.DEFAULT_ANNUAL_INSURANCE_PERCENT / 100.0 / 12.0
+        rent_cost_percent = (
+            config.DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT +
+            config.DEFAULT_MONTHLY_MAINTENANCE_PERCENT +
+            config.DEFAULT_MONTHLY_VACANCY_PERCENT
+        )
+        self._expense_rate = monthly_tax_rate + monthly_insurance_rate + 0.008 * rent_cost_percent / 100.0
+        self._monthly_hoa = config.DEFAULT_MONTHLY_HOA
     
     def calculate_monthly_expenses(self, property_price: float) -> float:
         """
         Calculate total monthly expenses for a property.
         
+        Expenses are property tax, insurance, the HOA fee, and property
+        management, maintenance and vacancy as percentages of an estimated
+        rent of 0.8% of the price. All but the HOA fee scale with the price,
+        so they are folded into one rate when the orchestrator is created.
+        
         Args:
             property_price: The purchase price of the property
             
         Returns:
             Total monthly expenses as a float
         """
-        # Calculate annual property tax
-        annual_property_tax = property_price * (config.DEFAULT_ANNUAL_PROPERTY_TAX_PERCENT / 100.0)
-        monthly_property_tax = annual_property_tax / 12.0
-        
-        # Calculate annual insurance
-        annual_insurance = property_price * (config.DEFAULT_ANNUAL_INSURANCE_PERCENT / 100.0)
-        monthly_insurance = annual_insurance / 12.0
-        
-        # HOA fees (fixed amount per month)
-        monthly_hoa = config.DEFAULT_MONTHLY_HOA
-        
-        # These would typically be calculated based on the actual rent,
-        # but we need to estimate them before we have the rent figure
-        # For now, we'll use a placeholder calculation
-        estimated_rent = property_price * 0.008  # Rough estimate: 0.8% of property value as monthly rent
-        
-        # Property management (percentage of rent)
-        monthly_property_management = estimated_rent * (config.DEFAULT_MONTHLY_PROPERTY_MANAGEMENT_PERCENT / 100.0)
-        
-        # Maintenance (percentage of rent)
-        monthly_maintenance = estimated_rent * (config.DEFAULT_MONTHLY_MAINTENANCE_PERCENT / 100.0)
-        
-        # Vacancy (percentage of rent)
-        monthly_vacancy = estimated_rent * (config.DEFAULT_MONTHLY_VACANCY_PERCENT / 100.0)
-        
-        # Sum all monthly expenses
-        total_monthly_expenses = (
-            monthly_property_tax +
-            monthly_insurance +
-            monthly_hoa +
-            monthly_property_management +
-            monthly_maintenance +
-            monthly_vacancy
-        )
+        return property_price * self._expense_rate + self._monthly_hoa
+    
+    def calculate_monthly_expenses_vec(self, property_prices: np.ndarray) -> np.ndarray:
+        """
+        Calculate total monthly expenses for many properties at once.
+        
+        Vectorized counterpart of calculate_monthly_expenses with the same results.
         
-        return total_monthly_expenses
+        Args:
+            property_prices: Purchase prices of the properties
+            
+        Returns:
+            Array of total monthly expenses
+        """
+        return np.asarray(property_prices, dtype=np.float64) * self._expense_rate + self._monthly_hoa
     
-    def process_zip_codes(self, zip_codes: List[str]) -> List[Dict[str, Any]]:
+    def fetch_candidate_properties(self, zip_codes: List[str]) -> List[Dict[str, Any]]:
         """
-        Process a list of ZIP codes to find properties meeting investment criteria.
+        Fetch listings and rent estimates for a list of ZIP codes.
+        
+        This is the network-bound half of the pipeline. It validates listings
+        and attaches a rent estimate to each, but applies no financial
+        assumptions, so the result can be cached and re-evaluated cheaply.
+        Listings for all ZIP codes are fetched first; the rent estimates they
+        need are then fetched together, once per (ZIP code, bedrooms) pair.
         
         Args:
             zip_codes: List of ZIP codes to search
             
         Returns:
-            List of dictionaries containing details of properties that meet the criteria
+            List of dictionaries containing validated property details and rent estimates
         """
-        all_processed_properties: List[Dict[str, Any]] = []
+        # Phase 1: ZIP codes are independent and I/O-bound, so fetch and
+        # validate their listings concurrently; map() keeps the zip_codes order
+        workers = max(1, min(self.max_workers, len(zip_codes)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_zip_listings = list(executor.map(self._fetch_valid_listings, zip_codes))
         
-        # Iterate through each ZIP code
-        for zip_code in zip_codes:
-            self.logger.info(f"Processing ZIP code: {zip_code}")
-            
-            # Get listings from Zillow
-            listings = self.zillow_client.get_listings_by_zip(zip_code)
-            self.logger.info(f"Found {len(listings)} listings in {zip_code}")
-            
-            # Process each listing
-            for listing in listings:
-                # Extract core property data
-                home_type = listing.get('home_type', '').lower()
-                address = listing.get('address')
-                
-                # Extract and validate price
-                price = listing.get('price')
-                if price is None:
-                    self.logger.warning(f"Skipping property at {address}: Missing price")
-                    continue
-                
-                try:
-                    price = float(price)
-                    if price <= 0:
-                        self.logger.warning(f"Skipping property at {address}: Invalid price {price}")
-                        continue
-                except (ValueError, TypeError):
-                    self.logger.warning(f"Skipping property at {address}: Price is not a valid number")
-                    continue
-                
-                # Extract and validate bedrooms
-                bedrooms = listing.get('bedrooms')
-                if bedrooms is None:
-                    self.logger.warning(f"Skipping property at {address}: Missing bedrooms")
-                    continue
-                
-                try:
-                    bedrooms = int(bedrooms)
-                    if bedrooms <= 0:
-                        self.logger.warning(f"Skipping property at {address}: Invalid bedrooms {bedrooms}")
-                        continue
-                except (ValueError, TypeError):
-                    self.logger.warning(f"Skipping property at {address}: Bedrooms is not a valid number")
-                    continue
-                
-                # Filter property type
-                if home_type not in ("singlefamily", "multifamily"):
-                    self.logger.debug(f"Skipping property at {address}: Unsupported type {home_type}")
-                    continue
-                
-                property_type = "Single Family" if home_type == "singlefamily" else "Multifamily"
-                
-                # Additional property data
-                bathrooms = listing.get('bathrooms')
-                sqft = listing.get('sqft')
-                year_built = listing.get('year_built')
-                zillow_url = listing.get('zillow_url')
-                
-                # Get rent estimate from RentCast
-                rent_estimate = self.rentcast_client.get_rent_estimate(zip_code, bedrooms)
+        # Phase 2: fetch the rent estimate of every distinct (zip, bedrooms) pair in one batch
+        rent_pairs = list(dict.fromkeys(
+            (zip_code, bedrooms)
+            for zip_code, valid_listings in zip(zip_codes, per_zip_listings)
+            for _, _, bedrooms, _ in valid_listings
+        ))
+        rent_estimates = self.rentcast_client.get_rent_estimates_bulk(rent_pairs) if rent_pairs else {}
+        
+        # Phase 3: attach the rent estimates
+        candidate_properties: List[Dict[str, Any]] = []
+        for zip_code, valid_listings in zip(zip_codes, per_zip_listings):
+            for listing, price, bedrooms, property_type in valid_listings:
+                rent_estimate = rent_estimates.get((zip_code, bedrooms))
                 
                 if rent_estimate is None:
-                    self.logger.warning(f"Skipping property at {address}: Could not get rent estimate")
-                    continue
-                
-                # Calculate monthly expenses
-                monthly_expenses = self.calculate_monthly_expenses(price)
-                
-                # Calculate mortgage payment
-                monthly_mortgage = calculate_monthly_mortgage(
-                    price,
-                    self.down_payment_percent,
-                    self.interest_rate_decimal,
-                    self.loan_term_years
-                )
-                
-                if monthly_mortgage is None:
-                    self.logger.warning(f"Skipping property at {address}: Could not calculate mortgage payment")
+                    self.logger.warning("Skipping property at %s: Could not get rent estimate", listing.address)
                     continue
                 
-                # Calculate cash flow
-                monthly_cash_flow = calculate_cash_flow(
-                    rent_estimate,
-                    monthly_mortgage,
-                    monthly_expenses
-                )
-                
-                if monthly_cash_flow is None:
-                    self.logger.warning(f"Skipping property at {address}: Could not calculate cash flow")
-                    continue
-                
-                # Calculate annual cash flow and cash-on-cash return
-                annual_cash_flow = monthly_cash_flow * 12.0
-                
-                coc_return = calculate_coc_return(
-                    price,
-                    self.down_payment_percent,
-                    annual_cash_flow
-                )
-                
-                if coc_return is None:
-                    self.logger.warning(f"Skipping property at {address}: Could not calculate CoC return")
-                    continue
-                
-                # Create property data dictionary
-                property_data = {
-                    'address': address,
+                candidate_properties.append({
+                    'address': listing.address,
                     'price': price,
                     'bedrooms': bedrooms,
-                    'bathrooms': bathrooms,
-                    'sqft': sqft,
-                    'year_built': year_built,
+                    'bathrooms': listing.bathrooms,
+                    'sqft': listing.sqft,
+                    'year_built': listing.year_built,
                     'property_type': property_type,
-                    'zillow_url': zillow_url,
+                    'zillow_url': listing.zillow_url,
                     'estimated_rent': rent_estimate,
-                    'estimated_mortgage': monthly_mortgage,
-                    'monthly_expenses': monthly_expenses,
-                    'estimated_monthly_cash_flow': monthly_cash_flow,
-                    'estimated_annual_cash_flow': annual_cash_flow,
-                    'estimated_coc_return': coc_return,
                     'zip_code': zip_code
-                }
-                
-                all_processed_properties.append(property_data)
+                })
+        
+        # Persist rent estimates fetched during this run
+        self.rentcast_client.flush_cache()
+        
+        return candidate_properties
+    
+    def _fetch_valid_listings(self, zip_code: str) -> List[Tuple[Listing, float, int, str]]:
+        """
+        Fetch the listings of one ZIP code and keep those that can be evaluated.
+        
+        Runs on a worker thread of fetch_candidate_properties.
+        
+        Args:
+            zip_code: ZIP code to search
             
-            self.logger.info(f"Finished processing listings for ZIP code: {zip_code}")
+        Returns:
+            List of (listing, price, bedrooms, property type) tuples, with the
+            price and bedrooms converted to numbers
+        """
+        valid_listings: List[Tuple[Listing, float, int, str]] = []
+        
+        self.logger.info("Processing ZIP code: %s", zip_code)
+        
+        # Get listings from Zillow
+        listings = self.zillow_client.get_listings_by_zip(zip_code)
+        self.logger.info("Found %s listings in %s", len(listings), zip_code)
         
-        # Filter properties based on criteria
-        self.logger.info(f"Processed {len(all_processed_properties)} total properties across all ZIP codes. Now filtering...")
+        # Bind what the loop calls per listing once
+        log_debug = self.logger.debug
+        add_listing = valid_listings.append
         
-        filtered_properties = []
-        for prop in all_processed_properties:
-            coc = prop.get('estimated_coc_return')
-            cf = prop.get('estimated_monthly_cash_flow')
+        # Process each listing
+        for listing in listings:
+            parsed = _parse_listing(listing)
+            if parsed is None:
+                log_debug(
+                    "Skipping property at %s: Unsupported type or invalid price/bedrooms (%s, %s, %s)",
+                    listing.address, listing.home_type, listing.price, listing.bedrooms
+                )
+                continue
             
-            passes_coc = coc is not None and coc >= self.min_coc_return
-            passes_cf = cf is not None and cf >= self.min_cash_flow
+            add_listing((listing, *parsed))
+        
+        self.logger.info("Finished processing listings for ZIP code: %s", zip_code)
+        
+        return valid_listings
+    
+    def evaluate_properties(self, candidate_properties: List[Dict[str, Any]]) -> List[PropertyRecord]:
+        """
+        Calculate financial metrics for candidate properties and apply the filter criteria.
+        
+        This step makes no API calls and uses the orchestrator's current
+        financial assumptions and thresholds. The metrics are computed for
+        all candidates at once with NumPy, and result records are only
+        built for the properties that pass the criteria.
+        
+        Args:
+            candidate_properties: Properties as returned by fetch_candidate_properties
             
-            if passes_coc and passes_cf:
-                filtered_properties.append(prop)
+        Returns:
+            List of records for the properties that meet the criteria
+        """
+        count = len(candidate_properties)
+        
+        # Screen all candidates at once: one array per metric, indexed like candidate_properties
+        prices = np.fromiter(map(itemgetter('price'), candidate_properties), dtype=np.float64, count=count)
+        rents = np.fromiter(map(itemgetter('estimated_rent'), candidate_properties), dtype=np.float64, count=count)
+        expenses = self.calculate_monthly_expenses_vec(prices)
+        
+        # Calculate mortgage payments, cash flows and cash-on-cash returns (NaN where not computable)
+        mortgages = calculate_monthly_mortgage_vec(
+            prices,
+            self.down_payment_percent,
+            self.interest_rate_decimal,
+            self.loan_term_years
+        )
+        cash_flows = calculate_cash_flow_vec(rents, mortgages, expenses)
+        annual_cash_flows = cash_flows * 12.0
+        coc_returns = calculate_coc_return_vec(prices, self.down_payment_percent, annual_cash_flows)
+        
+        for i in np.flatnonzero(np.isnan(coc_returns)).tolist():
+            address = candidate_properties[i]['address']
+            if np.isnan(mortgages[i]):
+                self.logger.warning("Skipping property at %s: Could not calculate mortgage payment", address)
+            elif np.isnan(cash_flows[i]):
+                self.logger.warning("Skipping property at %s: Could not calculate cash flow", address)
+            else:
+                self.logger.warning("Skipping property at %s: Could not calculate CoC return", address)
+        
+        # Filter properties based on criteria; NaN metrics never pass
+        processed_count = count - int(np.count_nonzero(np.isnan(coc_returns)))
+        self.logger.info("Processed %s total properties across all ZIP codes. Now filtering...", processed_count)
         
-        self.logger.info(f"Found {len(filtered_properties)} properties meeting the criteria.")
-        return filtered_properties
\ No newline at end of file
+        mask = (coc_returns >= self.min_coc_return) & (cash_flows >= self.min_cash_flow)
+        
+        # Only the properties that pass get a result record; the metric
+        # columns are converted to Python floats in one call each
+        passing = np.flatnonzero(mask)
+        filtered_properties = [
+            PropertyRecord(
+                address=candidate['address'],
+                price=candidate['price'],
+                bedrooms=candidate['bedrooms'],
+                bathrooms=candidate['bathrooms'],
+                sqft=candidate['sqft'],
+                year_built=candidate['year_built'],
+                property_type=candidate['property_type'],
+                zillow_url=candidate['zillow_url'],
+                estimated_rent=candidate['estimated_rent'],
+                estimated_mortgage=mortgage,
+                monthly_expenses=monthly_expenses,
+                estimated_monthly_cash_flow=cash_flow,
+                estimated_annual_cash_flow=annual_cash_flow,
+                estimated_coc_return=coc_return,
+                zip_code=candidate['zip_code']
+            )
+            for candidate, mortgage, monthly_expenses, cash_flow, annual_cash_flow, coc_return in zip(
+                [candidate_properties[i] for i in passing.tolist()],
+                mortgages[passing].tolist(),
+                expenses[passing].tolist(),
+                cash_flows[passing].tolist(),
+                annual_cash_flows[passing].tolist(),
+                coc_returns[passing].tolist()
+            )
+        ]
+        
+        self.logger.info("Found %s properties meeting the criteria.", len(filtered_properties))
+        return filtered_properties
+    
+    def process_zip_codes(self, zip_codes: List[str]) -> List[PropertyRecord]:
+        """
+        Process a list of ZIP codes to find properties meeting investment criteria.
+        
+        Args:
+            zip_codes: List of ZIP codes to search
+            
+        Returns:
+            List of records for the properties that meet the criteria
+        """
+        candidate_properties = self.fetch_candidate_properties(zip_codes)
+        return self.evaluate_properties(candidate_properties)
@@ -5,26 +5,107 @@ This module handles saving the filtered property results to a CSV file.
 """
 
 import csv
+import io
 import os
 import datetime
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple, Union, TextIO
 
 from src.real_estate_deal_finder import config
+from src.real_estate_deal_finder.models import PropertyRecord
 
+logger = logging.getLogger(__name__)
 
-def save_results_to_csv(results: List[Dict[str, Any]]) -> Optional[str]:
+
+def _format_money(value: Optional[float]) -> str:
+    """
+    Format a dollar amount for the CSV file, or "N/A" if it is missing.
+    """
+    return f"${value:.2f}" if value is not None else "N/A"
+
+
+def _format_percent(value: Optional[float]) -> str:
+    """
+    Format a percentage for the CSV file, or "N/A" if it is missing.
+    """
+    return f"{value:.2f}%" if value is not None else "N/A"
+
+
+# CSV columns: header, result key and formatter. Columns without a formatter
+# are written as-is, with "N/A" for missing keys.
+_FIELDS: Tuple[Tuple[str, str, Optional[Callable[[Optional[float]], str]]], ...] = (
+    ("Address", "address", None),
+    ("Price", "price", _format_money),
+    ("Beds", "bedrooms", None),
+    ("Estimated Rent", "estimated_rent", _format_money),
+    ("Estimated Mortgage", "estimated_mortgage", _format_money),
+    ("Estimated Monthly Cash Flow", "estimated_monthly_cash_flow", _format_money),
+    ("Estimated CoC Return", "estimated_coc_return", _format_percent),
+    ("Property Type", "property_type", None),
+    ("Zillow Link", "zillow_url", None),
+)
+
+# CSV Headers
+_HEADERS: List[str] = [header for header, _, _ in _FIELDS]
+
+# Buffer size for writing the CSV file (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Results with up to this many rows are built in memory and written in one call
+_IN_MEMORY_MAX_ROWS = 100_000
+
+
+def _format_rows(results: List[Union[PropertyRecord, Dict[str, Any]]]) -> Iterator[List[Any]]:
+    """
+    Yield the CSV row of each property, formatted in header order.
+    
+    Args:
+        results: Property records, or dictionaries with the same keys
+        
+    Yields:
+        List of column values for one property
+    """
+    for prop in results:
+        # Records are read by attribute, dictionaries by key
+        if isinstance(prop, dict):
+            get = prop.get
+        else:
+            get = functools.partial(getattr, prop)
+        
+        # Format each column from one lookup of its value
+        yield [
+            get(key, "N/A") if formatter is None else formatter(get(key, None))
+            for _, key, formatter in _FIELDS
+        ]
+
+
+def _write_csv(f: TextIO, results: List[Union[PropertyRecord, Dict[str, Any]]]) -> None:
+    """
+    Write the header and all property rows as CSV to a text stream.
+    
+    Args:
+        f: Text stream opened with newline=''
+        results: Property records, or dictionaries with the same keys
+    """
+    # Only fields containing delimiters, quotes or newlines (in practice addresses) are quoted
+    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(_HEADERS)
+    
+    # Write all property rows in one call
+    writer.writerows(_format_rows(results))
+
+
+def save_results_to_csv(results: List[Union[PropertyRecord, Dict[str, Any]]]) -> Optional[str]:
     """
     Save the filtered property results to a CSV file.
     
     Args:
-        results: List of dictionaries containing property details
+        results: Property records from the orchestrator, or dictionaries with the same keys
         
     Returns:
         The full path to the created CSV file, or None if an error occurred
     """
-    logger = logging.getLogger(__name__)
-    
     # Handle empty results
     if not results:
         logger.info("No properties met the criteria. No CSV file generated.")
@@ -36,9 +117,9 @@ def save_results_to_csv(results: List[Dict[str, Any]]) -> Optional[str]:
     # Create output directory if it doesn't exist
     try:
         os.makedirs(output_dir, exist_ok=True)
-        logger.debug(f"Output directory ensured: {output_dir}")
+        logger.debug("Output directory ensured: %s", output_dir)
     except OSError as e:
-        logger.error(f"Failed to create output directory {output_dir}: {e}")
+        logger.error("Failed to create output directory %s: %s", output_dir, e)
         return None
     
     # Generate filename with timestamp
@@ -47,48 +128,26 @@ def save_results_to_csv(results: List[Dict[str, Any]]) -> Optional[str]:
     filename = f"{filename_prefix}_{timestamp}.csv"
     full_path = os.path.join(output_dir, filename)
     
-    # CSV Headers
-    headers = [
-        "Address", 
-        "Price", 
-        "Beds", 
-        "Estimated Rent", 
-        "Estimated Mortgage", 
-        "Estimated Monthly Cash Flow", 
-        "Estimated CoC Return", 
-        "Property Type", 
-        "Zillow Link"
-    ]
-    
     # Write CSV file
     try:
-        with open(full_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            # Write each property row
-            for prop_dict in results:
-                # Prepare row data with proper formatting and handling None values
-                row_data = {
-                    "Address": prop_dict.get('address', 'N/A'),
-                    "Price": f"${prop_dict.get('price', 0.0):.2f}" if prop_dict.get('price') is not None else "N/A",
-                    "Beds": prop_dict.get('bedrooms', 'N/A'),
-                    "Estimated Rent": f"${prop_dict.get('estimated_rent', 0.0):.2f}" if prop_dict.get('estimated_rent') is not None else "N/A",
-                    "Estimated Mortgage": f"${prop_dict.get('estimated_mortgage', 0.0):.2f}" if prop_dict.get('estimated_mortgage') is not None else "N/A",
-                    "Estimated Monthly Cash Flow": f"${prop_dict.get('estimated_monthly_cash_flow', 0.0):.2f}" if prop_dict.get('estimated_monthly_cash_flow') is not None else "N/A",
-                    "Estimated CoC Return": f"{prop_dict.get('estimated_coc_return', 0.0):.2f}%" if prop_dict.get('estimated_coc_return') is not None else "N/A",
-                    "Property Type": prop_dict.get('property_type', 'N/A'),
-                    "Zillow Link": prop_dict.get('zillow_url', 'N/A')
-                }
-                
-                writer.writerow(row_data)
+        if len(results) <= _IN_MEMORY_MAX_ROWS:
+            # Build the whole file in memory, then write it in one call
+            buffer = io.StringIO(newline='')
+            _write_csv(buffer, results)
+            with open(full_path, 'w', newline='', encoding='utf-8') as f:
+                f.write(buffer.getvalue())
+        else:
+            # Very large results are streamed to keep peak memory down; a large
+            # buffer lets many rows go out in each write() call
+            with open(full_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                _write_csv(f, results)
         
-        logger.info(f"Successfully saved {len(results)} properties to {full_path}")
+        logger.info("Successfully saved %s properties to %s", len(results), full_path)
         return full_path
     
     except (IOError, PermissionError) as e:
-        logger.error(f"Failed to write CSV file {full_path}: {e}")
+        logger.error("Failed to write CSV file %s: %s", full_path, e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error writing CSV file {full_path}: {e}")
+        logger.error("Unexpected error writing CSV file %s: %s", full_path, e)
         return None
\ No newline at end of file
@@ -4,9 +4,11 @@ Pytest configuration file for Real Estate Deal Finder tests.
 This file contains fixtures and configuration settings for the test suite.
 """
 
+import json
 import os
 import pytest
-from unittest.mock import patch
+import requests
+from unittest.mock import DEFAULT, create_autospec, patch
 
 # Set test environment variables
 os.environ['ZILLOW_API_KEY'] = 'test_zillow_key'
@@ -15,10 +17,129 @@ os.environ['RENTCAST_API_KEY'] = 'test_rentcast_key'
 os.environ['RENTCAST_CACHE_FILE_PATH'] = 'tests/test_data/test_cache.json'
 os.environ['LOG_LEVEL'] = 'DEBUG'
 
+from src.real_estate_deal_finder.api_clients import ZillowApiClient, RentCastApiClient  # noqa: E402
+from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator  # noqa: E402
+
+# Recorded HTTP interactions replayed by the replay_cassette fixture
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
+# Static test data files
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# Monthly mortgage cases shared by the scalar and vectorized tests:
+# (total price, down payment, interest rate, loan term in years, expected payment or None)
+MORTGAGE_CASES = [
+    # $300,000 with 20% down, 4.5% interest, 30-year term is around $1216.04
+    pytest.param((300000, 0.20, 0.045, 30, 1216.04), id="basic"),
+    # 100% down payment: no loan
+    pytest.param((300000, 1.0, 0.045, 30, 0.0), id="zero_loan"),
+    # Interest-free loan: loan amount / number of months
+    pytest.param((300000, 0.20, 0.0, 30, (300000 * 0.8) / (30 * 12)), id="zero_interest"),
+    # Invalid loan terms
+    pytest.param((300000, 0.20, 0.045, 0, None), id="zero_term"),
+    pytest.param((300000, 0.20, 0.045, -10, None), id="negative_term"),
+    # Negative price gives a negative loan amount
+    pytest.param((-300000, 0.20, 0.045, 30, 0.0), id="negative_price")
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests that take a mortgage_case argument with MORTGAGE_CASES."""
+    if "mortgage_case" in metafunc.fixturenames:
+        metafunc.parametrize("mortgage_case", MORTGAGE_CASES)
+
+
+class ReplayAdapter(requests.adapters.BaseAdapter):
+    """
+    Transport adapter that answers requests from recorded interactions.
+    
+    Requests go through the real session (headers, query encoding, hooks) and
+    only the network I/O is replaced. Each request must match the method and
+    URL of the next recorded interaction.
+    """
+    
+    def __init__(self, interactions):
+        super().__init__()
+        self.interactions = list(interactions)
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        if not self.interactions:
+            raise AssertionError(f"No recorded interaction left for {request.method} {request.url}")
+        recorded = self.interactions.pop(0)
+        assert (request.method, request.url) == (recorded["request"]["method"], recorded["request"]["url"])
+        self.requests.append(request)
+        
+        response = requests.Response()
+        response.status_code = recorded["response"]["status"]
+        response.headers.update(recorded["response"]["headers"])
+        response._content = recorded["response"]["body"].encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def _client_patches():
+    """Patch the API client classes used by the orchestrator, once per test module."""
+    with patch.multiple('src.real_estate_deal_finder.orchestrator',
+                        ZillowApiClient=DEFAULT, RentCastApiClient=DEFAULT) as mock_clients:
+        yield mock_clients['ZillowApiClient'], mock_clients['RentCastApiClient']
+
+
+@pytest.fixture
+def patched_clients(_client_patches):
+    """Patched (ZillowApiClient, RentCastApiClient) classes, reset for each test."""
+    for mock_client in _client_patches:
+        mock_client.reset_mock(return_value=True, side_effect=True)
+    return _client_patches
+
 
 @pytest.fixture
+def zillow_mock(patched_clients):
+    """Autospecced ZillowApiClient instance returned by the patched class."""
+    mock_instance = create_autospec(ZillowApiClient, spec_set=True, instance=True)
+    patched_clients[0].return_value = mock_instance
+    return mock_instance
+
+
+@pytest.fixture
+def rentcast_mock(patched_clients):
+    """Autospecced RentCastApiClient instance returned by the patched class."""
+    mock_instance = create_autospec(RentCastApiClient, spec_set=True, instance=True)
+    patched_clients[1].return_value = mock_instance
+    return mock_instance
+
+
+@pytest.fixture
+def configured_orchestrator(zillow_mock, rentcast_mock):
+    """Orchestrator using the mocked clients, with fixed loan terms and criteria."""
+    orchestrator = RealEstateOrchestrator()
+    orchestrator.down_payment_percent = 0.20
+    orchestrator.interest_rate_decimal = 0.05
+    orchestrator.loan_term_years = 30
+    orchestrator.min_cash_flow = 100
+    orchestrator.min_coc_return = 5.0
+    return orchestrator
+
+
+@pytest.fixture
+def replay_cassette():
+    """Function mounting a recorded cassette from tests/cassettes on a client's session."""
+    def mount(client, name):
+        with open(os.path.join(CASSETTE_DIR, f"{name}.json"), "r", encoding="utf-8") as f:
+            adapter = ReplayAdapter(json.load(f)["interactions"])
+        client.session.mount("https://", adapter)
+        return adapter
+    return mount
+
+
+@pytest.fixture(scope="session")
 def mock_zillow_response():
-    """Sample Zillow API response for testing."""
+    """Sample Zillow API response for testing, built once and only read by tests."""
     return {
         "results": [
             {
@@ -47,9 +168,9 @@ def mock_zillow_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rentcast_response():
-    """Sample RentCast API response for testing."""
+    """Sample RentCast API response for testing, built once and only read by tests."""
     return {
         "rent": 4000.0
     }
@@ -77,42 +198,8 @@ def sample_property_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_filtered_results():
-    """List of properties that pass the filtering criteria."""
-    return [
-        {
-            "address": "123 Main St, Beverly Hills, CA 90210",
-            "price": 1200000,
-            "bedrooms": 3,
-            "bathrooms": 2,
-            "sqft": 2000,
-            "year_built": 1990,
-            "property_type": "Single Family",
-            "zillow_url": "https://www.zillow.com/homes/123456",
-            "estimated_rent": 7000,
-            "estimated_mortgage": 5000,
-            "monthly_expenses": 1000,
-            "estimated_monthly_cash_flow": 1000,
-            "estimated_annual_cash_flow": 12000,
-            "estimated_coc_return": 10.0,
-            "zip_code": "90210"
-        },
-        {
-            "address": "456 Oak Ave, Beverly Hills, CA 90210",
-            "price": 1500000,
-            "bedrooms": 4,
-            "bathrooms": 3,
-            "sqft": 2500,
-            "year_built": 1985,
-            "property_type": "Multifamily",
-            "zillow_url": "https://www.zillow.com/homes/654321",
-            "estimated_rent": 8000,
-            "estimated_mortgage": 6000,
-            "monthly_expenses": 1200,
-            "estimated_monthly_cash_flow": 800,
-            "estimated_annual_cash_flow": 9600,
-            "estimated_coc_return": 8.0,
-            "zip_code": "90210"
-        }
-    ]
\ No newline at end of file
+    """List of properties that pass the filtering criteria, loaded once and only read by tests."""
+    with open(os.path.join(DATA_DIR, "sample_results.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
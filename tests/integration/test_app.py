@@ -4,6 +4,8 @@ Integration tests for the Streamlit app.
 Tests for the app.py functionality using the Streamlit test library.
 """
 
+import json
+import random
 import pytest
 from unittest.mock import patch, MagicMock
 import pandas as pd
@@ -68,7 +70,353 @@ def test_format_percentage():
     assert format_percentage(pd.NA) == "N/A"
 
 
-@patch('app.RealEstateOrchestrator')
+def test_save_and_load_shortlist(tmp_path, monkeypatch):
+    """Test the shortlist round-trips through the atomic file write."""
+    import app
+    
+    shortlist_file = tmp_path / "data" / "shortlist.json"
+    monkeypatch.setattr(app, "SHORTLIST_FILE", str(shortlist_file))
+    shortlist = [{"address": "123 Main St", "link": "https://www.zillow.com/homes/123456", "notes": ""}]
+    
+    app.save_shortlist(shortlist)
+    
+    assert app.load_shortlist() == shortlist
+    assert not (tmp_path / "data" / "shortlist.json.tmp").exists()
+    
+    # Saving invalidates the cached load
+    shortlist.append({"address": "456 Oak Ave", "link": "https://www.zillow.com/homes/654321", "notes": ""})
+    app.save_shortlist(shortlist)
+    assert app.load_shortlist() == shortlist
+
+
+def test_save_shortlist_skips_render_caches(tmp_path, monkeypatch):
+    """Test the cached search key and display fields are not written to the file."""
+    import app
+    
+    shortlist_file = tmp_path / "shortlist.json"
+    monkeypatch.setattr(app, "SHORTLIST_FILE", str(shortlist_file))
+    item = {"Address": "123 Main St", "Price": 300000.0, "link": "https://www.zillow.com/homes/123456", "notes": ""}
+    shortlist = [dict(item)]
+    app.address_search_key(shortlist[0])
+    app.shortlist_display_fields(shortlist[0])
+    
+    app.save_shortlist(shortlist)
+    
+    with open(shortlist_file, "r") as f:
+        assert json.load(f) == [item]
+    # The in-memory item keeps its caches
+    assert "_address_lc" in shortlist[0] and "_fmt" in shortlist[0]
+
+
+def test_address_search_key():
+    """Test the lowercased search key is computed once and cached on the item."""
+    from app import address_search_key
+    
+    item = {"Address": "123 Main St"}
+    assert address_search_key(item) == "123 main st"
+    assert item["_address_lc"] == "123 main st"
+    
+    # Raw orchestrator keys are supported as a fallback
+    assert address_search_key({"address": "456 Oak Ave"}) == "456 oak ave"
+
+
+def test_ensure_shortlist_link():
+    """Test shortlist items keep their link and linkless items get a stable one."""
+    from app import ensure_shortlist_link, LOCAL_LINK_PREFIX
+    
+    item = {"Address": "123 Main St", "link": "https://www.zillow.com/homes/123456"}
+    assert ensure_shortlist_link(item) == "https://www.zillow.com/homes/123456"
+    
+    item = {"Address": "456 Oak Ave", "link": None}
+    link = ensure_shortlist_link(item)
+    assert link.startswith(LOCAL_LINK_PREFIX)
+    assert item["link"] == link
+    assert ensure_shortlist_link(item) == link
+
+
+def test_shortlist_display_fields():
+    """Test shortlist card values are formatted once and cached on the item."""
+    from app import shortlist_display_fields
+    
+    item = {
+        "Address": "123 Main St", "Price": 1200000.0, "Beds": 3, "Baths": 2,
+        "Est. Rent": 7000.0, "Est. Mortgage": 5000.0,
+        "Monthly Cash Flow": 1000.0, "CoC Return %": 10.0
+    }
+    fmt = shortlist_display_fields(item)
+    
+    assert fmt["price"] == "$1,200,000.00"
+    assert fmt["cash_flow"] == "$1,000.00"
+    assert fmt["coc"] == "10.00%"
+    assert item["_fmt"] is fmt
+    
+    # Missing values fall back to placeholders
+    assert shortlist_display_fields({"address": "456 Oak Ave"})["rent"] == "N/A"
+
+
+def test_shortlist_table():
+    """Test the shortlist table keeps numeric columns and accepts either key naming."""
+    from app import shortlist_table
+    
+    items = [
+        {"Address": "123 Main St", "Price": 1200000.0, "CoC Return %": 10.0,
+         "link": "https://www.zillow.com/homes/123456", "notes": "Nice yard"},
+        {"address": "456 Oak Ave", "price": "N/A", "zillow_url": "https://www.zillow.com/homes/654321"}
+    ]
+    table = shortlist_table(items)
+    
+    assert list(table["Address"]) == ["123 Main St", "456 Oak Ave"]
+    assert table["Price"].iloc[0] == 1200000.0
+    assert pd.isna(table["Price"].iloc[1])
+    assert list(table["Zillow Link"]) == [
+        "https://www.zillow.com/homes/123456", "https://www.zillow.com/homes/654321"
+    ]
+    assert list(table["Notes"]) == ["Nice yard", ""]
+    
+    # Numeric columns are stored compactly
+    assert table["Price"].dtype == "Float32"
+    assert table["Beds"].dtype == "Int8"
+
+
+@pytest.fixture
+def shortlist_state():
+    """Empty bare-mode session state holding a shortlist of three properties."""
+    import streamlit as st
+    
+    st.session_state.clear()
+    st.session_state.shortlist = [
+        {"Address": f"{number} Main St", "Price": price, "link": f"https://www.zillow.com/homes/{number}", "notes": ""}
+        for number, price in [(1, 300000.0), (2, 500000.0), (3, 400000.0)]
+    ]
+    st.session_state.shortlist_links = {item["link"] for item in st.session_state.shortlist}
+    yield st.session_state
+    st.session_state.clear()
+
+
+def test_update_shortlist_note_patches_current_table(shortlist_state):
+    """Test a note edit patches the cached table only while it matches the shortlist."""
+    from app import cached_shortlist_table, update_shortlist_note
+    
+    table = cached_shortlist_table()
+    update_shortlist_note("https://www.zillow.com/homes/2", "Good schools")
+    assert shortlist_state.shortlist[1]["notes"] == "Good schools"
+    assert cached_shortlist_table() is table
+    assert list(table["Notes"]) == ["", "Good schools", ""]
+
+
+@pytest.mark.parametrize("change", ["add", "remove"])
+def test_update_shortlist_note_leaves_stale_table(shortlist_state, change):
+    """Test a note edit after the shortlist changed never patches the outdated table."""
+    from app import cached_shortlist_table, mark_shortlist_changed, remove_from_shortlist, update_shortlist_note
+    
+    stale_table = cached_shortlist_table().copy()
+    if change == "add":
+        shortlist_state.shortlist.append({"Address": "4 Main St", "link": "https://www.zillow.com/homes/4", "notes": ""})
+        mark_shortlist_changed()
+        edited_link = "https://www.zillow.com/homes/4"
+    else:
+        remove_from_shortlist("https://www.zillow.com/homes/1")
+        edited_link = "https://www.zillow.com/homes/3"
+    
+    # The edit lands on the item; the stale table is rebuilt on next use
+    update_shortlist_note(edited_link, "Needs a roof")
+    assert shortlist_state.shortlist_table_df.equals(stale_table)
+    table = cached_shortlist_table()
+    assert list(table["Address"]) == [item["Address"] for item in shortlist_state.shortlist]
+    assert table["Notes"].iloc[-1] == "Needs a roof"
+    assert (table["Notes"].iloc[:-1] == "").all()
+
+
+def test_shortlist_search_mask_matches_substring_search(shortlist_state):
+    """Test the buffered search marks exactly the items whose address contains the term."""
+    from app import shortlist_search_mask
+    
+    rng = random.Random(7)
+    words = ["Main", "St", "Oak", "Ave", "oak", "Elm", "Dr", "MAIN", "Apt 4", ""]
+    shortlist_state.shortlist = [
+        {"Address": " ".join(rng.choice(words) for _ in range(rng.randint(0, 4))), "link": f"link-{i}"}
+        for i in range(200)
+    ]
+    
+    for query in ["main", "oak", "st", "a", "apt 4", "elm dr", "ave oak", "zzz", " "]:
+        expected = [query in item["Address"].lower() for item in shortlist_state.shortlist]
+        assert shortlist_search_mask(query).tolist() == expected
+
+
+def test_shortlist_order_sorts_and_filters(shortlist_state):
+    """Test the cached order is highest value first, missing values last, and masked by search."""
+    from app import shortlist_order
+    
+    shortlist_state.shortlist.append({"Address": "4 Oak Ave", "Price": "N/A", "link": "https://www.zillow.com/homes/4"})
+    shortlist_state.shortlist.append({"Address": "5 Main St", "Price": 500000.0, "link": "https://www.zillow.com/homes/5"})
+    
+    # Ties keep shortlist order
+    assert shortlist_order("", "price").tolist() == [1, 4, 2, 0, 3]
+    assert shortlist_order("main", "price").tolist() == [1, 4, 2, 0]
+    assert shortlist_order("oak", "price").tolist() == [3]
+
+
+def test_shortlist_views_rebuilt_after_changes(shortlist_state):
+    """Test order and index caches follow adds, removals and clearing the shortlist."""
+    from app import mark_shortlist_changed, remove_from_shortlist, shortlist_index, shortlist_order
+    
+    assert shortlist_order("", "price").tolist() == [1, 2, 0]
+    assert shortlist_order("main", "price").tolist() == [1, 2, 0]
+    
+    # Add
+    shortlist_state.shortlist.append({"Address": "4 Oak Ave", "Price": 600000.0, "link": "https://www.zillow.com/homes/4"})
+    shortlist_state.shortlist_links.add("https://www.zillow.com/homes/4")
+    mark_shortlist_changed()
+    assert shortlist_order("", "price").tolist() == [3, 1, 2, 0]
+    assert shortlist_order("main", "price").tolist() == [1, 2, 0]
+    assert shortlist_index()["https://www.zillow.com/homes/4"] == 3
+    
+    # Remove goes through the index, which is rebuilt for the shorter list
+    remove_from_shortlist("https://www.zillow.com/homes/2")
+    assert [item["Address"] for item in shortlist_state.shortlist] == ["1 Main St", "3 Main St", "4 Oak Ave"]
+    assert "https://www.zillow.com/homes/2" not in shortlist_state.shortlist_links
+    assert shortlist_index() == {
+        "https://www.zillow.com/homes/1": 0,
+        "https://www.zillow.com/homes/3": 1,
+        "https://www.zillow.com/homes/4": 2
+    }
+    assert shortlist_order("", "price").tolist() == [2, 1, 0]
+    assert shortlist_order("main", "price").tolist() == [1, 0]
+    
+    # Removing an unknown link changes nothing
+    remove_from_shortlist("https://www.zillow.com/homes/2")
+    assert len(shortlist_state.shortlist) == 3
+    
+    # Clear, as the clear-all button does
+    shortlist_state.shortlist = []
+    shortlist_state.shortlist_links = set()
+    mark_shortlist_changed()
+    assert shortlist_order("", "price").tolist() == []
+    assert shortlist_order("main", "price").tolist() == []
+    assert shortlist_index() == {}
+
+
+def test_convert_df_to_csv():
+    """Test the CSV download payload."""
+    from app import convert_df_to_csv
+    
+    df = pd.DataFrame({"Address": ["123 Main St", "Café Row"], "Price": [1200000.0, 300000.5]})
+    
+    csv_bytes = convert_df_to_csv(df)
+    
+    assert isinstance(csv_bytes, bytes)
+    assert csv_bytes == df.to_csv(index=False).encode('utf-8')
+
+
+def test_results_to_df(sample_filtered_results):
+    """Test results are loaded with compact dtypes."""
+    from app import results_to_df
+    
+    results = sample_filtered_results + [{**sample_filtered_results[0], "year_built": None}]
+    df = results_to_df(results)
+    
+    assert isinstance(df["property_type"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["zip_code"].dtype, pd.CategoricalDtype)
+    assert df["year_built"].dtype == "Int16"
+    assert pd.isna(df["year_built"].iloc[-1])
+    
+    # Rows still convert back to plain values for the shortlist
+    row = df.iloc[-1].to_dict()
+    assert row["zip_code"] == sample_filtered_results[0]["zip_code"]
+    assert row["year_built"] is None
+
+
+def test_prepare_display_df(sample_filtered_results):
+    """Test building the results-grid DataFrame from raw results."""
+    from app import prepare_display_df
+    
+    results_df = pd.DataFrame(sample_filtered_results)
+    display_df = prepare_display_df(results_df)
+    
+    assert list(display_df.columns[:2]) == ["Select", "Address"]
+    assert not display_df["Select"].any()
+    assert list(display_df["link"]) == list(results_df["zillow_url"])
+    assert display_df["CoC Return %"].iloc[0] == 10.0
+    
+    # The raw results are left untouched
+    assert "Select" not in results_df.columns
+    assert "address" in results_df.columns
+
+
+def test_style_display_df():
+    """Test display formatting leaves the underlying data numeric."""
+    from app import style_display_df
+    
+    df = pd.DataFrame({
+        "Address": ["123 Main St", "456 Oak Ave"],
+        "Price": [1200000.0, None],
+        "CoC Return %": [10.0, 8.5]
+    })
+    
+    styler = style_display_df(df)
+    html = styler.to_html()
+    
+    assert "$1,200,000.00" in html
+    assert "N/A" in html
+    assert "8.50%" in html
+    assert df["Price"].dtype == float
+
+
+def test_recalculate_metrics_matches_scalar():
+    """Test the vectorized metric recalculation against the scalar calculations."""
+    from app import recalculate_metrics
+    from src.real_estate_deal_finder.calculations import (
+        calculate_monthly_mortgage,
+        calculate_cash_flow,
+        calculate_coc_return
+    )
+    
+    df = pd.DataFrame({
+        "price": [300000.0, 1200000.0, None],
+        "estimated_rent": [2500.0, 7000.0, 1500.0]
+    })
+    config_overrides = {
+        'interest_rate_decimal': 0.045,
+        'down_payment_percent': 0.20,
+        'loan_term_years': 30,
+        'monthly_expenses': 500.0
+    }
+    
+    result = recalculate_metrics(df, config_overrides)
+    
+    for i in range(2):
+        expected = calculate_monthly_mortgage(df['price'][i], 0.20, 0.045, 30)
+        assert result['estimated_mortgage'][i] == pytest.approx(expected)
+    assert pd.isna(result['estimated_mortgage'][2])
+    
+    # Cash flow and CoC return follow the scalar formulas
+    for i in range(2):
+        expected_cf = calculate_cash_flow(
+            df['estimated_rent'][i], result['estimated_mortgage'][i], 500.0
+        )
+        expected_coc = calculate_coc_return(df['price'][i], 0.20, expected_cf * 12)
+        assert result['estimated_monthly_cash_flow'][i] == pytest.approx(expected_cf)
+        assert result['estimated_annual_cash_flow'][i] == pytest.approx(expected_cf * 12)
+        assert result['estimated_coc_return'][i] == pytest.approx(expected_coc)
+    assert pd.isna(result['estimated_monthly_cash_flow'][2])
+    assert pd.isna(result['estimated_coc_return'][2])
+    
+    # The input frame is not modified
+    assert 'estimated_mortgage' not in df.columns
+    assert list(df['estimated_rent']) == [2500.0, 7000.0, 1500.0]
+    
+    # A rent adjustment scales the rent before expenses are taken out
+    result = recalculate_metrics(df, {**config_overrides, 'rent_adjustment_percent': 10.0})
+    expected_cf = calculate_cash_flow(2500.0 * 1.1, result['estimated_mortgage'][0], 500.0)
+    assert result['estimated_monthly_cash_flow'][0] == pytest.approx(expected_cf)
+    assert list(df['estimated_rent']) == [2500.0, 7000.0, 1500.0]
+    
+    # Zero interest falls back to simple division
+    result = recalculate_metrics(df, {**config_overrides, 'interest_rate_decimal': 0.0})
+    assert result['estimated_mortgage'][0] == pytest.approx(300000 * 0.8 / 360)
+
+
+@patch('src.real_estate_deal_finder.orchestrator.RealEstateOrchestrator')
 def test_streamlit_core_flow(mock_orchestrator_class):
     """Test the core workflow of the Streamlit app."""
     # Import here to avoid importing streamlit directly
@@ -5,170 +5,233 @@ Tests the RealEstateOrchestrator class and its interactions with API clients
 and calculation functions.
 """
 
+import numpy as np
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+from src.real_estate_deal_finder.models import Listing, PropertyRecord
 from src.real_estate_deal_finder.orchestrator import RealEstateOrchestrator
 
 
+def make_listing(address, price, bedrooms, **fields):
+    """Build a Listing, leaving the optional fields not given as None."""
+    optional = dict.fromkeys(["bathrooms", "sqft", "year_built", "zillow_url", "zpid", "images"])
+    optional.update(fields)
+    optional.setdefault("home_type", "Unknown")
+    return Listing(address=address, price=price, bedrooms=bedrooms, **optional)
+
+
+# Listings are frozen, so the same records are shared by all tests
+MAIN_ST_LISTING = make_listing(
+    address="123 Main St, Beverly Hills, CA 90210",
+    price=1200000,
+    bedrooms=3,
+    bathrooms=2,
+    sqft=2000,
+    year_built=1990,
+    home_type="singlefamily",
+    zillow_url="https://www.zillow.com/homes/123456"
+)
+
+OAK_AVE_LISTING = make_listing(
+    address="456 Oak Ave, Beverly Hills, CA 90210",
+    price=2000000,  # More expensive property
+    bedrooms=4,
+    bathrooms=3,
+    sqft=3000,
+    year_built=1985,
+    home_type="singlefamily",
+    zillow_url="https://www.zillow.com/homes/654321"
+)
+
+
 class TestRealEstateOrchestrator:
     """Integration tests for RealEstateOrchestrator."""
     
-    @patch('src.real_estate_deal_finder.orchestrator.ZillowApiClient')
-    @patch('src.real_estate_deal_finder.orchestrator.RentCastApiClient')
-    def test_process_zip_codes_empty(self, mock_rentcast_client, mock_zillow_client):
+    def test_process_zip_codes_empty(self, zillow_mock, rentcast_mock):
         """Test processing with empty ZIP code list."""
-        # Setup mocks
-        mock_zillow_instance = MagicMock()
-        mock_rentcast_instance = MagicMock()
-        mock_zillow_client.return_value = mock_zillow_instance
-        mock_rentcast_client.return_value = mock_rentcast_instance
-        
         # Create orchestrator and process empty list
         orchestrator = RealEstateOrchestrator()
         results = orchestrator.process_zip_codes([])
         
         # Verify no API calls were made
-        mock_zillow_instance.get_listings_by_zip.assert_not_called()
-        mock_rentcast_instance.get_rent_estimate.assert_not_called()
+        zillow_mock.get_listings_by_zip.assert_not_called()
+        rentcast_mock.get_rent_estimates_bulk.assert_not_called()
         
         # Verify empty results
         assert results == []
     
-    @patch('src.real_estate_deal_finder.orchestrator.ZillowApiClient')
-    @patch('src.real_estate_deal_finder.orchestrator.RentCastApiClient')
-    def test_process_zip_codes_no_zillow_listings(self, mock_rentcast_client, mock_zillow_client):
+    def test_process_zip_codes_no_zillow_listings(self, zillow_mock, rentcast_mock):
         """Test processing when Zillow returns no listings."""
         # Setup mocks
-        mock_zillow_instance = MagicMock()
-        mock_zillow_instance.get_listings_by_zip.return_value = []
-        mock_rentcast_instance = MagicMock()
-        mock_zillow_client.return_value = mock_zillow_instance
-        mock_rentcast_client.return_value = mock_rentcast_instance
+        zillow_mock.get_listings_by_zip.return_value = []
         
         # Create orchestrator and process list
         orchestrator = RealEstateOrchestrator()
         results = orchestrator.process_zip_codes(["90210"])
         
         # Verify Zillow API call was made
-        mock_zillow_instance.get_listings_by_zip.assert_called_once_with("90210")
+        zillow_mock.get_listings_by_zip.assert_called_once_with("90210")
         
         # Verify RentCast API call was not made
-        mock_rentcast_instance.get_rent_estimate.assert_not_called()
+        rentcast_mock.get_rent_estimates_bulk.assert_not_called()
         
         # Verify empty results
         assert results == []
     
-    @patch('src.real_estate_deal_finder.orchestrator.ZillowApiClient')
-    @patch('src.real_estate_deal_finder.orchestrator.RentCastApiClient')
-    def test_process_zip_codes_complete_flow(self, mock_rentcast_client, mock_zillow_client):
+    def test_process_zip_codes_complete_flow(self, configured_orchestrator, zillow_mock, rentcast_mock):
         """Test the complete processing flow with mock data."""
         # Setup Zillow mock
-        mock_zillow_instance = MagicMock()
-        mock_zillow_instance.get_listings_by_zip.return_value = [
-            {
-                "address": "123 Main St, Beverly Hills, CA 90210",
-                "price": 1200000,
-                "bedrooms": 3,
-                "bathrooms": 2,
-                "sqft": 2000,
-                "year_built": 1990,
-                "home_type": "singlefamily",
-                "zillow_url": "https://www.zillow.com/homes/123456"
-            }
-        ]
+        zillow_mock.get_listings_by_zip.return_value = [MAIN_ST_LISTING]
         
         # Setup RentCast mock
-        mock_rentcast_instance = MagicMock()
-        mock_rentcast_instance.get_rent_estimate.return_value = 7000  # $7000/month rent
-        
-        # Set up mock client instances
-        mock_zillow_client.return_value = mock_zillow_instance
-        mock_rentcast_client.return_value = mock_rentcast_instance
-        
-        # Create orchestrator with test parameters
-        orchestrator = RealEstateOrchestrator()
-        orchestrator.down_payment_percent = 0.20
-        orchestrator.interest_rate_decimal = 0.05
-        orchestrator.loan_term_years = 30
-        orchestrator.min_cash_flow = 100
-        orchestrator.min_coc_return = 5.0
+        rentcast_mock.get_rent_estimates_bulk.side_effect = lambda pairs: {pair: 7000 for pair in pairs}  # $7000/month rent
         
-        # Process ZIP codes
-        results = orchestrator.process_zip_codes(["90210"])
+        # Pin monthly expenses so the property clears the fixture's criteria:
+        # $7000 rent - ~$5154 mortgage - $100 expenses is ~$1746/month, ~8.7% CoC
+        with patch.object(configured_orchestrator, 'calculate_monthly_expenses_vec', return_value=np.array([100.0])):
+            results = configured_orchestrator.process_zip_codes(["90210"])
         
         # Verify Zillow API call was made
-        mock_zillow_instance.get_listings_by_zip.assert_called_once_with("90210")
+        zillow_mock.get_listings_by_zip.assert_called_once_with("90210")
         
         # Verify RentCast API call was made
-        mock_rentcast_instance.get_rent_estimate.assert_called_once_with("90210", 3)
+        rentcast_mock.get_rent_estimates_bulk.assert_called_once_with([("90210", 3)])
         
         # Verify results
         assert len(results) == 1
-        assert results[0]["address"] == "123 Main St, Beverly Hills, CA 90210"
-        assert results[0]["price"] == 1200000
-        assert results[0]["bedrooms"] == 3
-        assert results[0]["estimated_rent"] == 7000
-        assert "estimated_mortgage" in results[0]
-        assert "estimated_monthly_cash_flow" in results[0]
-        assert "estimated_coc_return" in results[0]
+        assert results[0].address == "123 Main St, Beverly Hills, CA 90210"
+        assert results[0].price == 1200000
+        assert results[0].bedrooms == 3
+        assert results[0].estimated_rent == 7000
+        assert isinstance(results[0], PropertyRecord)
+        assert results[0].estimated_mortgage is not None
+        assert results[0].estimated_monthly_cash_flow is not None
+        assert results[0].estimated_coc_return is not None
     
-    @patch('src.real_estate_deal_finder.orchestrator.ZillowApiClient')
-    @patch('src.real_estate_deal_finder.orchestrator.RentCastApiClient')
-    def test_process_zip_codes_filtering(self, mock_rentcast_client, mock_zillow_client):
+    @pytest.mark.parametrize("expenses,min_cash_flow,min_coc_return,expected_addresses", [
+        # Strict criteria: neither property passes
+        ((1000.0, 1500.0), 1000, 10.0, []),
+        # Only the cheaper property has positive cash flow
+        ((100.0, 150.0), 100, 0.0, ["123 Main St, Beverly Hills, CA 90210"]),
+        # Loose criteria: both pass
+        ((100.0, 150.0), -1000, -10.0, ["123 Main St, Beverly Hills, CA 90210", "456 Oak Ave, Beverly Hills, CA 90210"])
+    ], ids=["strict", "positive_cash_flow", "loose"])
+    def test_process_zip_codes_filtering(self, configured_orchestrator, zillow_mock, rentcast_mock,
+                                         expenses, min_cash_flow, min_coc_return, expected_addresses):
         """Test that properties are filtered based on criteria."""
         # Setup Zillow mock with two properties
-        mock_zillow_instance = MagicMock()
-        mock_zillow_instance.get_listings_by_zip.return_value = [
+        zillow_mock.get_listings_by_zip.return_value = [MAIN_ST_LISTING, OAK_AVE_LISTING]
+        
+        # Setup RentCast mock with a rent for each property
+        rentcast_mock.get_rent_estimates_bulk.side_effect = lambda pairs: dict(zip(pairs, [7000, 8500]))
+        
+        orchestrator = configured_orchestrator
+        orchestrator.min_cash_flow = min_cash_flow
+        orchestrator.min_coc_return = min_coc_return
+        
+        # Patch the calculate_monthly_expenses_vec method to return fixed values
+        with patch.object(orchestrator, 'calculate_monthly_expenses_vec', return_value=np.array(expenses)):
+            results = orchestrator.process_zip_codes(["90210"])
+        
+        # Verify API calls were made for both properties
+        assert zillow_mock.get_listings_by_zip.call_count == 1
+        rentcast_mock.get_rent_estimates_bulk.assert_called_once_with([("90210", 3), ("90210", 4)])
+        
+        # Verify exactly the expected properties passed, in listing order
+        assert [result.address for result in results] == expected_addresses
+        assert all(result.estimated_monthly_cash_flow >= min_cash_flow for result in results)
+        assert all(result.estimated_coc_return >= min_coc_return for result in results)
+    
+    def test_evaluate_properties_makes_no_api_calls(self, zillow_mock, rentcast_mock):
+        """Test that re-evaluating fetched candidates only recalculates metrics."""
+        candidates = [
             {
                 "address": "123 Main St, Beverly Hills, CA 90210",
-                "price": 1200000,
+                "price": 200000.0,
                 "bedrooms": 3,
                 "bathrooms": 2,
                 "sqft": 2000,
                 "year_built": 1990,
-                "home_type": "singlefamily",
-                "zillow_url": "https://www.zillow.com/homes/123456"
-            },
-            {
-                "address": "456 Oak Ave, Beverly Hills, CA 90210",
-                "price": 2000000,  # More expensive property
-                "bedrooms": 4,
-                "bathrooms": 3,
-                "sqft": 3000,
-                "year_built": 1985,
-                "home_type": "singlefamily",
-                "zillow_url": "https://www.zillow.com/homes/654321"
+                "property_type": "Single Family",
+                "zillow_url": "https://www.zillow.com/homes/123456",
+                "estimated_rent": 3000.0,
+                "zip_code": "90210"
             }
         ]
         
-        # Setup RentCast mock with same rent for both properties
-        mock_rentcast_instance = MagicMock()
-        mock_rentcast_instance.get_rent_estimate.side_effect = [7000, 8500]
+        orchestrator = RealEstateOrchestrator()
+        orchestrator.min_cash_flow = 0
+        orchestrator.min_coc_return = 0.0
+        results = orchestrator.evaluate_properties(candidates)
         
-        # Set up mock client instances
-        mock_zillow_client.return_value = mock_zillow_instance
-        mock_rentcast_client.return_value = mock_rentcast_instance
+        # Tightening the criteria filters the same candidates without refetching
+        orchestrator.min_cash_flow = 100000
+        assert orchestrator.evaluate_properties(candidates) == []
         
-        # Create orchestrator with strict filtering criteria
+        zillow_mock.get_listings_by_zip.assert_not_called()
+        rentcast_mock.get_rent_estimates_bulk.assert_not_called()
+        assert len(results) == 1
+        assert results[0].estimated_rent == 3000.0
+        assert isinstance(results[0], PropertyRecord)
+    
+    def test_calculate_monthly_expenses_vec(self, patched_clients):
+        """Test vectorized monthly expenses match the per-property calculation."""
         orchestrator = RealEstateOrchestrator()
-        orchestrator.down_payment_percent = 0.20
-        orchestrator.interest_rate_decimal = 0.05
-        orchestrator.loan_term_years = 30
-        orchestrator.min_cash_flow = 1000  # High minimum cash flow
-        orchestrator.min_coc_return = 10.0  # High minimum CoC return
-        
-        # Patch the calculate_monthly_expenses method to return fixed values
-        with patch.object(orchestrator, 'calculate_monthly_expenses') as mock_expenses:
-            mock_expenses.side_effect = [1000, 1500]  # Different expenses for each property
-            
-            # Process ZIP codes
-            results = orchestrator.process_zip_codes(["90210"])
+        prices = np.array([0.0, 250000.0, 1234567.89])
         
-        # Verify API calls were made for both properties
-        assert mock_zillow_instance.get_listings_by_zip.call_count == 1
-        assert mock_rentcast_instance.get_rent_estimate.call_count == 2
+        expenses = orchestrator.calculate_monthly_expenses_vec(prices)
+        
+        assert expenses.tolist() == [orchestrator.calculate_monthly_expenses(price) for price in prices.tolist()]
+    
+    def test_fetch_candidate_properties_keeps_zip_order(self, zillow_mock, rentcast_mock):
+        """Test ZIP codes fetched concurrently are returned in input order."""
+        zillow_mock.get_listings_by_zip.side_effect = lambda zip_code: [
+            make_listing(address=f"1 Main St, {zip_code}", price=200000, bedrooms=3, home_type="SingleFamily")
+        ]
+        rentcast_mock.get_rent_estimates_bulk.side_effect = lambda pairs: {pair: 2000.0 for pair in pairs}
+        
+        orchestrator = RealEstateOrchestrator()
+        orchestrator.max_workers = 4
+        zip_codes = ["90210", "10001", "60601", "73301", "94105"]
+        candidates = orchestrator.fetch_candidate_properties(zip_codes)
+        
+        assert [candidate["zip_code"] for candidate in candidates] == zip_codes
+        assert zillow_mock.get_listings_by_zip.call_count == len(zip_codes)
+        rentcast_mock.flush_cache.assert_called_once()
+    
+    def test_rent_estimates_fetched_in_one_batch(self, zillow_mock, rentcast_mock):
+        """Test rent estimates are fetched together, once per (ZIP code, bedrooms) pair."""
+        zillow_mock.get_listings_by_zip.return_value = [
+            make_listing(address=f"{number} Main St", price=200000, bedrooms=bedrooms, home_type="SingleFamily")
+            for number, bedrooms in [(1, 3), (2, 3), (3, 4), (4, 4), (5, 3)]
+        ]
+        rentcast_mock.get_rent_estimates_bulk.side_effect = lambda pairs: {
+            pair: None if pair[1] == 4 else 2000.0 for pair in pairs
+        }
+        
+        orchestrator = RealEstateOrchestrator()
+        candidates = orchestrator.fetch_candidate_properties(["90210"])
+        
+        # Listings without a rent estimate are skipped
+        rentcast_mock.get_rent_estimates_bulk.assert_called_once_with([("90210", 3), ("90210", 4)])
+        assert [candidate["address"] for candidate in candidates] == ["1 Main St", "2 Main St", "5 Main St"]
+    
+    @pytest.mark.parametrize("home_type,property_type", [
+        ("SINGLE_FAMILY", "Single Family"),
+        ("SingleFamily", "Single Family"),
+        ("singlefamily", "Single Family"),
+        ("MULTI_FAMILY", "Multifamily"),
+        ("multiFamily", "Multifamily"),
+        ("CONDO", None),
+        ("Unknown", None)
+    ])
+    def test_home_type_mapping(self, zillow_mock, rentcast_mock, home_type, property_type):
+        """Test Zillow home type spellings map to display names and other types are skipped."""
+        zillow_mock.get_listings_by_zip.return_value = [
+            make_listing(address="1 Main St", price=200000, bedrooms=3, home_type=home_type)
+        ]
+        rentcast_mock.get_rent_estimates_bulk.side_effect = lambda pairs: {pair: 2000.0 for pair in pairs}
+        
+        candidates = RealEstateOrchestrator().fetch_candidate_properties(["90210"])
         
-        # If the filtering criteria worked correctly, we should get 0 or 1 properties
-        # The exact result depends on the implementations of calculate_monthly_mortgage, etc.
-        # We're mainly testing that the filtering logic itself runs
-        assert len(results) <= 1
\ No newline at end of file
+        assert [candidate["property_type"] for candidate in candidates] == ([property_type] if property_type else [])
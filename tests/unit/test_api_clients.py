@@ -4,120 +4,177 @@ Unit tests for the API clients.
 Tests for ZillowApiClient and RentCastApiClient classes in the api_clients module.
 """
 
+import copy
+import dataclasses
 import os
 import json
+import pickle
+import time
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
-from src.real_estate_deal_finder.api_clients import ZillowApiClient, RentCastApiClient, APIError
+from src.real_estate_deal_finder import config
+from src.real_estate_deal_finder.models import Listing
+from src.real_estate_deal_finder.api_clients import (
+    ZillowApiClient, RentCastApiClient, APIError, HTTP_POOL_MAXSIZE, _trim_listing
+)
+
+
+# _make_request outcomes shared by both clients: status code, body, exception
+# raised by the session, and the parsed result or a fragment of the error message
+MAKE_REQUEST_CASES = [
+    pytest.param(200, b'{"success": true, "data": "test_data"}', None, {"success": True, "data": "test_data"}, id="success"),
+    pytest.param(404, b"Not Found", None, "status 404: Not Found", id="http_error"),
+    pytest.param(200, b"<html>Bad Gateway</html>", None, "response as JSON", id="invalid_json"),
+    pytest.param(None, None, requests.exceptions.ConnectionError("Connection error"), "Connection error", id="network_error")
+]
 
 
 class TestZillowApiClient:
     """Tests for the ZillowApiClient class."""
     
-    @patch('src.real_estate_deal_finder.api_clients.requests.request')
-    def test_make_request_success(self, mock_request):
+    def test_make_request_success(self, replay_cassette):
         """Test making a successful API request."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "data": "test_data"}
-        mock_request.return_value = mock_response
-        
-        # Create client and make request
+        # Replay the recorded response
         client = ZillowApiClient()
+        cassette = replay_cassette(client, "zillow_make_request_success")
         result = client._make_request("GET", "test_endpoint", {"param": "value"})
         
-        # Verify request was made correctly
-        mock_request.assert_called_once_with(
-            method="GET",
-            url="https://zillow-com1.p.rapidapi.com/test_endpoint",
-            headers={
-                "X-RapidAPI-Key": "test_zillow_key",
-                "X-RapidAPI-Host": "test.rapidapi.com"
-            },
-            params={"param": "value"},
-            timeout=15
-        )
+        # Authentication headers are set once on the session and sent with the request
+        assert cassette.requests[0].headers["X-RapidAPI-Key"] == "test_zillow_key"
+        assert cassette.requests[0].headers["X-RapidAPI-Host"] == "test.rapidapi.com"
         
         # Verify result
         assert result == {"success": True, "data": "test_data"}
     
-    @patch('src.real_estate_deal_finder.api_clients.requests.request')
-    def test_make_request_http_error(self, mock_request):
-        """Test handling HTTP error responses."""
-        # Setup mock response with error
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_request.return_value = mock_response
+    @pytest.mark.parametrize("status_code,content,request_error,expected", MAKE_REQUEST_CASES)
+    @patch('src.real_estate_deal_finder.api_clients.requests.Session.request')
+    def test_make_request(self, mock_request, status_code, content, request_error, expected):
+        """Test a request returns the parsed JSON or raises APIError with the cause."""
+        mock_request.return_value = MagicMock(status_code=status_code, content=content)
+        mock_request.side_effect = request_error
+        
+        client = ZillowApiClient()
+        if isinstance(expected, dict):
+            assert client._make_request("GET", "test_endpoint") == expected
+        else:
+            with pytest.raises(APIError, match=expected):
+                client._make_request("GET", "test_endpoint")
+    
+    @patch('src.real_estate_deal_finder.api_clients.requests.Session.request')
+    def test_make_request_long_error_body(self, mock_request):
+        """Test only the start of a long error body is included in the error."""
+        mock_request.return_value = MagicMock(status_code=500, content=b"<html>" + b"x" * 10000)
         
-        # Create client and test exception is raised
         client = ZillowApiClient()
         with pytest.raises(APIError) as exc_info:
             client._make_request("GET", "test_endpoint")
         
-        # Verify error message
-        assert "404" in str(exc_info.value)
-        assert "Not Found" in str(exc_info.value)
+        assert len(str(exc_info.value)) < 600
     
-    @patch('src.real_estate_deal_finder.api_clients.requests.request')
-    def test_make_request_network_error(self, mock_request):
-        """Test handling network errors."""
-        # Setup mock to raise exception
-        mock_request.side_effect = Exception("Connection error")
+    def test_session_pools_connections(self):
+        """Test the client reuses one pooled session and does not retry failed requests."""
+        client = ZillowApiClient()
+        adapter = client.session.get_adapter("https://test.rapidapi.com")
         
-        # Create client and test exception is raised
+        assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+        
+        client.close()
+    
+    def test_get_listings_by_zip(self, replay_cassette):
+        """Test fetching listings by ZIP code."""
+        # Replay the recorded search response
         client = ZillowApiClient()
-        with pytest.raises(APIError) as exc_info:
-            client._make_request("GET", "test_endpoint")
+        cassette = replay_cassette(client, "zillow_get_listings_by_zip")
+        listings = client.get_listings_by_zip("90210")
         
-        # Verify error message
-        assert "Connection error" in str(exc_info.value)
+        # Verify the one recorded request was made
+        assert len(cassette.requests) == 1
+        
+        # Verify processed listings
+        assert len(listings) == 2
+        assert listings[0].address == "123 Main St, Beverly Hills, CA 90210"
+        assert listings[1].price == 1500000
+        assert listings[1].home_type == "MULTI_FAMILY"
+    
+    def test_listing_slots_match_fields(self):
+        """Test the hand-written Listing slots list every field, in order."""
+        assert Listing.__slots__ == tuple(field.name for field in dataclasses.fields(Listing))
+    
+    def test_listing_copies(self):
+        """Test frozen slotted listings survive copy and pickle."""
+        listing = Listing("123 Main St", 1200000, 3, 2.0, 2000.0, "SINGLE_FAMILY", 1990, None, "123456", None)
+        
+        assert copy.deepcopy(listing) == listing
+        assert pickle.loads(pickle.dumps(listing)) == listing
     
     @patch('src.real_estate_deal_finder.api_clients.ZillowApiClient._make_request')
-    def test_get_listings_by_zip(self, mock_make_request, mock_zillow_response):
-        """Test fetching listings by ZIP code."""
-        # Setup mock to return sample response
+    def test_get_listings_by_zip_cached(self, mock_make_request, mock_zillow_response):
+        """Test repeat lookups of a ZIP code reuse listings until the TTL expires."""
         mock_make_request.return_value = mock_zillow_response
         
-        # Create client and get listings
         client = ZillowApiClient()
-        listings = client.get_listings_by_zip("90210")
+        first = client.get_listings_by_zip("90210")
+        second = client.get_listings_by_zip("90210")
         
-        # Verify request was made
+        assert second == first
         mock_make_request.assert_called_once()
         
-        # Verify processed listings
-        assert len(listings) == 2
-        assert listings[0]["address"] == "123 Main St, Beverly Hills, CA 90210"
-        assert listings[1]["price"] == 1500000
+        # Other ZIP codes are fetched separately
+        client.get_listings_by_zip("10001")
+        assert mock_make_request.call_count == 2
+        
+        # Expired entries are fetched again
+        with patch('src.real_estate_deal_finder.api_clients.time.time',
+                   return_value=time.time() + client.LISTINGS_CACHE_TTL_SECONDS):
+            client.get_listings_by_zip("90210")
+        assert mock_make_request.call_count == 3
+    
+    @patch('src.real_estate_deal_finder.api_clients.requests.Session.request')
+    def test_get_listings_by_zip_trims_listings(self, mock_request, mock_zillow_response):
+        """Test listings are trimmed to the used fields while the response is decoded."""
+        listing = dict(mock_zillow_response["results"][0], photos=[{"url": "https://photos/1"}])
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"results": [listing], "totalResultCount": 1}).encode()
+        mock_request.return_value = mock_response
+        
+        client = ZillowApiClient()
+        response_data = client._make_request("GET", "propertyExtendedSearch", object_hook=_trim_listing)
+        
+        assert response_data["totalResultCount"] == 1
+        assert "photos" not in response_data["results"][0]
+        assert response_data["results"][0]["zpid"] == "123456"
+        
+        listings = client.get_listings_by_zip("90210")
+        assert listings[0].sqft == 2000
+        assert listings[0].zillow_url == "https://www.zillow.com/homes/123456"
 
 
 class TestRentCastApiClient:
     """Tests for the RentCastApiClient class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        # Ensure test cache directory exists
-        os.makedirs(os.path.dirname("tests/test_data/test_cache.json"), exist_ok=True)
-        
-        # Remove test cache file if it exists
-        if os.path.exists("tests/test_data/test_cache.json"):
-            os.remove("tests/test_data/test_cache.json")
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path, monkeypatch):
+        """Point the client's cache file at a fresh temporary directory."""
+        path = tmp_path / "test_data" / "test_cache.json"
+        path.parent.mkdir()
+        monkeypatch.setattr(config, 'RENTCAST_CACHE_FILE_PATH', str(path))
+        return path
     
-    def teardown_method(self):
-        """Clean up after test."""
-        # Remove test cache file
-        if os.path.exists("tests/test_data/test_cache.json"):
-            os.remove("tests/test_data/test_cache.json")
+    @pytest.fixture
+    def journal_path(self, cache_path):
+        """Path of the cache journal next to the cache file."""
+        return cache_path.with_name(cache_path.name + ".log")
     
-    @patch('src.real_estate_deal_finder.api_clients.requests.request')
+    @patch('src.real_estate_deal_finder.api_clients.requests.Session.request')
     def test_make_request_success(self, mock_request):
         """Test making a successful API request."""
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "data": "test_data"}
+        mock_response.content = b'{"success": true, "data": "test_data"}'
         mock_request.return_value = mock_response
         
         # Create client and make request
@@ -128,19 +185,32 @@ class TestRentCastApiClient:
         mock_request.assert_called_once_with(
             method="GET",
             url="https://api.rentcast.io/v1/test_endpoint",
-            headers={
-                "X-Api-Key": "test_rentcast_key",
-                "Content-Type": "application/json"
-            },
             params={"param": "value"},
             timeout=15
         )
         
+        # Authentication headers are set once on the session
+        assert client.session.headers["X-Api-Key"] == "test_rentcast_key"
+        
         # Verify result
         assert result == {"success": True, "data": "test_data"}
     
+    @pytest.mark.parametrize("status_code,content,request_error,expected", MAKE_REQUEST_CASES)
+    @patch('src.real_estate_deal_finder.api_clients.requests.Session.request')
+    def test_make_request(self, mock_request, status_code, content, request_error, expected):
+        """Test a request returns the parsed JSON or raises APIError with the cause."""
+        mock_request.return_value = MagicMock(status_code=status_code, content=content)
+        mock_request.side_effect = request_error
+        
+        client = RentCastApiClient()
+        if isinstance(expected, dict):
+            assert client._make_request("GET", "test_endpoint") == expected
+        else:
+            with pytest.raises(APIError, match=expected):
+                client._make_request("GET", "test_endpoint")
+    
     @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._make_request')
-    def test_get_rent_estimate_api_call(self, mock_make_request, mock_rentcast_response):
+    def test_get_rent_estimate_api_call(self, mock_make_request, mock_rentcast_response, cache_path):
         """Test fetching rent estimate when not in cache."""
         # Setup mock to return sample response
         mock_make_request.return_value = mock_rentcast_response
@@ -153,38 +223,38 @@ class TestRentCastApiClient:
         mock_make_request.assert_called_once_with(
             "GET", 
             "avm/rent/zipcode", 
-            {'zipCode': '90210', 'propertyType': 'SFH', 'bedrooms': 3}
+            params={'zipCode': '90210', 'propertyType': 'SFH', 'bedrooms': 3}
         )
         
         # Verify result
         assert rent == 4000.0
         
+        # New entries are batched in memory until the cache is flushed
+        assert not cache_path.exists()
+        client.flush_cache()
+        
         # Verify cache was updated
-        assert os.path.exists("tests/test_data/test_cache.json")
-        with open("tests/test_data/test_cache.json", "r") as f:
+        assert cache_path.exists()
+        with open(cache_path, "r") as f:
             cache_data = json.load(f)
             assert "90210_3" in cache_data
             assert cache_data["90210_3"]["data"] == 4000.0
     
-    def test_get_rent_estimate_from_cache(self):
+    @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._make_request')
+    def test_get_rent_estimate_from_cache(self, mock_make_request):
         """Test fetching rent estimate from cache."""
-        # Create a cache file with test data
-        cache_data = {
+        # Load the cache entry directly, without a cache file
+        client = RentCastApiClient()
+        client.cache_data = {
             "90210_3": {
                 "timestamp": 9999999999,  # Far future timestamp to ensure cache validity
                 "data": 3500.0
             }
         }
         
-        with open("tests/test_data/test_cache.json", "w") as f:
-            json.dump(cache_data, f)
-        
-        # Create client and get rent estimate (should use cache)
-        client = RentCastApiClient()
-        rent = client.get_rent_estimate("90210", 3)
-        
         # Verify result from cache
-        assert rent == 3500.0
+        assert client.get_rent_estimate("90210", 3) == 3500.0
+        mock_make_request.assert_not_called()
     
     @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._make_request')
     def test_get_rent_estimate_api_error(self, mock_make_request):
@@ -197,4 +267,91 @@ class TestRentCastApiClient:
         rent = client.get_rent_estimate("90210", 3)
         
         # Verify result
-        assert rent is None
\ No newline at end of file
+        assert rent is None
+    
+    @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._save_cache')
+    @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._fetch_rent_estimate')
+    def test_get_rent_estimates_bulk(self, mock_fetch, mock_save_cache, journal_path):
+        """Test bulk rent estimates use the cache, fetch misses once and save once."""
+        mock_fetch.side_effect = lambda zip_code, bedrooms: None if bedrooms == 5 else 1000.0 * bedrooms
+        
+        client = RentCastApiClient()
+        client.cache_data = {"90210_3": {"timestamp": 9999999999, "data": 3500.0}}
+        estimates = client.get_rent_estimates_bulk(
+            [("90210", 3), ("90210", 4), ("10001", 2), ("90210", 4), ("10001", 5)]
+        )
+        
+        assert estimates == {
+            ("90210", 3): 3500.0,
+            ("90210", 4): 4000.0,
+            ("10001", 2): 2000.0,
+            ("10001", 5): None
+        }
+        assert mock_fetch.call_count == 3
+        
+        # New entries are journaled together; the cache file is not rewritten yet
+        mock_save_cache.assert_not_called()
+        with open(journal_path, "r") as f:
+            assert len(f.readlines()) == 2
+        
+        # Fetched estimates are cached; failed lookups are not
+        assert client.cache_data["90210_4"]["data"] == 4000.0
+        assert "10001_5" not in client.cache_data
+    
+    @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._fetch_rent_estimate')
+    def test_cache_saved_after_flush_threshold(self, mock_fetch, cache_path, journal_path):
+        """Test the cache file is rewritten once per batch of new entries."""
+        mock_fetch.return_value = 2000.0
+        
+        client = RentCastApiClient()
+        with patch.object(client, '_save_cache', wraps=client._save_cache) as mock_save_cache:
+            for bedrooms in range(1, client.CACHE_FLUSH_THRESHOLD + 1):
+                client.get_rent_estimate("90210", bedrooms)
+            
+            mock_save_cache.assert_called_once()
+            
+            # Nothing left to write until another entry is added
+            client.close()
+            mock_save_cache.assert_called_once()
+        
+        with open(cache_path, "r") as f:
+            assert len(json.load(f)) == client.CACHE_FLUSH_THRESHOLD
+        
+        # Saving the cache file clears the journal
+        assert not journal_path.exists()
+    
+    @patch('src.real_estate_deal_finder.api_clients.RentCastApiClient._fetch_rent_estimate')
+    def test_cache_journal_replayed(self, mock_fetch, cache_path, journal_path):
+        """Test entries not yet saved to the cache file are recovered from the journal."""
+        mock_fetch.return_value = 2000.0
+        
+        client = RentCastApiClient()
+        client.get_rent_estimate("90210", 3)
+        assert not cache_path.exists()
+        
+        # A partially written last line is ignored
+        with open(journal_path, "a") as f:
+            f.write('{"key": "90210_4", "timest')
+        
+        mock_fetch.reset_mock()
+        new_client = RentCastApiClient()
+        assert new_client.get_rent_estimate("90210", 3) == 2000.0
+        mock_fetch.assert_not_called()
+        assert "90210_4" not in new_client.cache_data
+        
+        # Replayed entries are written to the cache file on flush
+        new_client.flush_cache()
+        with open(cache_path, "r") as f:
+            assert json.load(f)["90210_3"]["data"] == 2000.0
+    
+    def test_save_cache_recreates_missing_directory(self, cache_path):
+        """Test saving the cache recreates the cache directory if it was removed."""
+        client = RentCastApiClient()
+        cache_path.parent.rmdir()
+        
+        client.cache_data = {"90210_3": {"timestamp": 9999999999, "data": 3500.0}}
+        client._save_cache()
+        
+        assert cache_path.parent.is_dir()
+        with open(cache_path, "r") as f:
+            assert json.load(f)["90210_3"]["data"] == 3500.0
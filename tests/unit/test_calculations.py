@@ -2,205 +2,126 @@
 Unit tests for the financial calculation functions.
 
 Tests for calculate_monthly_mortgage, calculate_cash_flow, and calculate_coc_return
-functions in the calculations module.
+functions and their vectorized counterparts in the calculations module.
 """
 
+import numpy as np
 import pytest
 from src.real_estate_deal_finder.calculations import (
     calculate_monthly_mortgage,
     calculate_cash_flow,
-    calculate_coc_return
+    calculate_coc_return,
+    calculate_monthly_mortgage_vec,
+    calculate_cash_flow_vec,
+    calculate_coc_return_vec,
+    _amortization_factor
 )
 
 
 class TestCalculateMonthlyMortgage:
     """Tests for the calculate_monthly_mortgage function."""
     
-    def test_basic_calculation(self):
-        """Test a standard mortgage calculation with typical values."""
-        # $300,000 loan with 20% down, 4.5% interest, 30-year term
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=0.045,
-            loan_term_years=30
-        )
-        
-        # Expected result is around $1216.04
-        assert round(result, 2) == 1216.04
-    
-    def test_zero_loan_amount(self):
-        """Test when the loan amount is zero (100% down payment)."""
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=1.0,  # 100% down payment
-            interest_rate_decimal=0.045,
-            loan_term_years=30
-        )
-        
-        assert result == 0.0
-    
-    def test_zero_interest_rate(self):
-        """Test when the interest rate is zero (interest-free loan)."""
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=0.0,
-            loan_term_years=30
-        )
-        
-        # Simple division: loan amount / number of months
-        expected = (300000 * 0.8) / (30 * 12)
-        assert result == expected
+    def test_monthly_mortgage(self, mortgage_case):
+        """Test the mortgage calculation and its edge cases."""
+        total_price, down_payment_percent, interest_rate_decimal, loan_term_years, expected = mortgage_case
+        result = calculate_monthly_mortgage(total_price, down_payment_percent, interest_rate_decimal, loan_term_years)
+        
+        if expected is None:
+            assert result is None
+        else:
+            assert round(result, 2) == round(expected, 2)
     
-    def test_invalid_loan_term(self):
-        """Test when the loan term is invalid (zero or negative)."""
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=0.045,
-            loan_term_years=0
-        )
-        
-        assert result is None
-        
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=0.045,
-            loan_term_years=-10
-        )
+    def test_very_high_interest_rate(self):
+        """Test a 100% interest rate still gives a valid payment."""
+        result = calculate_monthly_mortgage(300000, 0.20, 1.0, 30)
         
-        assert result is None
+        assert result > 0
     
-    def test_edge_cases(self):
-        """Test additional edge cases."""
-        # Negative price
-        result = calculate_monthly_mortgage(
-            total_price=-300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=0.045,
-            loan_term_years=30
-        )
-        
-        # Should return 0.0 as loan amount is negative
-        assert result == 0.0
+    def test_amortization_factor_reused(self):
+        """Test the rate/term factor is computed once and reused across prices."""
+        _amortization_factor.cache_clear()
         
-        # Very high interest rate
-        result = calculate_monthly_mortgage(
-            total_price=300000,
-            down_payment_percent=0.20,
-            interest_rate_decimal=1.0,  # 100% interest
-            loan_term_years=30
-        )
+        first = calculate_monthly_mortgage(300000, 0.20, 0.045, 30)
+        second = calculate_monthly_mortgage(600000, 0.20, 0.045, 30)
         
-        # Should still return a valid result
-        assert result > 0
+        assert second == pytest.approx(2 * first)
+        assert _amortization_factor.cache_info().hits == 1
+        assert _amortization_factor.cache_info().misses == 1
 
 
 class TestCalculateCashFlow:
     """Tests for the calculate_cash_flow function."""
     
-    def test_positive_cash_flow(self):
-        """Test when rent exceeds mortgage and expenses (positive cash flow)."""
-        result = calculate_cash_flow(
-            monthly_rent=2000,
-            monthly_mortgage=1500,
-            monthly_expenses=300
-        )
-        
-        assert result == 200
-    
-    def test_negative_cash_flow(self):
-        """Test when mortgage and expenses exceed rent (negative cash flow)."""
-        result = calculate_cash_flow(
-            monthly_rent=2000,
-            monthly_mortgage=1800,
-            monthly_expenses=500
-        )
-        
-        assert result == -300
-    
-    def test_breakeven_cash_flow(self):
-        """Test when rent exactly equals mortgage plus expenses (breakeven)."""
-        result = calculate_cash_flow(
-            monthly_rent=2000,
-            monthly_mortgage=1500,
-            monthly_expenses=500
-        )
+    @pytest.mark.parametrize("monthly_rent,monthly_mortgage,monthly_expenses,expected", [
+        (2000, 1500, 300, 200),
+        (2000, 1800, 500, -300),
+        (2000, 1500, 500, 0),
+        (None, 1500, 300, None),
+        (2000, None, 300, None)
+    ], ids=["positive", "negative", "breakeven", "no_rent", "no_mortgage"])
+    def test_cash_flow(self, monthly_rent, monthly_mortgage, monthly_expenses, expected):
+        """Test positive, negative and breakeven cash flow, and missing inputs."""
+        result = calculate_cash_flow(monthly_rent, monthly_mortgage, monthly_expenses)
         
-        assert result == 0
-    
-    def test_none_inputs(self):
-        """Test when rent or mortgage is None."""
-        result = calculate_cash_flow(
-            monthly_rent=None,
-            monthly_mortgage=1500,
-            monthly_expenses=300
-        )
-        
-        assert result is None
-        
-        result = calculate_cash_flow(
-            monthly_rent=2000,
-            monthly_mortgage=None,
-            monthly_expenses=300
-        )
-        
-        assert result is None
+        assert result == expected
 
 
 class TestCalculateCoCReturn:
     """Tests for the calculate_coc_return function."""
     
-    def test_positive_coc_return(self):
-        """Test when annual cash flow is positive (positive CoC return)."""
-        result = calculate_coc_return(
-            total_price=300000,
-            down_payment_percent=0.20,
-            annual_cash_flow=6000
-        )
-        
-        # $6000 / $60000 = 0.10 or 10%
-        assert result == 10.0
-    
-    def test_negative_coc_return(self):
-        """Test when annual cash flow is negative (negative CoC return)."""
-        result = calculate_coc_return(
-            total_price=300000,
-            down_payment_percent=0.20,
-            annual_cash_flow=-3000
-        )
+    @pytest.mark.parametrize("total_price,down_payment_percent,annual_cash_flow,expected", [
+        # $6000 / $60000 = 10%
+        (300000, 0.20, 6000, 10.0),
+        # -$3000 / $60000 = -5%
+        (300000, 0.20, -3000, -5.0),
+        (300000, 0.20, 0, 0.0),
+        # No cash invested
+        (300000, 0.0, 6000, None),
+        (300000, 0.20, None, None)
+    ], ids=["positive", "negative", "zero", "zero_down_payment", "no_cash_flow"])
+    def test_coc_return(self, total_price, down_payment_percent, annual_cash_flow, expected):
+        """Test positive, negative and zero returns, and invalid inputs."""
+        result = calculate_coc_return(total_price, down_payment_percent, annual_cash_flow)
         
-        # -$3000 / $60000 = -0.05 or -5%
-        assert result == -5.0
+        assert result == expected
+
+
+class TestVectorizedCalculations:
+    """Tests for the vectorized calculation functions against their scalar versions."""
     
-    def test_zero_coc_return(self):
-        """Test when annual cash flow is zero (zero CoC return)."""
-        result = calculate_coc_return(
-            total_price=300000,
-            down_payment_percent=0.20,
-            annual_cash_flow=0
-        )
-        
-        assert result == 0.0
+    def test_matches_scalar_calculations(self):
+        """Test each vectorized function agrees with its scalar counterpart."""
+        prices = np.array([300000.0, 1200000.0, 0.0, np.nan])
+        rents = np.array([2500.0, 7000.0, 1500.0, 1500.0])
+        
+        mortgages = calculate_monthly_mortgage_vec(prices, 0.20, 0.045, 30)
+        cash_flows = calculate_cash_flow_vec(rents, mortgages, 500.0)
+        coc_returns = calculate_coc_return_vec(prices, 0.20, cash_flows * 12)
+        
+        for i in range(3):
+            expected_mortgage = calculate_monthly_mortgage(prices[i], 0.20, 0.045, 30)
+            expected_cash_flow = calculate_cash_flow(rents[i], expected_mortgage, 500.0)
+            expected_coc = calculate_coc_return(prices[i], 0.20, expected_cash_flow * 12)
+            
+            assert mortgages[i] == pytest.approx(expected_mortgage)
+            assert cash_flows[i] == pytest.approx(expected_cash_flow)
+            if expected_coc is None:
+                assert np.isnan(coc_returns[i])
+            else:
+                assert coc_returns[i] == pytest.approx(expected_coc)
+        
+        # Unknown prices propagate as NaN
+        assert np.isnan(mortgages[3])
+        assert np.isnan(coc_returns[3])
     
-    def test_invalid_inputs(self):
-        """Test invalid inputs."""
-        # Zero down payment
-        result = calculate_coc_return(
-            total_price=300000,
-            down_payment_percent=0.0,
-            annual_cash_flow=6000
-        )
-        
-        assert result is None
-        
-        # None annual cash flow
-        result = calculate_coc_return(
-            total_price=300000,
-            down_payment_percent=0.20,
-            annual_cash_flow=None
-        )
-        
-        assert result is None
\ No newline at end of file
+    def test_monthly_mortgage_vec(self, mortgage_case):
+        """Test the vectorized mortgage calculation on the shared cases, with NaN for None."""
+        total_price, down_payment_percent, interest_rate_decimal, loan_term_years, expected = mortgage_case
+        result = calculate_monthly_mortgage_vec(
+            np.array([total_price], dtype=np.float64), down_payment_percent, interest_rate_decimal, loan_term_years
+        )[0]
+        
+        if expected is None:
+            assert np.isnan(result)
+        else:
+            assert round(result, 2) == round(expected, 2)
@@ -0,0 +1,41 @@
+"""
+Unit tests for the configuration module.
+
+Tests for the Config settings schema in the config module.
+"""
+
+import dataclasses
+
+from src.real_estate_deal_finder import config
+from src.real_estate_deal_finder.config import Config, _SCHEMA
+
+
+class TestConfig:
+    """Tests for the Config class."""
+    
+    def test_from_env_defaults_and_types(self):
+        """Test settings fall back to their defaults and are converted to their types."""
+        result = Config.from_env({"DEFAULT_INTEREST_RATE": "6.25", "DEFAULT_LOAN_TERM_YEARS": "15"})
+        
+        assert result.DEFAULT_INTEREST_RATE == 6.25
+        assert result.DEFAULT_LOAN_TERM_YEARS == 15
+        assert result.MIN_CASH_FLOW == 100.0
+        assert result.ZILLOW_RAPIDAPI_HOST == "zillow-com1.p.rapidapi.com"
+    
+    def test_validate(self):
+        """Test missing API keys are reported."""
+        issues = Config.from_env({"ZILLOW_API_KEY": "key"}).validate()
+        
+        assert "ZILLOW_API_KEY" not in issues
+        assert issues["RENTCAST_API_KEY"] == "Missing RentCast API Key"
+    
+    def test_schema_matches_fields(self):
+        """Test the schema lists every Config field, in order, with the field's type."""
+        assert [(name, convert) for name, convert, _ in _SCHEMA] == [
+            (field.name, field.type) for field in dataclasses.fields(Config)
+        ]
+    
+    def test_module_constants_match_config(self):
+        """Test every setting is exposed as a module constant with the CONFIG value."""
+        for field in dataclasses.fields(Config):
+            assert getattr(config, field.name) == getattr(config.CONFIG, field.name)
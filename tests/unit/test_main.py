@@ -4,35 +4,37 @@ Unit tests for the main module.
 Tests for argument parsing and ZIP code loading functions in the main module.
 """
 
-import os
-import tempfile
+import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from typing import NamedTuple, Optional
 from src.real_estate_deal_finder.main import parse_arguments, load_zip_codes
 
 
+class Args(NamedTuple):
+    """The parsed arguments read by load_zip_codes."""
+    zipcodes: Optional[str]
+    zipfile: Optional[str]
+
+
 class TestParseArguments:
     """Tests for the parse_arguments function."""
     
-    def test_parse_zipcodes_argument(self):
-        """Test parsing --zipcodes argument."""
-        with patch('sys.argv', ['main.py', '--zipcodes', '90210,10001']):
-            args = parse_arguments()
-            assert args.zipcodes == '90210,10001'
-            assert args.zipfile is None
-    
-    def test_parse_zipfile_argument(self):
-        """Test parsing --zipfile argument."""
-        with patch('sys.argv', ['main.py', '--zipfile', 'path/to/file.txt']):
-            args = parse_arguments()
-            assert args.zipfile == 'path/to/file.txt'
-            assert args.zipcodes is None
-    
-    def test_missing_required_argument(self):
-        """Test that error is raised when neither argument is provided."""
-        with patch('sys.argv', ['main.py']):
+    @pytest.mark.parametrize("argv,expected", [
+        (['main.py', '--zipcodes', '90210,10001'], ('90210,10001', None)),
+        (['main.py', '--zipfile', 'path/to/file.txt'], (None, 'path/to/file.txt')),
+        # Neither argument given: argparse exits
+        (['main.py'], None)
+    ], ids=["zipcodes", "zipfile", "missing"])
+    def test_parse_arguments(self, monkeypatch, argv, expected):
+        """Test parsing --zipcodes or --zipfile, and that one of them is required."""
+        monkeypatch.setattr(sys, 'argv', argv)
+        
+        if expected is None:
             with pytest.raises(SystemExit):
                 parse_arguments()
+        else:
+            args = parse_arguments()
+            assert (args.zipcodes, args.zipfile) == expected
 
 
 class TestLoadZipCodes:
@@ -40,53 +42,43 @@ class TestLoadZipCodes:
     
     def test_load_from_zipcodes_string(self):
         """Test loading ZIP codes from --zipcodes argument."""
-        mock_args = MagicMock()
-        mock_args.zipcodes = '90210,10001, 20500'
-        mock_args.zipfile = None
+        args = Args(zipcodes='90210,10001, 20500', zipfile=None)
         
-        zip_codes = load_zip_codes(mock_args)
+        zip_codes = load_zip_codes(args)
         
         assert zip_codes == ['90210', '10001', '20500']
     
-    def test_load_from_zipfile(self):
+    def test_load_from_zipfile(self, tmp_path):
         """Test loading ZIP codes from --zipfile argument."""
-        # Create a temporary file with ZIP codes
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_file.write('90210\n10001\n# Comment line\n20500\n')
-            temp_path = temp_file.name
+        # Create a file with ZIP codes
+        zip_file = tmp_path / "zips.txt"
+        zip_file.write_text('90210\n10001\n# Comment line\n20500\n')
+        
+        args = Args(zipcodes=None, zipfile=str(zip_file))
         
-        try:
-            mock_args = MagicMock()
-            mock_args.zipcodes = None
-            mock_args.zipfile = temp_path
-            
-            zip_codes = load_zip_codes(mock_args)
-            
-            assert zip_codes == ['90210', '10001', '20500']
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_path)
+        zip_codes = load_zip_codes(args)
+        
+        assert zip_codes == ['90210', '10001', '20500']
     
     def test_load_from_zipfile_not_found(self):
         """Test error handling when ZIP code file is not found."""
-        mock_args = MagicMock()
-        mock_args.zipcodes = None
-        mock_args.zipfile = 'nonexistent_file.txt'
+        args = Args(zipcodes=None, zipfile='nonexistent_file.txt')
         
-        zip_codes = load_zip_codes(mock_args)
+        zip_codes = load_zip_codes(args)
         
         assert zip_codes == []
     
-    def test_validate_zip_codes(self):
-        """Test validation of ZIP codes."""
-        mock_args = MagicMock()
-        mock_args.zipcodes = '90210,invalid,12,123456,10001'
-        mock_args.zipfile = None
-        
-        zip_codes = load_zip_codes(mock_args)
+    @pytest.mark.parametrize("raw,expected", [
+        ("90210", ["90210"]),
+        ("invalid", []),
+        ("12", []),
+        ("123456", []),
+        ("1234²", []),
+        ("10001", ["10001"]),
+        ("90210,invalid,12,123456,1234²,10001", ["90210", "10001"])
+    ])
+    def test_validate_zip_codes(self, raw, expected):
+        """Test only valid 5-digit ZIP codes are kept, in input order."""
+        args = Args(zipcodes=raw, zipfile=None)
         
-        # Only valid 5-digit ZIP codes should be included
-        assert zip_codes == ['90210', '10001']
-        assert 'invalid' not in zip_codes
-        assert '12' not in zip_codes
-        assert '123456' not in zip_codes
\ No newline at end of file
+        assert load_zip_codes(args) == expected
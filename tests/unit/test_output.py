@@ -6,46 +6,56 @@ Tests for the save_results_to_csv function in the output module.
 
 import os
 import csv
+import dataclasses
+import datetime
+import types
 import pytest
-from unittest.mock import patch
-from src.real_estate_deal_finder.output import save_results_to_csv
+from src.real_estate_deal_finder import config, output
+from src.real_estate_deal_finder.models import PropertyRecord
+from src.real_estate_deal_finder.output import save_results_to_csv, _format_rows
+
+
+class FrozenDateTime(datetime.datetime):
+    """datetime whose now() is always 2025-01-01 12:00:00."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 1, 12, 0, 0, tzinfo=tz)
+
+
+def raise_permission_error(*args, **kwargs):
+    """Stand-in for file system calls that are denied."""
+    raise PermissionError("Permission denied")
 
 
 class TestSaveResultsToCsv:
     """Tests for the save_results_to_csv function."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        # Set test output directory
-        os.environ['OUTPUT_DIRECTORY'] = 'tests/test_data/output'
-        os.environ['OUTPUT_FILENAME_PREFIX'] = 'test_results'
-        
-        # Ensure test output directory exists
-        os.makedirs('tests/test_data/output', exist_ok=True)
+    @pytest.fixture(autouse=True)
+    def output_dir(self, tmp_path, monkeypatch):
+        """Write output files to a fresh temporary directory."""
+        # Config values are read at import, so the module attributes are patched
+        monkeypatch.setattr(config, 'OUTPUT_DIRECTORY', str(tmp_path))
+        monkeypatch.setattr(config, 'OUTPUT_FILENAME_PREFIX', 'test_results')
+        return tmp_path
     
-    def teardown_method(self):
-        """Clean up after test."""
-        # Remove test output directory
-        import shutil
-        if os.path.exists('tests/test_data/output'):
-            shutil.rmtree('tests/test_data/output')
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, monkeypatch):
+        """Fix the current time used for output filenames."""
+        monkeypatch.setattr('src.real_estate_deal_finder.output.datetime', types.SimpleNamespace(datetime=FrozenDateTime))
     
     def test_save_results_empty_list(self):
         """Test saving empty results."""
         result = save_results_to_csv([])
         assert result is None
     
-    @patch('src.real_estate_deal_finder.output.datetime')
-    def test_save_results_success(self, mock_datetime, sample_filtered_results):
+    def test_save_results_success(self, sample_filtered_results, output_dir):
         """Test successfully saving results to CSV."""
-        # Mock datetime to get a fixed filename
-        mock_datetime.datetime.now.return_value.strftime.return_value = "20250101_120000"
-        
         # Save results
         output_path = save_results_to_csv(sample_filtered_results)
         
         # Verify output path
-        expected_path = 'tests/test_data/output/test_results_20250101_120000.csv'
+        expected_path = os.path.join(str(output_dir), 'test_results_20250101_120000.csv')
         assert output_path == expected_path
         
         # Verify file exists
@@ -68,28 +78,33 @@ class TestSaveResultsToCsv:
             
             # Verify data in first row
             assert rows[0]['Address'] == "123 Main St, Beverly Hills, CA 90210"
-            assert rows[0]['Price'] == "$1,200,000.00"
+            assert rows[0]['Price'] == "$1200000.00"
             assert rows[0]['Beds'] == "3"
             assert rows[0]['Estimated CoC Return'] == "10.00%"
     
-    def test_save_results_directory_error(self, sample_filtered_results):
+    def test_format_rows_records_match_dicts(self, sample_filtered_results):
+        """Test that property records and dictionaries give the same CSV rows."""
+        records = [PropertyRecord(**prop) for prop in sample_filtered_results]
+        
+        assert list(_format_rows(records)) == list(_format_rows(sample_filtered_results))
+    
+    def test_property_record_slots_match_fields(self):
+        """Test the hand-written PropertyRecord slots list every field, in order."""
+        assert PropertyRecord.__slots__ == tuple(field.name for field in dataclasses.fields(PropertyRecord))
+    
+    def test_save_results_directory_error(self, sample_filtered_results, monkeypatch):
         """Test handling directory creation errors."""
-        # Set output directory to an invalid path
-        os.environ['OUTPUT_DIRECTORY'] = '/invalid/directory/path'
+        # Set output directory to an invalid path that cannot be created
+        monkeypatch.setattr(config, 'OUTPUT_DIRECTORY', '/invalid/directory/path')
+        monkeypatch.setattr(output.os, 'makedirs', raise_permission_error)
         
         # Try to save results (should fail)
-        with patch('src.real_estate_deal_finder.output.os.makedirs') as mock_makedirs:
-            mock_makedirs.side_effect = OSError("Permission denied")
-            result = save_results_to_csv(sample_filtered_results)
-            
-            # Verify result is None
-            assert result is None
+        assert save_results_to_csv(sample_filtered_results) is None
     
-    def test_save_results_file_error(self, sample_filtered_results):
+    def test_save_results_file_error(self, sample_filtered_results, monkeypatch):
         """Test handling file writing errors."""
-        with patch('builtins.open') as mock_open:
-            mock_open.side_effect = IOError("Permission denied")
-            result = save_results_to_csv(sample_filtered_results)
-            
-            # Verify result is None
-            assert result is None
\ No newline at end of file
+        # Shadow the builtin open for the output module only
+        monkeypatch.setattr(output, 'open', raise_permission_error, raising=False)
+        
+        # Try to save results (should fail)
+        assert save_results_to_csv(sample_filtered_results) is None